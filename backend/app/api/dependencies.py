@@ -6,16 +6,16 @@ from app.core.formatting import LogFormatter
 
 logger = logging.getLogger(__name__)
 
-model_service = ModelService()
-vote_service = VoteService()
-
 async def get_model_service() -> ModelService:
     """Dependency to get ModelService instance"""
     try:
         logger.info(LogFormatter.info("Initializing model service dependency"))
+        model_service = ModelService()
         await model_service.initialize()
         logger.info(LogFormatter.success("Model service initialized"))
         return model_service
+    except HTTPException:
+        raise
     except Exception as e:
         error_msg = "Failed to initialize model service"
         logger.error(LogFormatter.error(error_msg, e))
@@ -25,6 +25,7 @@ async def get_vote_service() -> VoteService:
     """Dependency to get VoteService instance"""
     try:
         logger.info(LogFormatter.info("Initializing vote service dependency"))
+        vote_service = VoteService()
         await vote_service.initialize()
         logger.info(LogFormatter.success("Vote service initialized"))
         return vote_service
@@ -1,49 +1,127 @@
-from fastapi import APIRouter
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import List, Dict, Any, Optional
 from app.services.leaderboard import LeaderboardService
-from app.core.fastapi_cache import cached, build_cache_key
+from app.core.payloads import payload_response, ndjson_response, wants_ndjson
 import logging
 from app.core.formatting import LogFormatter
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-leaderboard_service = LeaderboardService()
-
-def leaderboard_key_builder(func, namespace: str = "leaderboard", **kwargs):
-    """Build cache key for leaderboard data"""
-    key_type = "raw" if func.__name__ == "get_leaderboard" else "formatted"
-    key = build_cache_key(namespace, key_type)
-    logger.debug(LogFormatter.info(f"Built leaderboard cache key: {key}"))
-    return key
 
 @router.get("")
-@cached(expire=300, key_builder=leaderboard_key_builder)
-async def get_leaderboard() -> List[Dict[str, Any]]:
+async def get_leaderboard(
+    request: Request,
+    stream: bool = Query(False, description="Stream rows as NDJSON, also enabled by Accept: application/x-ndjson")
+) -> Response:
     """
     Get raw leaderboard data
-    Response will be automatically GZIP compressed if size > 500 bytes
+    Served from the snapshot's pre-encoded payload, brotli or gzip compressed
+    when accepted, with an ETag for conditional requests
     """
     try:
         logger.info(LogFormatter.info("Fetching raw leaderboard data"))
-        data = await leaderboard_service.fetch_raw_data()
-        logger.info(LogFormatter.success(f"Retrieved {len(data)} leaderboard entries"))
-        return data
+        snapshot = await LeaderboardService().get_snapshot()
+        headers = {"X-Leaderboard-Version": str(snapshot.version)}
+        if wants_ndjson(request, stream):
+            return ndjson_response(snapshot.eval_results(), headers)
+        return payload_response(request, snapshot.raw_payload, headers)
     except Exception as e:
         logger.error(LogFormatter.error("Failed to fetch raw leaderboard data", e))
         raise
 
 @router.get("/formatted")
-@cached(expire=300, key_builder=leaderboard_key_builder)
-async def get_formatted_leaderboard() -> List[Dict[str, Any]]:
+async def get_formatted_leaderboard(
+    request: Request,
+    response: Response,
+    sort: str = Query("average_score", description="Sort key: average_score, name, params, likes, submission_date or an evaluation key"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="Sort direction"),
+    model_type: Optional[List[str]] = Query(None, description="Model types to keep"),
+    precision: Optional[List[str]] = Query(None, description="Precisions to keep"),
+    architecture: Optional[List[str]] = Query(None, description="Architectures to keep"),
+    min_params: Optional[float] = Query(None, ge=0, description="Minimum parameter count, in billions"),
+    max_params: Optional[float] = Query(None, ge=0, description="Maximum parameter count, in billions"),
+    search: Optional[str] = Query(None, description="Model name prefix, with or without the organization"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    stream: bool = Query(False, description="Stream rows as NDJSON, also enabled by Accept: application/x-ndjson")
+) -> List[Dict[str, Any]]:
     """
     Get formatted leaderboard data with restructured objects
-    Response will be automatically GZIP compressed if size > 500 bytes
+    Without query parameters, returns the full leaderboard from the snapshot's
+    pre-encoded payload, with an ETag for conditional requests. Otherwise returns
+    the requested page, with the number of matching models in the X-Total-Count header.
+    The snapshot version is returned in the X-Leaderboard-Version header.
+    In streaming mode, rows are projected from the snapshot as they are sent.
     """
     try:
         logger.info(LogFormatter.info("Fetching formatted leaderboard data"))
-        data = await leaderboard_service.get_formatted_data()
-        logger.info(LogFormatter.success(f"Retrieved {len(data)} formatted entries"))
+        filters = {
+            "model_types": model_type,
+            "precisions": precision,
+            "architectures": architecture,
+            "min_params": min_params,
+            "max_params": max_params,
+            "name_prefix": search
+        }
+        snapshot = await LeaderboardService().get_snapshot()
+        if wants_ndjson(request, stream):
+            total, indices = snapshot.select(
+                sort=sort,
+                descending=order == "desc",
+                offset=offset,
+                limit=limit,
+                **filters
+            )
+            logger.info(LogFormatter.info(f"Streaming {len(indices)} formatted entries out of {total}"))
+            return ndjson_response(snapshot.table.iter_records(indices), {
+                "X-Total-Count": str(total),
+                "X-Leaderboard-Version": str(snapshot.version)
+            })
+
+        if sort == "average_score" and order == "desc" and offset == 0 and limit is None and not any(v is not None for v in filters.values()):
+            total = len(snapshot)
+            logger.info(LogFormatter.success(f"Retrieved {total} formatted entries"))
+            return payload_response(request, snapshot.formatted_payload, {
+                "X-Total-Count": str(total),
+                "X-Leaderboard-Version": str(snapshot.version)
+            })
+
+        total, data = snapshot.query(
+            sort=sort,
+            descending=order == "desc",
+            offset=offset,
+            limit=limit,
+            **filters
+        )
+        response.headers["X-Total-Count"] = str(total)
+        response.headers["X-Leaderboard-Version"] = str(snapshot.version)
+        logger.info(LogFormatter.success(f"Retrieved {len(data)} formatted entries out of {total}"))
         return data
+    except ValueError as e:
+        logger.error(LogFormatter.error("Invalid leaderboard query", e))
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(LogFormatter.error("Failed to fetch formatted leaderboard data", e))
-        raise 
\ No newline at end of file
+        raise
+
+@router.get("/changes")
+async def get_leaderboard_changes(
+    response: Response,
+    since: int = Query(..., ge=0, description="Snapshot version the client already has, from X-Leaderboard-Version")
+) -> Dict[str, Any]:
+    """
+    Get formatted rows added, updated or removed since a snapshot version
+    If the version is too old, all rows are returned as added with reset set to true
+    """
+    try:
+        logger.info(LogFormatter.info(f"Fetching leaderboard changes since v{since}"))
+        changes = await LeaderboardService().get_changes(since)
+        response.headers["X-Leaderboard-Version"] = str(changes["version"])
+        logger.info(LogFormatter.success(
+            f"v{since} -> v{changes['version']}: {len(changes['added'])} added, "
+            f"{len(changes['updated'])} updated, {len(changes['removed'])} removed"
+        ))
+        return changes
+    except Exception as e:
+        logger.error(LogFormatter.error("Failed to fetch leaderboard changes", e))
+        raise
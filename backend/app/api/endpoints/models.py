@@ -5,6 +5,7 @@ from app.services.models import ModelService
 from app.api.dependencies import get_model_service
 from app.core.fastapi_cache import cached
 from app.core.formatting import LogFormatter
+from app.core.hub_scheduler import interactive_hub_calls
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["models"])
@@ -69,7 +70,9 @@ async def submit_model(
         for line in LogFormatter.tree(submission_info, "Submission Details"):
             logger.info(line)
             
-        result = await model_service.submit_model(model_data, user_id)
+        # A user is waiting: serve its hub calls before background syncs
+        with interactive_hub_calls():
+            result = await model_service.submit_model(model_data, user_id)
         logger.info(LogFormatter.success("Model submitted successfully"))
         return result
         
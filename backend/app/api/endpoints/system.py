@@ -0,0 +1,31 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from typing import Dict, Any
+import logging
+from app.core.singleflight import single_flight
+from app.core.loop_monitor import loop_monitor
+from app.core.warmup import warmup
+from app.core.formatting import LogFormatter
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("/metrics")
+async def get_metrics() -> Dict[str, Any]:
+    """Get internal performance metrics"""
+    logger.info(LogFormatter.info("Fetching internal metrics"))
+    return {
+        "single_flight": single_flight.stats(),
+        "event_loop_lag": loop_monitor.stats()
+    }
+
+@router.get("/health")
+async def get_health() -> Dict[str, Any]:
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def get_ready() -> JSONResponse:
+    """Readiness probe: 503 until every service finished warming up"""
+    status = warmup.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
@@ -4,10 +4,10 @@ from app.services.votes import VoteService
 from app.core.fastapi_cache import cached, build_cache_key, invalidate_cache_key
 import logging
 from app.core.formatting import LogFormatter
+from app.core.hub_scheduler import interactive_hub_calls
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-vote_service = VoteService()
 
 def model_votes_key_builder(func, namespace: str = "model_votes", **kwargs):
     """Build cache key for model votes"""
@@ -40,8 +40,11 @@ async def add_vote(
         for line in LogFormatter.tree(stats, "Vote Details"):
             logger.info(line)
         
-        await vote_service.initialize()
-        result = await vote_service.add_vote(model_id, user_id, vote_type)
+        vote_service = VoteService()
+        # A user is waiting: serve its hub calls before background syncs
+        with interactive_hub_calls():
+            await vote_service.initialize()
+            result = await vote_service.add_vote(model_id, user_id, vote_type)
         
         # Invalidate affected caches
         try:
@@ -79,6 +82,7 @@ async def get_model_votes(
     """Get all votes for a specific model"""
     try:
         logger.info(LogFormatter.info(f"Fetching votes for model: {provider}/{model}"))
+        vote_service = VoteService()
         await vote_service.initialize()
         model_id = f"{provider}/{model}"
         result = await vote_service.get_model_votes(model_id)
@@ -96,6 +100,7 @@ async def get_user_votes(
     """Get all votes from a specific user"""
     try:
         logger.info(LogFormatter.info(f"Fetching votes for user: {user_id}"))
+        vote_service = VoteService()
         await vote_service.initialize()
         votes = await vote_service.get_user_votes(user_id)
         logger.info(LogFormatter.success(f"Found {len(votes)} votes"))
@@ -2,19 +2,25 @@
 ASGI entry point for the Open LLM Leaderboard API.
 """
 import os
-import uvicorn
 import logging
 import logging.config
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 import sys
-import sentry_sdk
 
 from app.api.router import router
 from app.core.fastapi_cache import setup_cache
 from app.core.formatting import LogFormatter
-from app.config.base import SENTRY_DSN
+from app.core.executors import shutdown_executors
+from app.core.loop_monitor import loop_monitor
+from app.core.leader import leader_election
+from app.core.warmup import warmup
+from app.core.http_pool import open_http_pools, close_http_pools
+from app.services.leaderboard import LeaderboardService
+from app.services.models import ModelService
+from app.services.votes import VoteService
+from app.config.base import SENTRY_DSN, WARMUP_DEADLINE
 from app.config import hf_config
 
 # Configure logging before anything else
@@ -66,6 +72,7 @@ logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger("app")
 
 if SENTRY_DSN is not None:
+    import sentry_sdk
     sentry_sdk.init(
         dsn=SENTRY_DSN,
         # Add data like request headers and IP for users,
@@ -122,4 +129,34 @@ async def startup_event():
     
     # Setup cache
     setup_cache()
-    logger.info(LogFormatter.success("FastAPI Cache initialized with in-memory backend")) 
\ No newline at end of file
+    logger.info(LogFormatter.success("FastAPI Cache initialized with in-memory backend"))
+
+    # Open the connection pools shared by all hub traffic
+    await open_http_pools()
+
+    # Serve the snapshots persisted by the previous run while they are revalidated
+    await ModelService().restore_cache()
+    await LeaderboardService().restore_snapshot()
+
+    # Start background leaderboard snapshot refresh
+    LeaderboardService().start_background_refresh()
+
+    # Monitor event loop responsiveness
+    loop_monitor.start()
+
+    # Warm up services concurrently in the background, /api/ready reports their progress
+    warmup.start({
+        "models": ModelService().initialize,
+        "votes": VoteService().initialize,
+        "leaderboard": LeaderboardService().get_snapshot,
+    }, deadline=WARMUP_DEADLINE)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks on shutdown"""
+    await warmup.stop()
+    await LeaderboardService().stop_background_refresh()
+    await loop_monitor.stop()
+    shutdown_executors()
+    await close_http_pools()
+    leader_election.release()
@@ -13,6 +13,38 @@ ORIGINS = ["http://localhost:3000"] if os.getenv("ENVIRONMENT") == "development"
 # Cache configuration
 CACHE_TTL = int(os.environ.get("CACHE_TTL", 300))  # 5 minutes default
 
+# Leaderboard snapshot refresh
+LEADERBOARD_REFRESH_INTERVAL = int(os.environ.get("LEADERBOARD_REFRESH_INTERVAL", CACHE_TTL))  # seconds between background rebuilds
+LEADERBOARD_HISTORY_SIZE = int(os.environ.get("LEADERBOARD_HISTORY_SIZE", 100))  # snapshot diffs kept for /changes
+
+# Multi-worker mode: one worker refreshes and publishes snapshots, the others map them
+SHARED_SNAPSHOTS = os.environ.get("SHARED_SNAPSHOTS", "false").lower() == "true"
+SHARED_SNAPSHOT_POLL_INTERVAL = float(os.environ.get("SHARED_SNAPSHOT_POLL_INTERVAL", 2))  # seconds between follower checks
+
+# Startup
+WARMUP_DEADLINE = float(os.environ.get("WARMUP_DEADLINE", 60))  # seconds after startup before services still warming up are reported
+
+# Result ingestion
+RESULTS_CAMPAIGNS = [c.strip() for c in os.environ.get("RESULTS_CAMPAIGNS", "clearML-sprint1.5").split(",") if c.strip()]  # result folders ingested
+RESULTS_DOWNLOAD_LATEST_ONLY = os.environ.get("RESULTS_DOWNLOAD_LATEST_ONLY", "false").lower() == "true"  # only fetch the newest file per model
+RESULTS_LATEST_ONLY = os.environ.get("RESULTS_LATEST_ONLY", "false").lower() == "true"  # only parse the newest file per model, older ones for missing tasks
+INGESTION_WORKERS = int(os.environ.get("INGESTION_WORKERS", 0))  # processes parsing result files, 0 or 1 = serial
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", 100))  # shared aiohttp pool, all hosts
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 64))
+HTTP_DNS_CACHE_TTL = int(os.environ.get("HTTP_DNS_CACHE_TTL", 300))  # seconds
+DOWNLOAD_CONCURRENCY = int(os.environ.get("DOWNLOAD_CONCURRENCY", 16))  # initial request file downloads in flight, tuned at runtime
+DOWNLOAD_MAX_CONCURRENCY = int(os.environ.get("DOWNLOAD_MAX_CONCURRENCY", 64))
+DOWNLOAD_RETRIES = int(os.environ.get("DOWNLOAD_RETRIES", 4))  # retries of a download failing with a transient error
+HUB_LOOKUP_TTL = int(os.environ.get("HUB_LOOKUP_TTL", 86400))  # 1 day default
+HUB_LOOKUP_CONCURRENCY = int(os.environ.get("HUB_LOOKUP_CONCURRENCY", 8))
+
+# Executors for blocking work
+HUB_IO_WORKERS = int(os.environ.get("HUB_IO_WORKERS", 16))  # threads for blocking hub calls
+CPU_WORKERS = int(os.environ.get("CPU_WORKERS", 2))  # threads for parsing and filesystem work
+HUB_MAX_CONCURRENCY = int(os.environ.get("HUB_MAX_CONCURRENCY", 32))  # hub requests in flight across the app
+HUB_INTERACTIVE_RESERVE = int(os.environ.get("HUB_INTERACTIVE_RESERVE", 4))  # of those, slots background work never takes
+HUB_RATE_LIMIT = float(os.environ.get("HUB_RATE_LIMIT", 50))  # hub requests started per second, 0 for no limit
+
 # Rate limiting
 RATE_LIMIT_PERIOD = 7  # days
 RATE_LIMIT_QUOTA = 5
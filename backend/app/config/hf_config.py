@@ -1,7 +1,6 @@
 import os
 import logging
 from typing import Optional
-from huggingface_hub import HfApi
 from pathlib import Path
 from app.core.cache import cache_config
 
@@ -15,9 +14,6 @@ HF_TOKEN = os.environ.get("HF_TOKEN")
 if not HF_TOKEN:
     logger.warning("HF_TOKEN not found in environment variables. Some features may be limited.")
 
-# Initialize HF API
-API = HfApi(token=HF_TOKEN)
-
 # Repository configuration
 QUEUE_REPO = f"{HF_ORGANIZATION}/{os.environ.get("REQUESTS_REPO", "requests")}"
 AGGREGATED_REPO = f"{HF_ORGANIZATION}/{os.environ.get("CONTENTS_REPO", "contents")}"
@@ -26,6 +22,18 @@ OFFICIAL_PROVIDERS_REPO = f"{HF_ORGANIZATION}/{os.environ.get("OFFICIAL_PROVIDER
 RESULTS_REPO = f"{HF_ORGANIZATION}/{os.environ.get("RESULTS_REPO", "results")}"
 
 # File paths from cache config
-VOTES_PATH = cache_config.votes_file
-EVAL_REQUESTS_PATH = cache_config.eval_requests_file
-MODEL_CACHE_DIR = cache_config.models_cache
\ No newline at end of file
+_CACHE_PATHS = {
+    "VOTES_PATH": "votes_file",
+    "EVAL_REQUESTS_PATH": "eval_requests_file",
+    "MODEL_CACHE_DIR": "models_cache",
+}
+
+def __getattr__(name: str):
+    """HF API client and cache paths, created on first use so importing the config stays cheap"""
+    if name == "API":
+        from huggingface_hub import HfApi
+        globals()["API"] = HfApi(token=HF_TOKEN)
+        return globals()["API"]
+    if name in _CACHE_PATHS:
+        return getattr(cache_config, _CACHE_PATHS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
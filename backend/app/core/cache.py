@@ -27,12 +27,15 @@ class CacheConfig:
         # Specific files
         self.votes_file = self.votes_cache / "votes_data.jsonl"
         self.eval_requests_file = self.eval_cache / "eval_requests.jsonl"
+        self.hub_lookups_file = self.cache_root / "hub_lookups.json"
+        self.snapshots_dir = self.cache_root / "snapshots"
+        self.leader_lock_file = self.cache_root / "leader.lock"
+        self.requests_snapshot_file = self.cache_root / "requests_snapshot.arrow"
         
         # Cache TTL
         self.cache_ttl = timedelta(seconds=CACHE_TTL)
         
         self._initialize_cache_dirs()
-        self._setup_environment()
         
     def _initialize_cache_dirs(self):
         """Initialize all necessary cache directories"""
@@ -55,20 +58,6 @@ class CacheConfig:
             logger.error(LogFormatter.error("Failed to create cache directories", e))
             raise
             
-    def _setup_environment(self):
-        """Configure HuggingFace environment variables"""
-        logger.info(LogFormatter.subsection("ENVIRONMENT SETUP"))
-
-        env_vars = {
-            "HF_HOME": str(self.cache_root),
-            "HF_DATASETS_CACHE": str(self.datasets_cache)
-        }
-
-        for var, value in env_vars.items():
-            os.environ[var] = value
-            logger.info(LogFormatter.info(f"Set {var}={value}"))
-
-        
     def get_cache_path(self, cache_type: str) -> Path:
         """Returns the path for a specific cache type"""
         cache_paths = {
@@ -105,5 +94,41 @@ class CacheConfig:
             logger.error(LogFormatter.error("Failed to flush cache", e))
             raise
 
+def _setup_environment():
+    """Configure HuggingFace environment variables, before huggingface_hub reads them"""
+    logger.info(LogFormatter.subsection("ENVIRONMENT SETUP"))
+
+    env_vars = {
+        "HF_HOME": str(CACHE_ROOT),
+        "HF_DATASETS_CACHE": str(DATASETS_CACHE),
+        # Disable datasets progress bars globally, without importing datasets
+        "HF_DATASETS_DISABLE_PROGRESS_BARS": "1"
+    }
+
+    for var, value in env_vars.items():
+        os.environ[var] = value
+        logger.info(LogFormatter.info(f"Set {var}={value}"))
+
+class LazyCacheConfig:
+    """The CacheConfig, created with its directories on first use rather than at import"""
+
+    def __init__(self):
+        object.__setattr__(self, "_config", None)
+
+    def _get(self) -> CacheConfig:
+        config = object.__getattribute__(self, "_config")
+        if config is None:
+            config = CacheConfig()
+            object.__setattr__(self, "_config", config)
+        return config
+
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._get(), name, value)
+
+_setup_environment()
+
 # Singleton instance of cache configuration
-cache_config = CacheConfig() 
\ No newline at end of file
+cache_config = LazyCacheConfig()
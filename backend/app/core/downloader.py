@@ -0,0 +1,133 @@
+import time
+import random
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from app.core.formatting import LogFormatter
+from app.core.hub_scheduler import hub_scheduler, parse_retry_after
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth another attempt; 429 and 503 also mean the server wants less load
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+# Backoff before retrying: a random delay up to base * 2^attempt, capped
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+# The in-flight limit grows while latency stays within this factor of the fastest observed
+LATENCY_TOLERANCE = 2.0
+LATENCY_SMOOTHING = 0.2
+
+class DownloadError(Exception):
+    """A download that failed for good, after retries when the failure was transient"""
+
+class AdaptiveDownloader:
+    """Keeps a self-tuning number of GET requests in flight on a session
+
+    Callers start all their downloads at once and each one waits for a free
+    slot, so a slow download never holds back the others. The limit follows
+    AIMD: it grows by about one per round of requests while latency stays
+    close to the fastest observed, and is halved on 429/503 responses. Each
+    request also takes a slot of the global hub budget, which pauses all hub
+    traffic on 429. Transient failures are retried with jittered exponential
+    backoff.
+    """
+
+    def __init__(self, session: "aiohttp.ClientSession", concurrency: int, max_concurrency: int, max_retries: int):
+        self.session = session
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self._limit = float(min(max(1, concurrency), self.max_concurrency))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latency: Optional[float] = None
+        self._fastest: Optional[float] = None
+        self._last_decrease = 0.0
+        self._stats = {"requests": 0, "retries": 0, "throttled": 0, "failed": 0}
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counters and the current in-flight limit"""
+        return {**self._stats, "concurrency": self.limit}
+
+    async def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Body of a successful GET, raising DownloadError once retries are exhausted"""
+        import aiohttp
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            await self._acquire()
+            try:
+                async with hub_scheduler.slot():
+                    start = time.monotonic()
+                    self._stats["requests"] += 1
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status == 200:
+                            text = await response.text()
+                            self._on_success(time.monotonic() - start)
+                            hub_scheduler.succeeded()
+                            return text
+                        error = f"HTTP {response.status}"
+                        if response.status not in RETRYABLE_STATUSES:
+                            self._stats["failed"] += 1
+                            raise DownloadError(error)
+                        if response.status in THROTTLE_STATUSES:
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            self._on_throttle(retry_after)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                await self._release()
+
+            if attempt == self.max_retries:
+                self._stats["failed"] += 1
+                raise DownloadError(f"{error} after {attempt + 1} attempts")
+            self._stats["retries"] += 1
+            delay = retry_after if retry_after is not None else random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            logger.debug(LogFormatter.warning(f"Retrying {url} in {delay:.1f}s ({error})"))
+            await asyncio.sleep(delay)
+
+    async def _acquire(self):
+        """Wait until a slot is free"""
+        async with self._condition:
+            while self._in_flight >= self.limit:
+                await self._condition.wait()
+            self._in_flight += 1
+
+    async def _release(self):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _on_success(self, latency: float):
+        """Additive increase while latency holds, gentle decrease when it degrades"""
+        self._fastest = latency if self._fastest is None else min(self._fastest, latency)
+        self._latency = latency if self._latency is None else (
+            LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self._latency
+        )
+        if self._latency <= self._fastest * LATENCY_TOLERANCE:
+            self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+        else:
+            self._decrease(0.9)
+
+    def _on_throttle(self, retry_after: Optional[float]):
+        """Halve the limit and pause hub traffic, a 429 applying to the whole app"""
+        self._stats["throttled"] += 1
+        self._decrease(0.5)
+        hub_scheduler.throttled(retry_after)
+
+    def _decrease(self, factor: float):
+        # Responses to requests sent before the last decrease say nothing about the new limit
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency or BACKOFF_BASE):
+            return
+        self._last_decrease = now
+        self._limit = max(1.0, self._limit * factor)
@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from app.config.base import HUB_IO_WORKERS, CPU_WORKERS, INGESTION_WORKERS, HUB_MAX_CONCURRENCY
+from app.core.formatting import LogFormatter
+from app.core.hub_scheduler import hub_scheduler, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Executors are created on first use and shared by all services
+_hub_io_executor: Optional[ThreadPoolExecutor] = None
+_cpu_executor: Optional[ThreadPoolExecutor] = None
+_parse_executor: Optional[ProcessPoolExecutor] = None
+
+def get_hub_io_executor() -> ThreadPoolExecutor:
+    """Thread pool for blocking Hugging Face Hub calls"""
+    global _hub_io_executor
+    if _hub_io_executor is None:
+        # Enough threads for every call the hub scheduler admits, so none queues here behind the others
+        _hub_io_executor = ThreadPoolExecutor(
+            max_workers=max(HUB_IO_WORKERS, HUB_MAX_CONCURRENCY),
+            thread_name_prefix="hub-io"
+        )
+    return _hub_io_executor
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+    """Thread pool for in-process parsing and filesystem work"""
+    global _cpu_executor
+    if _cpu_executor is None:
+        _cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="cpu")
+    return _cpu_executor
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """Process pool for parallel result ingestion (INGESTION_WORKERS > 1)"""
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=INGESTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_executor
+
+async def run_in(executor: Executor, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking function in the given executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+async def run_hub_io(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking hub call off the event loop, within the global hub budget
+
+    A 429 from the hub pauses every hub call until it allows more traffic.
+    """
+    async with hub_scheduler.slot():
+        try:
+            result = await run_in(get_hub_io_executor(), fn, *args, **kwargs)
+        except Exception as e:
+            response = getattr(e, "response", None)
+            if getattr(response, "status_code", None) == 429:
+                hub_scheduler.throttled(parse_retry_after(response.headers.get("Retry-After")))
+            raise
+    hub_scheduler.succeeded()
+    return result
+
+async def run_cpu(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run blocking parsing or filesystem work off the event loop"""
+    return await run_in(get_cpu_executor(), fn, *args, **kwargs)
+
+def shutdown_executors():
+    """Shut down all executors, dropping queued work"""
+    global _hub_io_executor, _cpu_executor, _parse_executor
+    for executor in (_hub_io_executor, _cpu_executor, _parse_executor):
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    _hub_io_executor = _cpu_executor = _parse_executor = None
+    logger.info(LogFormatter.info("Executors shut down"))
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Optional
+from app.config.base import HTTP_MAX_CONNECTIONS, HTTP_MAX_CONNECTIONS_PER_HOST, HTTP_DNS_CACHE_TTL, HUB_IO_WORKERS
+from app.core.formatting import LogFormatter
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+    from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Application-scoped pools, opened at startup and closed at shutdown.
+# A session is bound to the event loop it was created on, so each loop gets its own.
+_sessions: Dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
+_hub_adapter: Optional["HTTPAdapter"] = None
+
+async def get_http_session() -> "aiohttp.ClientSession":
+    """Shared aiohttp session, keeping connections alive and DNS answers cached across calls
+
+    Created on first use if startup did not open it, e.g. in scripts. Sessions
+    of event loops that have since been closed are closed and dropped.
+    """
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    for other_loop in [other_loop for other_loop in _sessions if other_loop.is_closed()]:
+        await _close_session(other_loop, _sessions.pop(other_loop))
+
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_MAX_CONNECTIONS,
+            limit_per_host=HTTP_MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        )
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+async def _close_session(loop: asyncio.AbstractEventLoop, session: "aiohttp.ClientSession"):
+    """Close a session from any loop, on its own loop while that one still runs"""
+    if session.closed:
+        return
+    try:
+        if loop is asyncio.get_running_loop() or not loop.is_running():
+            # A closed loop's connections went with it, this only marks the session closed
+            await session.close()
+        else:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+    except Exception as e:
+        logger.warning(LogFormatter.warning(f"Failed to close HTTP session: {e}"))
+
+def _hub_session_factory() -> "requests.Session":
+    """Session for huggingface_hub, and transformers and datasets through it
+
+    huggingface_hub keeps one session per thread; they all share a single
+    adapter, so hub-io threads draw from one pool of kept-alive connections.
+    """
+    import requests
+
+    session = requests.Session()
+    session.mount("http://", _hub_adapter)
+    session.mount("https://", _hub_adapter)
+    return session
+
+async def open_http_pools():
+    """Create the shared aiohttp session and route huggingface_hub through the shared pool"""
+    from huggingface_hub import configure_http_backend, constants
+    try:
+        # Keeps the request ids huggingface_hub adds to its calls for debugging
+        from huggingface_hub.utils._http import UniqueRequestIdAdapter as HubAdapter
+    except ImportError:
+        from requests.adapters import HTTPAdapter as HubAdapter
+
+    global _hub_adapter
+    await get_http_session()
+    # Offline mode relies on huggingface_hub's own adapter refusing requests
+    if not constants.HF_HUB_OFFLINE and _hub_adapter is None:
+        _hub_adapter = HubAdapter(pool_connections=8, pool_maxsize=max(HUB_IO_WORKERS, HTTP_MAX_CONNECTIONS_PER_HOST))
+        configure_http_backend(backend_factory=_hub_session_factory)
+    logger.info(LogFormatter.success(
+        f"HTTP pools ready ({HTTP_MAX_CONNECTIONS} connections, {HTTP_MAX_CONNECTIONS_PER_HOST} per host)"
+    ))
+
+async def close_http_pools():
+    """Close pooled connections, for a clean shutdown"""
+    global _hub_adapter
+    sessions = list(_sessions.items())
+    _sessions.clear()
+    for loop, session in sessions:
+        await _close_session(loop, session)
+    if _hub_adapter is not None:
+        from huggingface_hub import configure_http_backend
+        # Back to huggingface_hub's own sessions first, so later calls never mount the closed adapter
+        configure_http_backend()
+        _hub_adapter.close()
+        _hub_adapter = None
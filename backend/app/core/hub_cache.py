@@ -0,0 +1,86 @@
+import json
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+from app.core.formatting import LogFormatter
+from app.core.snapshot_store import atomic_file
+
+logger = logging.getLogger(__name__)
+
+class HubLookupCache:
+    """Persistent cache of hub availability and architecture keyed by (model, sha)
+
+    Positive lookups are kept for `ttl` seconds. Negative lookups are kept for at
+    most an hour, since is_model_on_hub reports transient network errors as
+    "not on hub".
+    """
+
+    NEGATIVE_TTL = 3600
+
+    def __init__(self, path: Path, ttl: int):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    @staticmethod
+    def _key(model: str, sha: str) -> str:
+        return f"{model}@{sha or 'main'}"
+
+    def load(self):
+        """Load entries from disk, done on first use unless called beforehand"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                self._entries = json.load(f)
+            logger.info(LogFormatter.info(f"Loaded {len(self._entries):,} hub lookups from {self.path}"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(LogFormatter.warning(f"Ignoring unreadable hub lookup cache: {e}"))
+            self._entries = {}
+
+    def get(self, model: str, sha: str) -> Optional[Dict[str, Any]]:
+        """Return the cached lookup, or None if missing or expired"""
+        if not self._loaded:
+            self.load()
+        entry = self._entries.get(self._key(model, sha))
+        if entry is None:
+            return None
+        ttl = self.ttl if entry["still_on_hub"] else min(self.ttl, self.NEGATIVE_TTL)
+        if time.time() - entry["checked_at"] > ttl:
+            return None
+        return entry
+
+    def set(self, model: str, sha: str, still_on_hub: bool, architecture: str):
+        """Record a fresh lookup"""
+        if not self._loaded:
+            self.load()
+        self._entries[self._key(model, sha)] = {
+            "still_on_hub": still_on_hub,
+            "architecture": architecture,
+            "checked_at": time.time()
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache to disk atomically if it changed
+
+        Safe to run in a worker thread while lookups are recorded: the
+        entries are copied first, and later changes mark the cache dirty again.
+        """
+        if not self._dirty:
+            return
+        entries = dict(self._entries)
+        self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_file(self.path, "w") as f:
+                json.dump(entries, f)
+        except OSError as e:
+            self._dirty = True
+            logger.error(LogFormatter.error("Failed to save hub lookup cache", e))
@@ -0,0 +1,171 @@
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+from app.config.base import HUB_MAX_CONCURRENCY, HUB_INTERACTIVE_RESERVE, HUB_RATE_LIMIT
+from app.core.formatting import LogFormatter
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Global pause after a 429 without Retry-After, doubled while they keep coming
+THROTTLE_BACKOFF = 1.0
+THROTTLE_BACKOFF_MAX = 60.0
+RETRY_AFTER_MAX = 120.0
+
+# Priority of the hub calls made by the current task, inherited by the tasks it starts
+_priority: ContextVar[int] = ContextVar("hub_priority", default=BACKGROUND)
+
+@contextmanager
+def _hub_priority(priority: int) -> Iterator[None]:
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+def interactive_hub_calls():
+    """Serve the hub calls made in this block before background work, e.g. for a user waiting on a response"""
+    return _hub_priority(INTERACTIVE)
+
+def background_hub_calls():
+    """Run the hub calls made in this block as background work, even from a task started by a user request"""
+    return _hub_priority(BACKGROUND)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        seconds = (date - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+class HubScheduler:
+    """Admits hub requests within a global concurrency and rate budget, interactive ones first
+
+    Requests wait in a priority queue; background requests never take the
+    last `reserve` slots, so a user-facing call always finds one quickly even
+    during a large sync. A 429 from any service pauses all admissions, for
+    Retry-After or an exponential backoff.
+    """
+
+    def __init__(self, concurrency: int, reserve: int, rate: float):
+        self.concurrency = max(1, concurrency)
+        self.reserve = min(max(0, reserve), self.concurrency - 1)
+        self.rate = rate
+        self._tokens = float(rate)
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._paused_until = 0.0
+        self._backoff = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats = {"interactive": 0, "background": 0, "throttled": 0}
+
+    def stats(self):
+        """Admissions per priority, 429s seen, and current load"""
+        return {**self._stats, "in_flight": self._in_flight, "queued": len(self._waiters)}
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot of the budget for one hub request, at the priority of the current task"""
+        await self._acquire(_priority.get())
+        try:
+            yield
+        finally:
+            self._release()
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Pause all admissions after a 429"""
+        self._stats["throttled"] += 1
+        self._backoff = min(THROTTLE_BACKOFF_MAX, self._backoff * 2 if self._backoff else THROTTLE_BACKOFF)
+        pause = retry_after if retry_after is not None else self._backoff
+        until = time.monotonic() + pause
+        if until > self._paused_until:
+            self._paused_until = until
+            logger.warning(LogFormatter.warning(f"Hub rate limited, pausing hub requests for {pause:.1f}s"))
+
+    def succeeded(self):
+        """Reset the throttle backoff once the hub answers normally again"""
+        self._backoff = 0.0
+
+    async def _acquire(self, priority: int):
+        if not self._waiters and self._admit(priority):
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Granted just before the cancellation: hand the slot back
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _admit(self, priority: int) -> bool:
+        """Take a slot and a rate token if the budget allows it now"""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return False
+        limit = self.concurrency if priority == INTERACTIVE else self.concurrency - self.reserve
+        if self._in_flight >= limit:
+            return False
+        if self.rate > 0:
+            self._tokens = min(float(self.rate), self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self._in_flight += 1
+        self._stats["interactive" if priority == INTERACTIVE else "background"] += 1
+        return True
+
+    def _dispatch(self):
+        """Wake queued requests in priority order while the budget allows"""
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._admit(priority):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+        if self._waiters and self._timer is None:
+            # Blocked by a pause or the rate: retry once they allow; a free slot dispatches on release
+            delay = self._paused_until - time.monotonic()
+            if self.rate > 0:
+                delay = max(delay, (1 - self._tokens) / self.rate)
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+# Shared instance every hub request goes through
+hub_scheduler = HubScheduler(HUB_MAX_CONCURRENCY, HUB_INTERACTIVE_RESERVE, HUB_RATE_LIMIT)
@@ -0,0 +1,101 @@
+import re
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\r\n]*")
+# Indentation of the first key of a pretty-printed object
+_first_key = re.compile(r"\{\r?\n([ \t]+)\"")
+# Strings, which may hold brackets, and the brackets opening and closing nested values
+_token = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+
+def _top_level(text: str, positions: List[int]) -> Set[int]:
+    """The given positions, sorted, that lie directly inside the outermost object
+
+    Scans the document only up to the last position. JSON strings cannot
+    hold raw newlines, so a position at a line start is never inside one.
+    """
+    top_level = set()
+    depth = 0
+    scanned = 0
+    for position in positions:
+        for token in _token.finditer(text, scanned, position):
+            if token.group() in "{[":
+                depth += 1
+            elif token.group() in "}]":
+                depth -= 1
+        scanned = position
+        if depth == 1:
+            top_level.add(position)
+    return top_level
+
+def extract_sections(text: str, keys: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """Decode only the given top-level keys of a pretty-printed JSON object
+
+    Key lines are found by searching for the key at the first key's
+    indentation, then kept only if they are at the top level, so a nested
+    key indented the same way is never taken for one. Only the values of the
+    wanted keys are decoded; the rest of the document is never turned into
+    objects. Returns None when the layout is not the expected one (compact
+    JSON, missing key, truncated file), in which case the caller should
+    parse the whole document. Only the selected values are validated:
+    invalid JSON elsewhere in the document is not detected.
+    """
+    match = _first_key.match(text)
+    if match is None or not text.rstrip().endswith("}"):
+        return None
+
+    indent = match.group(1)
+    keys = list(keys)
+    candidates: Dict[str, List[int]] = {}
+    for key in keys:
+        # Searching for the literal key line is much faster than a regex scan
+        needle = f"\n{indent}{json.dumps(key)}"
+        candidates[key] = []
+        position = text.find(needle)
+        while position != -1:
+            candidates[key].append(position)
+            position = text.find(needle, position + len(needle))
+    top_level = _top_level(text, sorted(position for positions in candidates.values() for position in positions))
+
+    sections = {}
+    for key in keys:
+        needle_length = len(indent) + len(json.dumps(key)) + 1
+        value_start = None
+        for position in candidates[key]:
+            if position not in top_level:
+                continue
+            # Like json.load, a repeated key keeps its last value
+            colon = _whitespace.match(text, position + needle_length).end()
+            if colon < len(text) and text[colon] == ":":
+                value_start = colon + 1
+        if value_start is None:
+            return None
+
+        try:
+            sections[key], end = _decoder.raw_decode(text, _whitespace.match(text, value_start).end())
+        except json.JSONDecodeError:
+            return None
+        # The value must be followed by the next member or the end of the object
+        end = _whitespace.match(text, end).end()
+        if end >= len(text) or text[end] not in ",}":
+            return None
+
+    return sections
+
+def load_json_sections(path: str, keys: Iterable[str]) -> Dict[str, Any]:
+    """Top-level keys of a JSON file, decoding only them when the layout allows it
+
+    Falls back to parsing the whole file when the layout is not the expected
+    one; missing keys are left out. For a valid document the result is the
+    same as picking the keys from json.load, but only the selected sections
+    are validated, so a file that is invalid elsewhere loads without error.
+    """
+    keys = list(keys)
+    with open(path) as fp:
+        text = fp.read()
+    sections = extract_sections(text, keys)
+    if sections is None:
+        data = json.loads(text)
+        sections = {key: data[key] for key in keys if key in data}
+    return sections
@@ -0,0 +1,74 @@
+import os
+import math
+import fcntl
+import logging
+from pathlib import Path
+from typing import Optional
+from fastapi import HTTPException
+from app.core.formatting import LogFormatter
+from app.core.cache import cache_config
+from app.config.base import SHARED_SNAPSHOTS, SHARED_SNAPSHOT_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+class AwaitingLeader(HTTPException):
+    """Data a follower only gets from the leader, not published yet; served as a 503
+
+    Followers never fall back to the hub, so that a cold start of N workers
+    does not cost N full refreshes, and all workers serve the same versions.
+    """
+
+    def __init__(self, what: str):
+        super().__init__(
+            status_code=503,
+            detail=f"{what} not published by the leader worker yet",
+            headers={"Retry-After": str(math.ceil(SHARED_SNAPSHOT_POLL_INTERVAL))}
+        )
+
+class LeaderElection:
+    """Elects one process per host through an exclusive lock on a shared file
+
+    The leader keeps the lock for its lifetime; the kernel releases it when the
+    process exits, and the next follower asking becomes leader. When disabled,
+    the process is always leader.
+    """
+
+    def __init__(self, lock_file: Optional[Path], enabled: bool):
+        self._lock_file = lock_file
+        self.enabled = enabled
+        self._fd: Optional[int] = None
+
+    @property
+    def lock_file(self) -> Path:
+        """The lock file, in the cache directory unless given"""
+        return self._lock_file or cache_config.leader_lock_file
+
+    def is_leader(self) -> bool:
+        """Whether this process leads, trying to take over the lock if it does not"""
+        if not self.enabled or self._fd is not None:
+            return True
+
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        logger.info(LogFormatter.success(f"Worker {os.getpid()} is now the snapshot leader"))
+        return True
+
+    def release(self):
+        """Give up leadership, for a clean shutdown"""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+# Shared instance: the leader refreshes from the hub, followers map its snapshots
+# The lock file is resolved on the first election, so importing this module creates no cache directory
+leader_election = LeaderElection(None, SHARED_SNAPSHOTS)
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Optional
+from app.core.formatting import LogFormatter
+
+logger = logging.getLogger(__name__)
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes up from a fixed-interval sleep
+
+    A lag close to zero means the loop is free to serve requests; blocking work
+    running on the loop shows up directly as lag.
+    """
+
+    def __init__(self, interval: float = 0.5, window: int = 120):
+        self.interval = interval
+        self._recent = deque(maxlen=window)
+        self._max = 0.0
+        self._total = 0.0
+        self._samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(LogFormatter.info(f"Event loop lag monitor started (every {self.interval}s)"))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self._recent.append(lag)
+            self._max = max(self._max, lag)
+            self._total += lag
+            self._samples += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Lag in milliseconds: last sample, max over the recent window and since start, mean"""
+        return {
+            "last_ms": round(self._recent[-1] * 1000, 2) if self._recent else 0.0,
+            "recent_max_ms": round(max(self._recent) * 1000, 2) if self._recent else 0.0,
+            "max_ms": round(self._max * 1000, 2),
+            "mean_ms": round(self._total / self._samples * 1000, 2) if self._samples else 0.0,
+            "samples": self._samples
+        }
+
+# Shared instance started with the application
+loop_monitor = EventLoopLagMonitor()
@@ -0,0 +1,92 @@
+import os
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+@dataclass
+class ManifestEntry:
+    """A tracked file and what was parsed from it"""
+    size: int
+    mtime: float
+    content_hash: str
+    payload: Any = None
+
+@dataclass
+class ManifestChanges:
+    """Files that differ from the manifest, in scan order"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class FileManifest:
+    """Tracks size, mtime and content hash of files to detect which ones need re-parsing
+
+    Content is only hashed when size or mtime changed, so an unchanged tree costs
+    one stat per file. A file that was rewritten with identical content is not
+    reported as changed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._pending: Dict[str, Tuple[int, float, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        return self._entries.get(path)
+
+    def cached(self, path: str) -> Optional[Any]:
+        """Payload of a file whose size and mtime did not change since it was recorded"""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        stat = os.stat(path)
+        if entry.size != stat.st_size or entry.mtime != stat.st_mtime:
+            return None
+        return entry.payload
+
+    def scan(self, paths: List[str]) -> ManifestChanges:
+        """Compare the given files with the manifest"""
+        changes = ManifestChanges()
+        self._pending.clear()
+        seen = set(paths)
+
+        for path in paths:
+            stat = os.stat(path)
+            entry = self._entries.get(path)
+            if entry is not None and entry.size == stat.st_size and entry.mtime == stat.st_mtime:
+                continue
+
+            content_hash = hash_file(path)
+            if entry is not None and entry.content_hash == content_hash:
+                entry.size, entry.mtime = stat.st_size, stat.st_mtime
+                continue
+
+            self._pending[path] = (stat.st_size, stat.st_mtime, content_hash)
+            if entry is None:
+                changes.added.append(path)
+            else:
+                changes.changed.append(path)
+
+        changes.removed = [path for path in self._entries if path not in seen]
+        return changes
+
+    def record(self, path: str, payload: Any):
+        """Store the payload parsed from a file reported by the last scan"""
+        size, mtime, content_hash = self._pending.pop(path)
+        self._entries[path] = ManifestEntry(size, mtime, content_hash, payload)
+
+    def remove(self, path: str):
+        self._entries.pop(path, None)
@@ -0,0 +1,169 @@
+import gzip
+import json
+import hashlib
+import functools
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Union
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, clients then get gzip
+    brotli = None
+
+# Payloads are compressed once per snapshot, in the background, so favour ratio over speed
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Rows per streamed chunk: small enough for a fast first byte, large enough to limit send overhead
+NDJSON_BATCH_SIZE = 100
+
+def encode_json(data: Any) -> bytes:
+    """Compact UTF-8 JSON, encoded as FastAPI would serialize data"""
+    return json.dumps(
+        # Enum values may be dataclasses (e.g. Precision), encode them like pydantic does
+        jsonable_encoder(data, custom_encoder={Enum: lambda member: jsonable_encoder(member.value)}),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+# Bodies are bytes, or memoryviews into a memory-mapped snapshot file
+Body = Union[bytes, memoryview]
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """JSON body rendered once, with precompressed variants and a strong ETag"""
+    body: Body
+    gzip_body: Body
+    brotli_body: Optional[Body]
+    etag: str
+
+    @classmethod
+    def render(cls, data: Any) -> "EncodedPayload":
+        """Encode data as FastAPI would serialize it, then compress it"""
+        body = encode_json(data)
+        return cls(
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+            brotli_body=brotli.compress(body, quality=BROTLI_QUALITY) if brotli is not None else None,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        )
+
+@functools.lru_cache(maxsize=None)
+def payload_schema() -> "pa.Schema":
+    """Arrow schema of persisted payloads, built on first use"""
+    import pyarrow as pa
+    return pa.schema([
+        ("name", pa.string()),
+        ("etag", pa.string()),
+        ("body", pa.large_binary()),
+        ("gzip_body", pa.large_binary()),
+        ("brotli_body", pa.large_binary()),
+    ])
+
+def payloads_to_arrow(payloads: Dict[str, EncodedPayload]) -> "pa.Table":
+    """One row per named payload"""
+    import pyarrow as pa
+    return pa.Table.from_pylist([
+        {
+            "name": name,
+            "etag": payload.etag,
+            "body": bytes(payload.body),
+            "gzip_body": bytes(payload.gzip_body),
+            "brotli_body": None if payload.brotli_body is None else bytes(payload.brotli_body),
+        }
+        for name, payload in payloads.items()
+    ], schema=payload_schema())
+
+def payloads_from_arrow(table: "pa.Table") -> Dict[str, EncodedPayload]:
+    """Payloads whose bodies are views on the table's buffers, without copying them"""
+    import numpy as np
+
+    def views(column: "pa.ChunkedArray") -> List[Optional[memoryview]]:
+        # Scalar.as_buffer copies the value, slices of the data buffer do not
+        array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        _, offsets, data = array.buffers()
+        bounds = np.frombuffer(offsets, dtype=np.int64, count=len(array) + 1, offset=array.offset * 8).tolist()
+        return [
+            memoryview(data.slice(start, end - start)) if valid else None
+            for start, end, valid in zip(bounds, bounds[1:], array.is_valid().to_pylist())
+        ]
+
+    bodies, gzip_bodies, brotli_bodies = (views(table.column(name)) for name in ("body", "gzip_body", "brotli_body"))
+    return {
+        name: EncodedPayload(body=body, gzip_body=gzip_body, brotli_body=brotli_body, etag=etag)
+        for name, etag, body, gzip_body, brotli_body in zip(
+            table.column("name").to_pylist(), table.column("etag").to_pylist(), bodies, gzip_bodies, brotli_bodies
+        )
+    }
+
+def _accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Content codings accepted by the client, ignoring those with q=0"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if coding and params not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match against our ETag, as RFC 9110 requires"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def payload_response(request: Request, payload: EncodedPayload, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serve a pre-rendered payload: 304 when the client has it, else the best encoding it accepts"""
+    response_headers = {
+        "ETag": payload.etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "no-cache",
+        **(headers or {})
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=response_headers)
+
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    if "br" in accepted and payload.brotli_body is not None:
+        body = payload.brotli_body
+        response_headers["Content-Encoding"] = "br"
+    elif "gzip" in accepted:
+        body = payload.gzip_body
+        response_headers["Content-Encoding"] = "gzip"
+    else:
+        body = payload.body
+    return Response(content=body, media_type="application/json", headers=response_headers)
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    """Whether the client asked for NDJSON, with ?stream=1 or the Accept header"""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+def ndjson_response(rows: Iterable[Any], headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """Stream rows as newline-delimited JSON, encoding them lazily as the client reads
+
+    Rows are only pulled from the iterable when the previous chunk was sent, and
+    the stream stops as soon as the client disconnects.
+    """
+    async def generate() -> AsyncIterator[bytes]:
+        batch = []
+        for row in rows:
+            batch.append(encode_json(row))
+            if len(batch) >= NDJSON_BATCH_SIZE:
+                yield b"\n".join(batch) + b"\n"
+                batch = []
+        if batch:
+            yield b"\n".join(batch) + b"\n"
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
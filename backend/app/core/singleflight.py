@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+from app.core.formatting import LogFormatter
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight execution
+
+    The first caller starts the work in its own task; callers arriving while it
+    runs await that same task and get its result or exception. Cancelling one
+    waiter does not cancel the shared work.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    async def do(self, key: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run fn for key unless a run is already in flight, in which case join it"""
+        stats = self._stats.setdefault(key, {"calls": 0, "executions": 0, "coalesced": 0})
+        stats["calls"] += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            stats["coalesced"] += 1
+            logger.info(LogFormatter.info(f"Joining in-flight '{key}'"))
+        else:
+            stats["executions"] += 1
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-key counts of calls, actual executions and coalesced callers"""
+        return {key: dict(value) for key, value in self._stats.items()}
+
+# Shared instance used by all services
+single_flight = SingleFlight()
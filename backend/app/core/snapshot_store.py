@@ -0,0 +1,136 @@
+import os
+import json
+import logging
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from app.core.formatting import LogFormatter
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Bumped when a persisted layout changes, older files are then ignored
+SNAPSHOT_FORMAT_VERSION = 4
+_METADATA_KEY = b"snapshot"
+
+@contextmanager
+def atomic_file(path: Path, mode: str):
+    """File replacing path once fully written
+
+    Each writer gets a uniquely named temporary file, so processes writing
+    the same path at once never interleave their writes.
+    """
+    with tempfile.NamedTemporaryFile(mode, dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as f:
+        try:
+            yield f
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+def write_snapshot(path: Path, table: "pa.Table", metadata: Dict[str, Any]):
+    """Write a table as an Arrow IPC file with JSON metadata, atomically"""
+    import pyarrow as pa
+
+    metadata = {"format_version": SNAPSHOT_FORMAT_VERSION, **metadata}
+    table = table.replace_schema_metadata({_METADATA_KEY: json.dumps(metadata).encode("utf-8")})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_file(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def read_snapshot(path: Path) -> Optional[Tuple["pa.Table", Dict[str, Any]]]:
+    """Read a table written by write_snapshot, None if missing, unreadable or outdated
+
+    The file is memory-mapped: column buffers point into the page cache, so
+    processes reading the same file share its memory.
+    """
+    if not path.exists():
+        return None
+    import pyarrow as pa
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+    except (pa.ArrowException, OSError, ValueError) as e:
+        logger.warning(LogFormatter.warning(f"Ignoring unreadable snapshot {path}: {e}"))
+        return None
+    if metadata.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        logger.info(LogFormatter.info(f"Ignoring snapshot {path} with outdated format"))
+        return None
+    return table, metadata
+
+class VersionedSnapshotStore:
+    """Immutable snapshot files, one per version and part, and a pointer to the current version
+
+    A new version is fully written before the pointer is atomically replaced,
+    so readers never see a partial snapshot. Files of older versions are kept
+    for a while, readers that already mapped them keep working once deleted.
+    """
+
+    def __init__(self, directory: Path, name: str, keep: int = 3):
+        self.directory = directory
+        self.name = name
+        self.keep = keep
+        self.pointer_file = directory / f"{name}.current.json"
+
+    def _part_file(self, version: int, part: str) -> Path:
+        return self.directory / f"{self.name}-{version:08d}.{part}.arrow"
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Pointer to the current version, None if nothing was published yet"""
+        try:
+            with open(self.pointer_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(LogFormatter.warning(f"Ignoring unreadable snapshot pointer {self.pointer_file}: {e}"))
+            return None
+
+    def publish(self, version: int, parts: Dict[str, "pa.Table"], metadata: Dict[str, Any]):
+        """Write all parts of a version, then point readers to it"""
+        for part, table in parts.items():
+            write_snapshot(self._part_file(version, part), table, metadata)
+
+        pointer = {"version": version, "parts": list(parts), **metadata}
+        with atomic_file(self.pointer_file, "w") as f:
+            json.dump(pointer, f)
+        self._prune(version)
+
+    def load(self, pointer: Optional[Dict[str, Any]] = None) -> Optional[Tuple[Dict[str, Any], Dict[str, "pa.Table"]]]:
+        """Map all parts of the current version, or of the given pointer"""
+        pointer = pointer or self.current()
+        if pointer is None:
+            return None
+        parts = {}
+        for part in pointer["parts"]:
+            persisted = read_snapshot(self._part_file(pointer["version"], part))
+            if persisted is None:
+                return None
+            parts[part] = persisted[0]
+        return pointer, parts
+
+    def _versions(self) -> List[int]:
+        versions = set()
+        for path in self.directory.glob(f"{self.name}-*.arrow"):
+            try:
+                versions.add(int(path.name[len(self.name) + 1:].split(".", 1)[0]))
+            except ValueError:
+                continue
+        return sorted(versions)
+
+    def _prune(self, current_version: int):
+        """Delete files of versions older than the last `keep` ones"""
+        for version in self._versions()[:-self.keep]:
+            if version == current_version:
+                continue
+            for path in self.directory.glob(f"{self.name}-{version:08d}.*.arrow"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
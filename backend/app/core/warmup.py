@@ -0,0 +1,109 @@
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from app.core.formatting import LogFormatter
+from app.core.leader import AwaitingLeader
+from app.config.base import SHARED_SNAPSHOT_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Delay between attempts of a failing warm-up step, doubled up to the maximum
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+class Warmup:
+    """Runs service warm-up steps concurrently in the background and tracks readiness
+
+    Startup does not wait for the steps, so the readiness endpoint reports
+    their progress while they run. Failing steps are retried, and the process
+    becomes ready as soon as every step has completed once; steps still
+    running at the deadline are reported as late. Steps of a follower waiting
+    for the leader's first publish are polled at the follower interval rather
+    than backed off.
+    """
+
+    def __init__(self):
+        self._steps: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._report_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._steps) and all(step["status"] == "ready" for step in self._steps.values())
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness and per-step status, duration and last error"""
+        return {"ready": self.ready, "services": {name: dict(step) for name, step in self._steps.items()}}
+
+    def start(self, steps: Dict[str, Callable[[], Awaitable[Any]]], deadline: float) -> asyncio.Task:
+        """Start all steps without waiting for them
+
+        Returns the task reporting on the steps once they are all done or the
+        deadline passed, resolving to whether the process is ready by then.
+        """
+        logger.info(LogFormatter.section("SERVICE WARM-UP"))
+        for name, step in steps.items():
+            self._steps[name] = {"status": "pending", "duration_ms": None, "attempts": 0, "error": None}
+            self._tasks[name] = asyncio.create_task(self._run_step(name, step))
+        self._report_task = asyncio.create_task(self._report(deadline))
+        return self._report_task
+
+    async def run(self, steps: Dict[str, Callable[[], Awaitable[Any]]], deadline: float) -> bool:
+        """Start all steps and wait for them for at most deadline seconds"""
+        return await self.start(steps, deadline)
+
+    async def _report(self, deadline: float) -> bool:
+        _, pending = await asyncio.wait(self._tasks.values(), timeout=deadline)
+
+        stats = {
+            name: f"{step['status']} in {step['duration_ms']:.0f}ms" if step["duration_ms"] is not None else step["status"]
+            for name, step in self._steps.items()
+        }
+        for line in LogFormatter.stats(stats, "Warm-up"):
+            logger.info(line)
+        if pending:
+            logger.warning(LogFormatter.warning(
+                f"Warm-up deadline of {deadline:g}s reached, not ready until "
+                f"{', '.join(name for name, step in self._steps.items() if step['status'] != 'ready')} complete"
+            ))
+        return self.ready
+
+    async def _run_step(self, name: str, step: Callable[[], Awaitable[Any]]):
+        state = self._steps[name]
+        start = time.perf_counter()
+        delay = RETRY_DELAY
+        while True:
+            state["attempts"] += 1
+            try:
+                await step()
+                break
+            except asyncio.CancelledError:
+                raise
+            except AwaitingLeader as e:
+                state["status"] = "waiting"
+                state["error"] = e.detail
+                await asyncio.sleep(SHARED_SNAPSHOT_POLL_INTERVAL)
+            except Exception as e:
+                state["status"] = "retrying"
+                state["error"] = str(e)
+                logger.error(LogFormatter.error(f"Warm-up of {name} failed, retrying in {delay:.0f}s", e))
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+
+        state["status"] = "ready"
+        state["error"] = None
+        state["duration_ms"] = (time.perf_counter() - start) * 1000
+        logger.info(LogFormatter.success(f"{name} warmed up in {state['duration_ms']:.0f}ms"))
+
+    async def stop(self):
+        """Cancel steps still running"""
+        tasks = list(self._tasks.values())
+        if self._report_task is not None:
+            tasks.append(self._report_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Shared instance used by startup and the readiness endpoint
+warmup = Warmup()
@@ -1,8 +1,8 @@
 from typing import Optional
-from huggingface_hub import HfApi
 from app.config import HF_TOKEN, API
 from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
+from app.core.executors import run_hub_io
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ class HuggingFaceService:
             return False
         try:
             logger.info(LogFormatter.info("Checking HF token validity..."))
-            self.api.get_token_permission()
+            await run_hub_io(self.api.get_token_permission)
             logger.info(LogFormatter.success("HF token is valid"))
             return True
         except Exception as e:
@@ -30,7 +30,7 @@ class HuggingFaceService:
         """Get information about the authenticated user"""
         try:
             logger.info(LogFormatter.info("Fetching user information..."))
-            info = self.api.get_token_permission()
+            info = await run_hub_io(self.api.get_token_permission)
             logger.info(LogFormatter.success(f"User info retrieved for: {info.get('user', 'Unknown')}"))
             return info
         except Exception as e:
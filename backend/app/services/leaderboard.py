@@ -1,34 +1,56 @@
 from app.core.cache import cache_config
 from datetime import datetime
-from typing import List, Dict, Any
-import datasets
+from typing import TYPE_CHECKING, Iterator, List, Dict, Any, Optional, Tuple, Union
 from fastapi import HTTPException
 import logging
 from app.config.base import HF_ORGANIZATION
 from app.core.formatting import LogFormatter
+from app.core.hub_cache import HubLookupCache
+from app.core.manifest import FileManifest
+from app.core.singleflight import single_flight
+from app.core.executors import run_hub_io, run_cpu, run_in, get_parse_executor
+from app.core.json_sections import load_json_sections
+from app.core.payloads import EncodedPayload, payloads_to_arrow, payloads_from_arrow
+from app.core.snapshot_store import VersionedSnapshotStore
+from app.core.leader import leader_election, AwaitingLeader
+from app.core.hub_scheduler import background_hub_calls
+import dataclasses
 from dataclasses import dataclass
 from enum import Enum
-import json
 import os
 import glob
-from transformers import AutoConfig
-from transformers.models.auto.tokenization_auto import AutoTokenizer
+import fnmatch
+import posixpath
+import functools
 import dateutil
-import numpy as np
-from huggingface_hub import snapshot_download
-from app.services.models import ModelService
+from app.services.models import ModelService, RequestIndex
+from app.services.leaderboard_changes import ChangeHistory, diff_tables, source_record
+import asyncio
 import time
 
 from app.config import (
     RESULTS_CACHE,
     EVAL_CACHE,
     HF_TOKEN,
+    LEADERBOARD_REFRESH_INTERVAL,
+    LEADERBOARD_HISTORY_SIZE,
+    SHARED_SNAPSHOT_POLL_INTERVAL,
+    INGESTION_WORKERS,
+    RESULTS_CAMPAIGNS,
+    RESULTS_DOWNLOAD_LATEST_ONLY,
+    RESULTS_LATEST_ONLY,
+    HUB_LOOKUP_TTL,
+    HUB_LOOKUP_CONCURRENCY,
 )
 
 from app.config.hf_config import (
     RESULTS_REPO,
 )
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from app.services.leaderboard_table import LeaderboardTable
+
 logger = logging.getLogger(__name__)
 
 ## All the model information that we might need
@@ -95,8 +117,24 @@ class Tasks(Enum):
     task1 = Task("community|ifeval-fr|0", "prompt_level_strict_acc", "IFEval-fr") # FIXME norm_acc should be acc # et "Suivi d'instructions"
     task2 = Task("community|bac-fr|0", "bac-fr-qem", "bac-fr") # et "Suivi d'instructions"
 
+# Score of a random guess per benchmark, in percent: normalized scores rescale it to 0
+RANDOM_BASELINES = {
+    Tasks.task0.value.benchmark: 25.0,  # four-choice questions
+}
+
+# Evaluations exposed in the formatted view: (key, display name, benchmark)
+EVALUATIONS = [
+    ("ifeval_fr", "IFEval FR", Tasks.task1.value.benchmark),
+    ("gpqa_fr", "GPQA FR", Tasks.task0.value.benchmark),
+    ("bac_fr", "BAC FR", Tasks.task2.value.benchmark),
+]
+
 def is_model_on_hub(model_name: str, revision: str, token: str = None, trust_remote_code=False, test_tokenizer=False) -> tuple[bool, str]:
     """Checks if the model model_name is on the hub, and whether it (and its tokenizer) can be loaded with AutoClasses."""
+    # transformers takes seconds to import, only load it once a lookup misses the hub cache
+    from transformers import AutoConfig
+    from transformers.models.auto.tokenization_auto import AutoTokenizer
+
     try:
         config = AutoConfig.from_pretrained(model_name, revision=revision, trust_remote_code=trust_remote_code, token=token)
         if test_tokenizer:
@@ -122,6 +160,14 @@ def is_model_on_hub(model_name: str, revision: str, token: str = None, trust_rem
     except Exception as e:
         return False, "was not found on hub!", None
 
+def get_architecture(model_config) -> str:
+    """Joined architectures of a model config, "?" when unknown"""
+    if model_config is not None:
+        architectures = getattr(model_config, "architectures", None)
+        if architectures:
+            return ";".join(architectures)
+    return "?"
+
 @dataclass
 class EvalResult:
     """Represents one full evaluation. Built from a combination of the result and request file for a given run."""
@@ -132,7 +178,8 @@ class EvalResult:
     model: str
     revision: str  # commit hash, "" if main
     results: dict
-    normalized_results: dict
+    # Filled from the leaderboard table, which normalizes all models at once
+    normalized_results: dict = dataclasses.field(default_factory=dict)
     precision: Precision = Precision.Unknown
     model_type: ModelType = ModelType.Unknown  # Pretrained, fine tuned, ...
     weight_type: WeightType = WeightType.Original  # Original or Adapter
@@ -145,10 +192,16 @@ class EvalResult:
     display: bool = True
 
     @classmethod
-    def init_from_json_file(self, json_filepath):
-        """Inits the result from the specific model result file"""
-        with open(json_filepath) as fp:
-            data = json.load(fp)
+    def init_from_json_file(self, json_filepath, check_hub=True):
+        """Inits the result from the specific model result file
+
+        With check_hub=False the hub lookup is skipped and left to the caller
+        (see LeaderboardService._resolve_hub_info).
+        """
+        import numpy as np
+
+        # Result files also embed large config_tasks, versions and summaries, never decode them
+        data = load_json_sections(json_filepath, ("config_general", "results"))
 
         config = data.get("config_general")
 
@@ -169,18 +222,16 @@ class EvalResult:
             result_key = f"{org}_{model}_{precision.value.name}"
         full_model = "/".join(org_and_model)
 
-        still_on_hub, _, model_config = is_model_on_hub(
-            full_model, config.get("model_sha", "main"), trust_remote_code=True, test_tokenizer=False
-        )
+        still_on_hub = False
         architecture = "?"
-        if model_config is not None:
-            architectures = getattr(model_config, "architectures", None)
-            if architectures:
-                architecture = ";".join(architectures)
+        if check_hub:
+            still_on_hub, _, model_config = is_model_on_hub(
+                full_model, config.get("model_sha", "main"), trust_remote_code=True, test_tokenizer=False
+            )
+            architecture = get_architecture(model_config)
 
         # Extract results available in this file (some results are split in several files)
         results = {}
-        normalized_results = {}
         for task in Tasks:
             task = task.value
 
@@ -193,7 +244,6 @@ class EvalResult:
                     continue
                 r = np.mean(accs)
                 results[task.benchmark] = r * 100.0
-                normalized_results[task.benchmark] = max(0., (r-0.25)/0.75)*100.0
 
             if(task.col_name == "IFEval-fr"):
                 accs = np.array([v.get("prompt_level_strict_acc", None) for k, v in data["results"].items() if task.benchmark == k])
@@ -207,7 +257,6 @@ class EvalResult:
                     continue
                 r2 = np.mean(accs)
                 results[task.benchmark] = (r1+r2)/2.0*100.0
-                normalized_results[task.benchmark] = results[task.benchmark]
 
             if(task.col_name == "bac-fr"):
                 accs = np.array([v.get("bac-fr-qem", None) for k, v in data["results"].items() if task.benchmark == k])
@@ -219,7 +268,6 @@ class EvalResult:
                         continue
                 r = np.mean(accs)
                 results[task.benchmark] = r*100.0
-                normalized_results[task.benchmark] = results[task.benchmark]
 
         return self(
             eval_name=result_key,
@@ -227,7 +275,6 @@ class EvalResult:
             org=org,
             model=model,
             results=results,
-            normalized_results=normalized_results,
             precision=precision,
             revision=config.get("model_sha", ""),
             still_on_hub=still_on_hub,
@@ -235,258 +282,661 @@ class EvalResult:
             display=display
         )
 
-    def update_with_request_file(self, existing_models):
+    def update_with_request_file(self, request_index: RequestIndex):
         """Finds the relevant request file for the current model and updates info with it"""
-        for status, models in existing_models.items():
-            #FIXME: for the moment we are just processing all the files in results
-            #if status == "finished":
-                for model in models:
-                    if model["name"] == self.full_model and model["precision"] == self.precision.value.name: # FIXME and model["revision"] == model_data["revision"]:
-                        self.model_type = ModelType.from_str(model["model_type"])
-                        self.weight_type = WeightType[model["weight_type"]]
-                        #self.license = request.get("license", "?")
-                        #self.likes = request.get("likes", 0)
-                        #self.num_params = request.get("params", 0)
-                        #self.date = request.get("submitted_time", "")
-                        return
-        print(
-            f"Could not find request file for {self.org}/{self.model} with precision {self.precision.value.name}"
-        )
+        #FIXME: for the moment we are just processing all the files in results, whatever their status
+        request = request_index.lookup(self.full_model, self.precision.value.name, self.revision)
+        if request is None:
+            print(
+                f"Could not find request file for {self.org}/{self.model} with precision {self.precision.value.name}"
+            )
+            return
+        self.model_type = ModelType.from_str(request["model_type"])
+        self.weight_type = WeightType[request["weight_type"]]
+        self.license = request.get("license", "?")
+        self.likes = request.get("likes", 0)
+        self.num_params = request.get("params", 0)
+        self.date = request.get("submission_time", "")
+
+@functools.lru_cache(maxsize=None)
+def eval_result_schema() -> "pa.Schema":
+    """Arrow schema of persisted EvalResults, built on first use"""
+    import pyarrow as pa
+    return pa.schema([
+        ("eval_name", pa.string()),
+        ("full_model", pa.string()),
+        ("org", pa.string()),
+        ("model", pa.string()),
+        ("revision", pa.string()),
+        ("results", pa.map_(pa.string(), pa.float64())),
+        ("normalized_results", pa.map_(pa.string(), pa.float64())),
+        ("precision", pa.string()),
+        ("model_type", pa.string()),
+        ("weight_type", pa.string()),
+        ("architecture", pa.string()),
+        ("license", pa.string()),
+        ("likes", pa.int64()),
+        ("num_params", pa.float64()),
+        ("date", pa.string()),
+        ("still_on_hub", pa.bool_()),
+        ("display", pa.bool_()),
+    ])
+
+def eval_results_to_arrow(eval_results: List[EvalResult]) -> "pa.Table":
+    """Columnar form of EvalResults, enums stored by member name"""
+    import pyarrow as pa
+    rows = []
+    for eval_result in eval_results:
+        row = dataclasses.asdict(eval_result)
+        row["results"] = list(eval_result.results.items())
+        row["normalized_results"] = list(eval_result.normalized_results.items())
+        row["precision"] = eval_result.precision.name
+        row["model_type"] = eval_result.model_type.name
+        row["weight_type"] = eval_result.weight_type.name
+        rows.append(row)
+    return pa.Table.from_pylist(rows, schema=eval_result_schema())
+
+def eval_results_from_arrow(table: Union["pa.Table", "pa.RecordBatch"]) -> List[EvalResult]:
+    """EvalResults from the table written by eval_results_to_arrow, or a batch of it"""
+    eval_results = []
+    for row in table.to_pylist():
+        row["results"] = dict(row["results"])
+        row["normalized_results"] = dict(row["normalized_results"])
+        row["precision"] = Precision[row["precision"]]
+        row["model_type"] = ModelType[row["model_type"]]
+        row["weight_type"] = WeightType[row["weight_type"]]
+        # Parameter counts default to the int 0, keep payloads byte-identical across restarts
+        if row["num_params"] is not None and row["num_params"].is_integer():
+            row["num_params"] = int(row["num_params"])
+        eval_results.append(EvalResult(**row))
+    return eval_results
+
+def result_file_date(filename: str) -> str:
+    """Sortable timestamp of a results_<date>.json file name"""
+    return filename.removesuffix(".json").removeprefix("results_")[:-7]
+
+def _parse_result_files(json_filepaths: List[str]) -> List[EvalResult]:
+    """Module-level entry point so result parsing can run in worker processes"""
+    return [EvalResult.init_from_json_file(json_filepath, check_hub=False) for json_filepath in json_filepaths]
+
+@dataclass(frozen=True)
+class LeaderboardSnapshot:
+    """Immutable, fully built view of the leaderboard served to readers
+
+    Results and table are Arrow columns, memory-mapped when the snapshot was
+    loaded from the published files: readers query them in place, and rows are
+    only materialized for the page or stream being served.
+    """
+    version: int
+    results: "pa.Table"
+    table: "LeaderboardTable"
+    raw_payload: EncodedPayload
+    formatted_payload: EncodedPayload
+    created_at: float
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def eval_results(self, batch_size: int = 1000) -> Iterator[EvalResult]:
+        """EvalResults of the snapshot, converted from the results columns a batch at a time"""
+        for batch in self.results.to_batches(max_chunksize=batch_size):
+            yield from eval_results_from_arrow(batch)
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Formatted rows, best average first"""
+        return self.table.iter_records(self.table.sorted_index("average_score"))
+
+    def select(self, offset: int = 0, limit: Optional[int] = None, **filters) -> Tuple[int, List[int]]:
+        """Filter, sort and paginate table rows using the table's sorted indexes
+
+        Returns the total number of matching models and the row indices of the requested page.
+        """
+        indices = self.table.query(**filters)
+        end = None if limit is None else offset + limit
+        return len(indices), indices[offset:end].tolist()
+
+    def query(self, offset: int = 0, limit: Optional[int] = None, **filters) -> Tuple[int, List[Dict[str, Any]]]:
+        """Total number of matching models and the requested page of formatted rows"""
+        total, indices = self.select(offset, limit, **filters)
+        return total, self.table.to_records(indices)
 
 class LeaderboardService:
+    _instance: Optional['LeaderboardService'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LeaderboardService, cls).__new__(cls)
+        return cls._instance
 
     def __init__(self):
-        self.model_service = ModelService()
-        self.cached_raw_data = None
-        self.last_cache_update = 0
-        self.cache_ttl = cache_config.cache_ttl.total_seconds()
-        pass
+        if not hasattr(self, '_init_done'):
+            self.model_service = ModelService()
+            self.refresh_interval = LEADERBOARD_REFRESH_INTERVAL
+            self._snapshot: Optional[LeaderboardSnapshot] = None
+            self._refresh_task: Optional[asyncio.Task] = None
+            self.hub_lookup_cache = HubLookupCache(cache_config.hub_lookups_file, HUB_LOOKUP_TTL)
+            self.result_manifest = FileManifest()
+            self._eval_results: Dict[str, EvalResult] = {}
+            self.change_history = ChangeHistory(LEADERBOARD_HISTORY_SIZE)
+            self.snapshot_store = VersionedSnapshotStore(cache_config.snapshots_dir, "leaderboard")
+            self._init_done = True
+
+    @property
+    def snapshot(self) -> Optional[LeaderboardSnapshot]:
+        """Last complete snapshot, or None before the first build"""
+        return self._snapshot
 
-    async def get_raw_eval_results(self, results_path: str, requests_path: str) -> list[EvalResult]:
-        """From the path of the results folder root, extract all needed info for results"""
+    @staticmethod
+    def _list_result_files(results_path: str) -> List[str]:
+        """List result files to ingest, oldest first within each model folder"""
         model_result_filepaths = []
 
-        for root, _, files in os.walk(results_path):
-            #FIXME We will remove this check when results we be homogeneous
-            folderName = "clearML-sprint1.5"
+        campaigns = set(RESULTS_CAMPAIGNS)
+        for root, dirs, files in os.walk(results_path):
+            # Walk in a stable order so results are merged deterministically
+            dirs.sort()
 
+            #FIXME We will remove this check when results we be homogeneous
             normalized_root = os.path.normpath(root)
             path_components = normalized_root.split(os.sep)
-            if folderName in path_components:
+            if campaigns.intersection(path_components):
                 # We should only have json files in model results
                 if len(files) == 0 or any([not f.endswith(".json") for f in files]):
                     continue
      
                 # Sort the files by date
                 try:
-                    files.sort(key=lambda x: x.removesuffix(".json").removeprefix("results_")[:-7])
+                    files.sort(key=result_file_date)
                 except dateutil.parser._parser.ParserError:
                     files = [files[-1]]
      
                 for file in files:
                     model_result_filepaths.append(os.path.join(root, file))
 
-        eval_results = {}
+        return model_result_filepaths
+
+    async def get_raw_eval_results(self, results_path: str, requests_path: str) -> list[EvalResult]:
+        """From the path of the results folder root, extract all needed info for results"""
+        model_result_filepaths = await run_cpu(self._list_result_files, results_path)
+        parsed = {}
+        if RESULTS_LATEST_ONLY:
+            model_result_filepaths, parsed = await self._select_latest_results(model_result_filepaths)
+
+        # Only parse files that were added or changed since the last refresh
+        changes = await run_cpu(self.result_manifest.scan, model_result_filepaths)
+        to_parse = changes.added + changes.changed
+        stats = {
+            "Total_Files": len(model_result_filepaths),
+            "Added": len(changes.added),
+            "Changed": len(changes.changed),
+            "Removed": len(changes.removed)
+        }
+        for line in LogFormatter.stats(stats, "Result Files"):
+            logger.info(line)
+
+        # Parse before touching the manifest so a failure leaves it consistent
+        unparsed = [path for path in to_parse if path not in parsed]
+        parsed.update(zip(unparsed, await self._parse_result_files(unparsed)))
+        parsed_results = [parsed[path] for path in to_parse]
+
+        affected = set()
+        for path in changes.changed + changes.removed:
+            affected.add(self.result_manifest.get(path).payload.eval_name)
+        for path in changes.removed:
+            self.result_manifest.remove(path)
+        for path, eval_result in zip(to_parse, parsed_results):
+            self.result_manifest.record(path, eval_result)
+            affected.add(eval_result.eval_name)
+
+        # Group contributions by eval, in file order, without re-parsing anything
+        contributions = {}
+        for path in model_result_filepaths:
+            eval_result = self.result_manifest.get(path).payload
+            contributions.setdefault(eval_result.eval_name, []).append(eval_result)
+
+        # Re-merge only the evals touched by the changes
+        for eval_name in affected:
+            merged = self._merge_contributions(contributions.get(eval_name, []))
+            if merged is None:
+                self._eval_results.pop(eval_name, None)
+            else:
+                self._eval_results[eval_name] = merged
+
+        # Work on copies so the previous snapshot is never mutated while it is served
+        eval_results = [
+            dataclasses.replace(self._eval_results[eval_name])
+            for eval_name in contributions if eval_name in self._eval_results
+        ]
+        await self._resolve_hub_info(eval_results)
+
         await self.model_service.initialize()
-        for model_result_filepath in model_result_filepaths:
-            # Creation of result
-            eval_result = EvalResult.init_from_json_file(model_result_filepath)
-            existing_models = await self.model_service.get_models()
-            eval_result.update_with_request_file(existing_models)
-
-            # Store results of same eval together
-            if(eval_result.display):
-                eval_name = eval_result.eval_name
-                if eval_name in eval_results.keys():
-                    eval_results[eval_name].results.update({k: v for k, v in eval_result.results.items() if v is not None})
-                else:
-                    eval_results[eval_name] = eval_result
-
-        return eval_results.values()
-
-        
-    async def fetch_raw_data(self) -> List[EvalResult]:
+        request_index = await self.model_service.get_request_index()
+        for eval_result in eval_results:
+            eval_result.update_with_request_file(request_index)
+
+        return eval_results
+
+    async def _select_latest_results(self, filepaths: List[str]) -> Tuple[List[str], Dict[str, EvalResult]]:
+        """Newest result file of each model folder, plus older ones while it lacks a task
+
+        Runs are picked from the file name timestamps, so only the newest file
+        of a folder is opened, and older ones only until every task of the
+        newest run's model and precision is covered by runs the merge keeps
+        (hidden runs are dropped by the merge). Returns the selected
+        files, still oldest first within a folder so the merge is unchanged,
+        and the results parsed while selecting.
+        """
+        folders: Dict[str, List[str]] = {}
+        for path in filepaths:
+            folders.setdefault(os.path.dirname(path), []).append(path)
+
+        tasks = {task.value.benchmark for task in Tasks}
+        parsed: Dict[str, EvalResult] = {}
+        selected = {folder: [files[-1]] for folder, files in folders.items()}
+        newest: Dict[str, EvalResult] = {}
+        covered: Dict[str, set] = {folder: set() for folder in folders}
+
+        pending = list(folders)
+        while pending:
+            # Parse the oldest selected file of each folder still lacking tasks, reusing unchanged results
+            paths = [selected[folder][0] for folder in pending]
+            for path in paths:
+                cached = self.result_manifest.cached(path)
+                if cached is not None:
+                    parsed[path] = cached
+            unparsed = [path for path in paths if path not in parsed]
+            parsed.update(zip(unparsed, await self._parse_result_files(unparsed)))
+
+            still_pending = []
+            for folder, path in zip(pending, paths):
+                eval_result = parsed[path]
+                newest.setdefault(folder, eval_result)
+                # Only files the merge keeps override older ones, hidden runs cover nothing
+                if eval_result.display and eval_result.eval_name == newest[folder].eval_name:
+                    covered[folder].update(eval_result.results)
+                older = len(folders[folder]) - len(selected[folder])
+                if older and not tasks <= covered[folder]:
+                    selected[folder].insert(0, folders[folder][older - 1])
+                    still_pending.append(folder)
+            pending = still_pending
+
+        selected_paths = [path for folder in folders for path in selected[folder]]
+        stats = {
+            "Models": len(folders),
+            "Selected": len(selected_paths),
+            "Skipped": len(filepaths) - len(selected_paths)
+        }
+        for line in LogFormatter.stats(stats, "Latest Result Files"):
+            logger.info(line)
+        return selected_paths, parsed
 
-        # Check if cache needs refresh
-        current_time = time.time()
-        cache_age = current_time - self.last_cache_update
-        if not self.cached_raw_data:
-            return await self._refresh_raw_data()
-        elif cache_age > self.cache_ttl:
-            return await self._refresh_raw_data()
-        else:
-            return self.cached_raw_data
+    @staticmethod
+    def _merge_contributions(contributions: List[EvalResult]) -> Optional[EvalResult]:
+        """Store results of same eval together, later files overriding earlier ones"""
+        merged = None
+        for eval_result in contributions:
+            if not eval_result.display:
+                continue
+            if merged is None:
+                merged = dataclasses.replace(eval_result, results=dict(eval_result.results))
+            else:
+                merged.results.update({k: v for k, v in eval_result.results.items() if v is not None})
+        return merged
+
+    async def _parse_result_files(self, filepaths: List[str]) -> List[EvalResult]:
+        """Parse result files, fanning out to a process pool when INGESTION_WORKERS > 1
+
+        Results are returned in the order of filepaths whatever the mode, so that
+        the merge of contributions is deterministic.
+        """
+        if INGESTION_WORKERS <= 1 or len(filepaths) <= 1:
+            return await run_cpu(_parse_result_files, filepaths)
+
+        executor = get_parse_executor()
+        chunksize = max(1, len(filepaths) // (INGESTION_WORKERS * 4))
+        chunks = [filepaths[i:i + chunksize] for i in range(0, len(filepaths), chunksize)]
+        logger.info(LogFormatter.info(f"Parsing {len(filepaths):,} result files with {INGESTION_WORKERS} processes"))
+        parsed_chunks = await asyncio.gather(*(run_in(executor, _parse_result_files, chunk) for chunk in chunks))
+        return [eval_result for chunk in parsed_chunks for eval_result in chunk]
+
+    async def _resolve_hub_info(self, eval_results: List[EvalResult]):
+        """Fill still_on_hub and architecture from the lookup cache, checking misses on the hub"""
+        # The cache file is read and written off the event loop
+        await run_cpu(self.hub_lookup_cache.load)
+        lookups = {}
+        misses = set()
+        for eval_result in eval_results:
+            key = (eval_result.full_model, eval_result.revision or "main")
+            if key in lookups or key in misses:
+                continue
+            entry = self.hub_lookup_cache.get(*key)
+            if entry is None:
+                misses.add(key)
+            else:
+                lookups[key] = entry
+
+        if misses:
+            logger.info(LogFormatter.info(f"Checking {len(misses):,} models on the hub ({len(lookups):,} cached)"))
+            semaphore = asyncio.Semaphore(HUB_LOOKUP_CONCURRENCY)
+
+            async def lookup(model: str, sha: str):
+                async with semaphore:
+                    still_on_hub, _, model_config = await run_hub_io(
+                        is_model_on_hub, model, sha, trust_remote_code=True, test_tokenizer=False
+                    )
+                architecture = get_architecture(model_config)
+                self.hub_lookup_cache.set(model, sha, still_on_hub, architecture)
+                # Not read back from the cache, which may expire it at once
+                lookups[(model, sha)] = {"still_on_hub": still_on_hub, "architecture": architecture}
+
+            await asyncio.gather(*(lookup(model, sha) for model, sha in misses))
+            await run_cpu(self.hub_lookup_cache.save)
+
+        for eval_result in eval_results:
+            entry = lookups[(eval_result.full_model, eval_result.revision or "main")]
+            eval_result.still_on_hub = entry["still_on_hub"]
+            eval_result.architecture = entry["architecture"]
+
+    async def get_snapshot(self) -> LeaderboardSnapshot:
+        """Return the current snapshot, building the first one if needed
+
+        Followers never build one: until the leader publishes its first
+        snapshot they raise AwaitingLeader.
+        """
+        if self._snapshot is None and not leader_election.is_leader():
+            await self._follow_published_snapshot()
+            if self._snapshot is None:
+                raise AwaitingLeader("Leaderboard snapshot")
+        if self._snapshot is None:
+            # Joins the background refresher if it is already building the first snapshot
+            await self._refresh_raw_data()
+        return self._snapshot
+
+    async def fetch_raw_data(self) -> List[EvalResult]:
+        """Get raw leaderboard data from the current snapshot"""
+        snapshot = await self.get_snapshot()
+        return await run_cpu(list, snapshot.eval_results())
+
+    def start_background_refresh(self):
+        """Start the task rebuilding the snapshot every refresh_interval seconds"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+            logger.info(LogFormatter.info(f"Leaderboard background refresh started (every {self.refresh_interval}s)"))
+
+    async def stop_background_refresh(self):
+        """Cancel the background refresh task"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+            logger.info(LogFormatter.info("Leaderboard background refresh stopped"))
+
+    async def _background_refresh(self):
+        """Rebuild the snapshot on a schedule, keeping the last good one on failure
+
+        In shared mode only the leader rebuilds; the other workers follow the
+        snapshots it publishes and take over if it goes away.
+        """
+        while True:
+            interval = self.refresh_interval
+            try:
+                with background_hub_calls():
+                    if leader_election.is_leader():
+                        await self._refresh_raw_data()
+                    else:
+                        interval = SHARED_SNAPSHOT_POLL_INTERVAL
+                        await self._follow_published_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(LogFormatter.error("Background leaderboard refresh failed, serving previous snapshot", e))
+            await asyncio.sleep(interval)
 
     async def _refresh_raw_data(self) -> List[EvalResult]:
-        """Fetch raw leaderboard data from HuggingFace dataset"""
-        try:
-            logger.info(LogFormatter.section("FETCHING LEADERBOARD DATA"))
-            logger.info(LogFormatter.info(f"Loading dataset from {HF_ORGANIZATION}/contents"))
-            print("GETTING FROM %s" % HF_ORGANIZATION)
+        """Rebuild the snapshot, coalescing concurrent callers into a single refresh"""
+        return await single_flight.do("leaderboard.refresh", self._build_snapshot)
 
-            snapshot_download(
+    async def _download_results(self):
+        """Fetch the results repo files ingestion reads into RESULTS_CACHE, not the whole repo"""
+        from huggingface_hub import snapshot_download, hf_hub_download, list_repo_files
+
+        patterns = [f"*/{campaign}/*.json" for campaign in RESULTS_CAMPAIGNS]
+        if not RESULTS_DOWNLOAD_LATEST_ONLY:
+            await run_hub_io(
+                snapshot_download,
                 repo_id=RESULTS_REPO,
                 local_dir=RESULTS_CACHE,
                 repo_type="dataset",
+                allow_patterns=patterns,
                 tqdm_class=None,
                 etag_timeout=30,
                 token=HF_TOKEN,
             )
+            return
+
+        # Listing the repo is a single API call, cheaper than fetching every run
+        files = await run_hub_io(list_repo_files, RESULTS_REPO, repo_type="dataset", token=HF_TOKEN)
+        latest: Dict[str, str] = {}
+        for path in files:
+            if not any(fnmatch.fnmatch(path, pattern) for pattern in patterns):
+                continue
+            folder, filename = posixpath.split(path)
+            if folder not in latest or result_file_date(filename) > result_file_date(posixpath.basename(latest[folder])):
+                latest[folder] = path
+        logger.info(LogFormatter.info(f"Fetching the latest of {len(files):,} files for {len(latest):,} models"))
+
+        # Fetched by exact path: as allow_patterns every path would be matched against
+        # every repo file, and brackets in model names would be read as globs
+        await asyncio.gather(*(
+            run_hub_io(
+                hf_hub_download,
+                repo_id=RESULTS_REPO,
+                filename=path,
+                local_dir=RESULTS_CACHE,
+                repo_type="dataset",
+                etag_timeout=30,
+                token=HF_TOKEN,
+            )
+            for path in sorted(latest.values())
+        ))
+
+    async def _build_snapshot(self) -> List[EvalResult]:
+        """Fetch raw leaderboard data from HuggingFace dataset and swap in a new snapshot"""
+        try:
+            logger.info(LogFormatter.section("FETCHING LEADERBOARD DATA"))
+            logger.info(LogFormatter.info(f"Loading dataset from {HF_ORGANIZATION}/contents"))
+            print("GETTING FROM %s" % HF_ORGANIZATION)
+
+            await self._download_results()
 
             data = await self.get_raw_eval_results(RESULTS_CACHE, EVAL_CACHE)
+            previous = self._snapshot
+            # Continue from the last published version, so numbering never goes back when
+            # the persisted snapshot could not be restored or another worker took over
+            published = await run_cpu(self.snapshot_store.current)
+            version = max(previous.version if previous else 0, published["version"] if published else 0) + 1
+            snapshot = await run_cpu(self._compile_snapshot, version, data, time.time())
+
+            if previous is not None and previous.raw_payload.etag == snapshot.raw_payload.etag and previous.formatted_payload.etag == snapshot.formatted_payload.etag:
+                logger.info(LogFormatter.info(f"Leaderboard unchanged, keeping snapshot v{previous.version}"))
+                return data
+
+            await self._install_snapshot(snapshot)
+            logger.info(LogFormatter.success(f"Leaderboard snapshot v{version} ready ({len(data):,} entries)"))
+
+            if leader_election.is_leader():
+                try:
+                    await run_cpu(self._publish_snapshot, snapshot)
+                except Exception as e:
+                    logger.warning(LogFormatter.warning(f"Failed to publish leaderboard snapshot: {e}"))
             return data
             
         except Exception as e:
             logger.error(LogFormatter.error("Failed to fetch leaderboard data", e))
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def _install_snapshot(self, snapshot: LeaderboardSnapshot):
+        """Make snapshot the current one, recording its diff with the previous one"""
+        previous = self._snapshot
+        diff = None
+        if previous is not None:
+            diff = await run_cpu(diff_tables, previous.version, snapshot.version, previous.table, snapshot.table)
+
+        # Another snapshot was installed while diffing, it is at least as recent
+        if self._snapshot is not previous:
+            return
+
+        # Swap in the new snapshot with a single assignment so readers
+        # always see either the previous or the new complete snapshot.
+        # The diff is recorded in the same step so history and version agree.
+        if diff is not None:
+            self.change_history.append(diff)
+        self._snapshot = snapshot
+
+    def _compile_snapshot(self, version: int, data: List[EvalResult], created_at: float) -> LeaderboardSnapshot:
+        """Build the table and encoded payloads of a snapshot from parsed results"""
+        table = self._build_table(data)
+        for eval_result, normalized_results in zip(data, table.normalized_results()):
+            eval_result.normalized_results = normalized_results
+        formatted = table.to_records(table.sorted_index("average_score"))
+        return LeaderboardSnapshot(
+            version=version,
+            results=eval_results_to_arrow(data),
+            table=table,
+            # Encode and compress the full responses once per snapshot rather than per request
+            raw_payload=EncodedPayload.render(data),
+            formatted_payload=EncodedPayload.render(formatted),
+            created_at=created_at
+        )
+
+    def _publish_snapshot(self, snapshot: LeaderboardSnapshot):
+        """Write the snapshot for other workers and the next cold start"""
+        self.snapshot_store.publish(
+            snapshot.version,
+            {
+                "results": snapshot.results,
+                "table": snapshot.table.columns,
+                "payloads": payloads_to_arrow({"raw": snapshot.raw_payload, "formatted": snapshot.formatted_payload}),
+            },
+            {"created_at": snapshot.created_at}
+        )
+
+    def _load_published_snapshot(self, newer_than: int = 0) -> Optional[LeaderboardSnapshot]:
+        """Map the published snapshot if its version is above newer_than
+
+        Nothing is rebuilt: the results, table and payloads are served from the
+        mapped files, shared through the page cache by every worker.
+        """
+        from app.services.leaderboard_table import LeaderboardTable
+
+        pointer = self.snapshot_store.current()
+        if pointer is None or pointer["version"] <= newer_than:
+            return None
+        loaded = self.snapshot_store.load(pointer)
+        if loaded is None:
+            return None
+        pointer, parts = loaded
+        payloads = payloads_from_arrow(parts["payloads"])
+        return LeaderboardSnapshot(
+            version=pointer["version"],
+            results=parts["results"],
+            table=LeaderboardTable(parts["table"], EVALUATIONS),
+            raw_payload=payloads["raw"],
+            formatted_payload=payloads["formatted"],
+            created_at=pointer["created_at"]
+        )
+
+    async def _follow_published_snapshot(self):
+        """Switch to the snapshot published by the leader when its version changes"""
+        current_version = self._snapshot.version if self._snapshot else 0
+        snapshot = await run_cpu(self._load_published_snapshot, current_version)
+        if snapshot is not None:
+            await self._install_snapshot(snapshot)
+            logger.info(LogFormatter.success(f"Switched to published leaderboard snapshot v{snapshot.version}"))
+
+    async def restore_snapshot(self) -> bool:
+        """Serve the snapshot published by the previous run until the next refresh replaces it"""
+        if self._snapshot is not None:
+            return False
+        try:
+            start = time.perf_counter()
+            snapshot = await run_cpu(self._load_published_snapshot)
+            if snapshot is None:
+                logger.info(LogFormatter.info("No persisted leaderboard snapshot, building from scratch"))
+                return False
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Failed to restore leaderboard snapshot: {e}"))
+            return False
+
+        # A refresh may have completed in the meantime
+        if self._snapshot is not None:
+            return False
+        self._snapshot = snapshot
+        age = time.time() - snapshot.created_at
+        logger.info(LogFormatter.success(
+            f"Restored leaderboard snapshot v{snapshot.version} ({len(snapshot):,} entries, {age:.0f}s old) "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        ))
+        return True
+
     async def get_formatted_data(self) -> List[Dict[str, Any]]:
-        """Get formatted leaderboard data"""
+        """Get formatted leaderboard data from the current snapshot"""
+        snapshot = await self.get_snapshot()
+        return await run_cpu(list, snapshot.records())
+
+    async def get_changes(self, since: int) -> Dict[str, Any]:
+        """Formatted rows added, updated or removed since a snapshot version
+
+        Rows carry their source fields only (see source_record), clients
+        recompute ranks and percentiles. When the version is no longer covered
+        by the history, all rows are returned as added with reset set, and
+        clients replace their copy.
+        """
+        snapshot = await self.get_snapshot()
+        diff = self.change_history.since(since, snapshot.version)
+        if diff is None:
+            logger.info(LogFormatter.info(f"Version {since} not in change history, sending full leaderboard"))
+            return {
+                "version": snapshot.version,
+                "since": since,
+                "reset": True,
+                "added": await run_cpu(list, map(source_record, snapshot.records())),
+                "updated": [],
+                "removed": [],
+            }
+        return {"version": snapshot.version, "since": since, "reset": False, **diff.to_dict()}
+
+    def _build_table(self, raw_data: List[EvalResult]) -> "LeaderboardTable":
+        """Build the columnar leaderboard table from raw results"""
+        from app.services.leaderboard_table import LeaderboardTable
+
         try:
             logger.info(LogFormatter.section("FORMATTING LEADERBOARD DATA"))
-            
-            raw_data = await self.fetch_raw_data()
-            formatted_data = []
-            type_counts = {}
-            error_count = 0
-            
-            # Initialize progress tracking
-            total_items = len(raw_data)
-            logger.info(LogFormatter.info(f"Processing {total_items:,} entries..."))
-            
-            for i, item in enumerate(raw_data, 1):
-                try:
-                    formatted_item = await self.transform_data(item)
-                    formatted_data.append(formatted_item)
-                    
-                    # Count model types
-                    model_type = formatted_item["model"]["type"]
-                    type_counts[model_type] = type_counts.get(model_type, 0) + 1
-                    
-                except Exception as e:
-                    error_count += 1
-                    logger.error(LogFormatter.error(f"Failed to format entry {i}/{total_items}", e))
-                    continue
-                
-                # Log progress every 10%
-                if i % max(1, total_items // 10) == 0:
-                    progress = (i / total_items) * 100
-                    logger.info(LogFormatter.info(f"Progress: {LogFormatter.progress_bar(i, total_items)}"))
-            
+            logger.info(LogFormatter.info(f"Processing {len(raw_data):,} entries..."))
+
+            table = LeaderboardTable.from_results(raw_data, EVALUATIONS, RANDOM_BASELINES)
+
             # Log final statistics
             stats = {
-                "Total_Processed": total_items,
-                "Successful": len(formatted_data),
-                "Failed": error_count
+                "Total_Processed": len(raw_data),
+                "Successful": len(table)
             }
             logger.info(LogFormatter.section("PROCESSING SUMMARY"))
             for line in LogFormatter.stats(stats, "Processing Statistics"):
                 logger.info(line)
-            
-            # Log model type distribution
-            type_stats = {f"Type_{k}": v for k, v in type_counts.items()}
-            logger.info(LogFormatter.subsection("MODEL TYPE DISTRIBUTION"))
-            for line in LogFormatter.stats(type_stats):
-                logger.info(line)
-                
-            return formatted_data
-            
-        except Exception as e:
-            logger.error(LogFormatter.error("Failed to format leaderboard data", e))
-            raise HTTPException(status_code=500, detail=str(e))
 
-    async def transform_data(self, data: EvalResult) -> Dict[str, Any]:
-        """Transform raw data into the format expected by the frontend"""
-        try:
-            # Extract model name for logging
-            model_name = data.full_model
-            logger.debug(LogFormatter.info(f"Transforming data for model: {model_name}"))
-            
-            # Create unique ID combining model name, precision, sha and chat template status
-            unique_id = f"{data.full_model}_{data.precision}" # FIXME missing _{data.get('Model sha', 'Unknown')}_{str(data.get('Chat Template', False))}"
-
-            evaluations = {
-                "ifeval_fr": {
-                    "name": "IFEval FR",
-                    "value": data.results.get("community|ifeval-fr|0", 0),
-                    "normalized_score": data.normalized_results.get("community|ifeval-fr|0", 0),
-                },
-                "gpqa_fr": {
-                    "name": "GPQA FR",
-                    "value": data.results.get("community|gpqa-fr|0", 0),
-                    "normalized_score": data.normalized_results.get("community|gpqa-fr|0", 0), 
-                },
-                "bac_fr": {
-                    "name": "BAC FR",
-                    "value": data.results.get("community|bac-fr|0", 0),
-                    "normalized_score": data.normalized_results.get("community|bac-fr|0", 0)
-                }
-            }
+            # Log model type distribution
+            type_stats = {f"Type_{k}": v for k, v in table.type_counts().items()}
+            if type_stats:
+                logger.info(LogFormatter.subsection("MODEL TYPE DISTRIBUTION"))
+                for line in LogFormatter.stats(type_stats):
+                    logger.info(line)
 
-            features = { }
-
-            # FIXME
-            #    "is_not_available_on_hub": data.get("Available on the hub", False),
-            #    "is_merged": data.get("Merged", False),
-            #    "is_moe": data.get("MoE", False),
-            #    "is_flagged": data.get("Flagged", False),
-            #    "is_official_provider": data.get("Official Providers", False)
-            #}
-
-            metadata = { }
-
-            # FIXME
-            #    "upload_date": data.get("Upload To Hub Date"),
-            #    "submission_date": data.get("Submission Date"),
-            #    "generation": data.get("Generation"),
-            #    "base_model": data.get("Base Model"),
-            #    "hub_license": data.get("Hub License"),
-            #    "hub_hearts": data.get("Hub ❤️"),
-            #    "params_billions": data.get("#Params (B)"),
-            #    "co2_cost": data.get("CO₂ cost (kg)", 0)
-            #}
-
-            # Clean model type by removing emojis if present
-            model_type = data.model_type
-
-            # FIXME
-            # Map old model types to new ones
-            #model_type_mapping = {
-            #    "fine-tuned": "fined-tuned-on-domain-specific-dataset",
-            #    "fine tuned": "fined-tuned-on-domain-specific-dataset",
-            #    "finetuned": "fined-tuned-on-domain-specific-dataset",
-            #    "fine_tuned": "fined-tuned-on-domain-specific-dataset",
-            #    "ft": "fined-tuned-on-domain-specific-dataset",
-            #    "finetuning": "fined-tuned-on-domain-specific-dataset",
-            #    "fine tuning": "fined-tuned-on-domain-specific-dataset",
-            #    "fine-tuning": "fined-tuned-on-domain-specific-dataset"
-            #}
-
-            #mapped_type = model_type_mapping.get(model_type.lower().strip(), model_type)
-
-            #if mapped_type != model_type:
-            #    logger.debug(LogFormatter.info(f"Model type mapped: {model_type} -> {mapped_type}"))
-            
-            transformed_data = {
-                "id": unique_id,
-                "model": {
-                    "name": data.full_model,
-                    "sha": "", # FIXME data.get("Model sha"),
-                    "precision": data.precision.name,
-                    "type": model_type.to_str(),
-                    "weight_type": data.weight_type.name,
-                    "architecture": data.architecture,
-                    "average_score": sum([v for v in data.results.values() if v is not None]) / len(Tasks),
-                    "has_chat_template": False, # FIXME data.get("Chat Template", False),
-                },
-                "evaluations": evaluations,
-                "features": features,
-                "metadata": metadata
-            }
+            return table
 
-            logger.debug(LogFormatter.success(f"Successfully transformed data for {model_name}"))
-            return transformed_data
-            
         except Exception as e:
-            logger.error(LogFormatter.error(f"Failed to transform data for {data.full_model}", e))
-            raise
+            logger.error(LogFormatter.error("Failed to format leaderboard data", e))
+            raise HTTPException(status_code=500, detail=str(e))
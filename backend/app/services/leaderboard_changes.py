@@ -0,0 +1,127 @@
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from app.services.leaderboard_table import LeaderboardTable
+
+@dataclass
+class LeaderboardDiff:
+    """Formatted rows added, updated or removed between two snapshot versions"""
+    from_version: int
+    to_version: int
+    added: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    updated: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": list(self.added.values()),
+            "updated": list(self.updated.values()),
+            "removed": self.removed,
+        }
+
+def source_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Formatted row without its ranks and percentiles
+
+    Those are derived from the scores of every other model, so one added
+    model changes them on almost every row. Diffs compare and carry only the
+    source fields, and clients recompute ranks and percentiles from the scores.
+    """
+    model = {key: value for key, value in record["model"].items() if key != "rank"}
+    evaluations = {
+        key: {field: value for field, value in evaluation.items() if field not in ("rank", "percentile")}
+        for key, evaluation in record["evaluations"].items()
+    }
+    return {**record, "model": model, "evaluations": evaluations}
+
+def diff_tables(
+    from_version: int,
+    to_version: int,
+    old_table: "LeaderboardTable",
+    new_table: "LeaderboardTable"
+) -> LeaderboardDiff:
+    """Compare the source fields of two leaderboard tables by row id
+
+    Rows are compared through the fingerprint of their source fields, so only
+    the added and updated rows are projected, best average first.
+    """
+    old_fingerprints = dict(zip(old_table.ids(), old_table.fingerprints().tolist()))
+    ids = new_table.ids()
+    fingerprints = new_table.fingerprints().tolist()
+    diff = LeaderboardDiff(from_version, to_version)
+
+    changed = [i for i in new_table.sorted_index("average_score").tolist() if old_fingerprints.get(ids[i]) != fingerprints[i]]
+    for record in map(source_record, new_table.iter_records(changed)):
+        if record["id"] in old_fingerprints:
+            diff.updated[record["id"]] = record
+        else:
+            diff.added[record["id"]] = record
+
+    new_ids = set(ids)
+    diff.removed = [record_id for record_id in old_fingerprints if record_id not in new_ids]
+    return diff
+
+class ChangeHistory:
+    """Bounded history of consecutive snapshot diffs
+
+    Diffs are folded on demand into the net change since a given version. Once
+    a version falls out of the history, clients have to reload the full table.
+    """
+
+    def __init__(self, maxlen: int):
+        self._diffs: Deque[LeaderboardDiff] = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        return len(self._diffs)
+
+    @property
+    def oldest_version(self) -> Optional[int]:
+        return self._diffs[0].from_version if self._diffs else None
+
+    def append(self, diff: LeaderboardDiff):
+        if self._diffs and self._diffs[-1].to_version != diff.from_version:
+            # A gap in the chain makes older diffs unusable
+            self._diffs.clear()
+        self._diffs.append(diff)
+
+    def since(self, version: int, current_version: int) -> Optional[LeaderboardDiff]:
+        """Net change from version to current_version, None if version is not covered
+
+        Only versions a diff starts from are covered: followers may record a
+        diff spanning several versions, and a version inside it has no known
+        content to diff from.
+        """
+        if version == current_version:
+            return LeaderboardDiff(version, current_version)
+        if not self._diffs or self._diffs[-1].to_version != current_version:
+            return None
+        start = next((i for i, diff in enumerate(self._diffs) if diff.from_version == version), None)
+        if start is None:
+            return None
+
+        net = LeaderboardDiff(version, current_version)
+        removed = set()
+        for diff in list(self._diffs)[start:]:
+            for record_id, record in diff.added.items():
+                if record_id in removed:
+                    # Removed then re-added: the client still has the old row
+                    removed.discard(record_id)
+                    net.updated[record_id] = record
+                else:
+                    net.added[record_id] = record
+            for record_id, record in diff.updated.items():
+                if record_id in net.added:
+                    net.added[record_id] = record
+                else:
+                    net.updated[record_id] = record
+            for record_id in diff.removed:
+                if net.added.pop(record_id, None) is None:
+                    net.updated.pop(record_id, None)
+                    removed.add(record_id)
+
+        net.removed = sorted(removed)
+        return net
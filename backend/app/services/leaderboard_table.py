@@ -0,0 +1,343 @@
+import bisect
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+import pyarrow as pa
+from app.services.leaderboard_changes import source_record
+
+# Rows projected at a time when formatted rows are iterated
+RECORD_BATCH_SIZE = 1000
+# Numeric column types and their numpy equivalents
+_NUMPY_TYPES = {pa.int32(): np.int32, pa.int64(): np.int64, pa.float64(): np.float64}
+
+def rank_descending(values: np.ndarray) -> np.ndarray:
+    """Competition ranks per column (1 = best, ties share the best rank), NaN where a value is missing"""
+    ranks = np.full(values.shape, np.nan)
+    negated = -values
+    # NaN sorts last, so the valid values form a sorted prefix of each column
+    sorted_negated = np.sort(negated, axis=0)
+    for j in range(values.shape[1]):
+        valid = ~np.isnan(values[:, j])
+        ranks[valid, j] = np.searchsorted(sorted_negated[:, j], negated[valid, j], side="left") + 1
+    return ranks
+
+def rank_percentiles(ranks: np.ndarray) -> np.ndarray:
+    """Share of ranked models a model beats or ties with, from 0 (last) to 100 (first)"""
+    counts = np.sum(~np.isnan(ranks), axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        percentiles = np.where(counts > 1, (counts - ranks) / (counts - 1) * 100.0, 100.0)
+    return np.where(np.isnan(ranks), np.nan, percentiles)
+
+def _array(column: pa.ChunkedArray) -> pa.Array:
+    """Single array of a column, without copying when it holds one chunk"""
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+def _numpy(array: pa.Array) -> np.ndarray:
+    """Read-only numpy view on the values buffer of a numeric array without nulls
+
+    Array.to_numpy would import pandas on first use, seconds and tens of MB in every worker.
+    """
+    dtype = np.dtype(_NUMPY_TYPES[array.type])
+    buffer = array.buffers()[1]
+    if buffer is None:
+        return np.empty(0, dtype)
+    values = np.frombuffer(buffer, dtype, count=len(array), offset=array.offset * dtype.itemsize)
+    values.flags.writeable = False
+    return values
+
+def _from_numpy(values: np.ndarray) -> pa.Array:
+    """Arrow array over the buffer of a numeric numpy array, without copying it
+
+    Unlike pa.array, it does not import pandas, which followers never load.
+    """
+    values = np.ascontiguousarray(values)
+    return pa.Array.from_buffers(pa.from_numpy_dtype(values.dtype), len(values), [None, pa.py_buffer(values)])
+
+def _values(column: pa.ChunkedArray) -> np.ndarray:
+    """Numeric column as a read-only numpy view on its Arrow buffer"""
+    return _numpy(_array(column))
+
+def _order_column(key: str, descending: bool) -> str:
+    return f"order.{key}.{'desc' if descending else 'asc'}"
+
+def _fingerprint(record: Dict[str, Any]) -> int:
+    """Hash of the source fields of a formatted row, equal for rows a diff treats as unchanged"""
+    digest = hashlib.blake2b(repr(source_record(record)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+class _SortedStrings:
+    """Sequence view of a sorted Arrow string array, for bisect"""
+
+    def __init__(self, array: pa.Array):
+        self.array = array
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, i: int) -> str:
+        return self.array[i].as_py()
+
+class LeaderboardTable:
+    """Columnar leaderboard: one row per evaluated model and one score column per task
+
+    Scores, averages, ranks and percentiles, the sort orders and the name
+    prefix index are computed over whole columns at build time and held as
+    Arrow columns. A table mapped from a published snapshot is served from the
+    mapped buffers as is: numeric columns are numpy views on them, and
+    formatted rows are projected from the columns, in batches, when requested.
+    """
+
+    # Columns formatted rows are projected from, besides the per-evaluation ones
+    RECORD_COLUMNS = [
+        "id", "name", "precision", "type", "weight_type", "architecture", "average_score", "rank",
+        "submission_date", "license", "likes", "params",
+    ]
+    EVALUATION_COLUMNS = ["value", "normalized_score", "rank", "percentile"]
+
+    def __init__(self, columns: pa.Table, evaluations: List[Tuple[str, str, str]]):
+        """Wrap the columns built by from_results, e.g. mapped from a published snapshot"""
+        self.evaluations = evaluations
+        missing = [name for name in self._required_columns() if name not in columns.column_names]
+        if missing:
+            raise ValueError(f"Leaderboard table lacks columns: {', '.join(missing)}")
+        self.columns = columns
+        self.size = columns.num_rows
+        self.average = _values(columns.column("average_score"))
+        self.params = _values(columns.column("params"))
+        self.normalized = {key: _values(columns.column(f"{key}.normalized_score")) for key, _, _ in evaluations}
+        self._record_columns = columns.select(
+            self.RECORD_COLUMNS + [f"{key}.{field}" for key, _, _ in evaluations for field in self.EVALUATION_COLUMNS]
+        )
+
+    @classmethod
+    def from_results(
+        cls,
+        eval_results: List[Any],
+        evaluations: List[Tuple[str, str, str]],
+        baselines: Optional[Dict[str, float]] = None
+    ) -> "LeaderboardTable":
+        """Build the table from EvalResults
+
+        Evaluations are (key, display name, benchmark) tuples; baselines give
+        the random-guess score of a benchmark, 0 when missing.
+        """
+        size = len(eval_results)
+        num_tasks = len(evaluations)
+        names = [r.full_model for r in eval_results]
+        dates = [r.date for r in eval_results]
+        likes = np.array([r.likes or 0 for r in eval_results], dtype=np.int64)
+        params = np.array([r.num_params or 0 for r in eval_results], dtype=np.float64)
+
+        # Score columns, NaN where a task is missing (None also converts to NaN)
+        raw = np.full((size, num_tasks), np.nan)
+        for j, (_, _, benchmark) in enumerate(evaluations):
+            raw[:, j] = [r.results.get(benchmark, np.nan) for r in eval_results]
+        # Normalized scores rescale each task from its random baseline to 100, floored at 0
+        task_baselines = np.array([(baselines or {}).get(benchmark, 0.0) for _, _, benchmark in evaluations])
+        normalized = np.maximum(raw - task_baselines, 0.0) * (100.0 / (100.0 - task_baselines))
+
+        # Derived columns
+        average = np.nansum(raw, axis=1) / num_tasks if num_tasks else np.zeros(size)
+        task_ranks = rank_descending(normalized)
+        task_percentiles = np.round(rank_percentiles(task_ranks), 2)
+        rank = rank_descending(average[:, None])[:, 0]
+
+        columns = {
+            "id": pa.array([f"{r.full_model}_{r.precision}" for r in eval_results], pa.string()),
+            "name": pa.array(names, pa.string()),
+            # Categories are dictionary encoded, filters compare their integer codes
+            "precision": pa.array([r.precision.name for r in eval_results], pa.string()).dictionary_encode(),
+            "type": pa.array([r.model_type.to_str() for r in eval_results], pa.string()).dictionary_encode(),
+            "weight_type": pa.array([r.weight_type.name for r in eval_results], pa.string()).dictionary_encode(),
+            "architecture": pa.array([r.architecture for r in eval_results], pa.string()).dictionary_encode(),
+            "average_score": _from_numpy(average),
+            "rank": _from_numpy(rank.astype(np.int64)),
+            "submission_date": pa.array(dates, pa.string()),
+            "license": pa.array([r.license for r in eval_results], pa.string()),
+            "likes": _from_numpy(likes),
+            "params": _from_numpy(params),
+        }
+        for j, (key, _, _) in enumerate(evaluations):
+            columns[f"{key}.value"] = _from_numpy(raw[:, j])
+            columns[f"{key}.normalized_score"] = _from_numpy(normalized[:, j])
+            columns[f"{key}.rank"] = _from_numpy(task_ranks[:, j])
+            columns[f"{key}.percentile"] = _from_numpy(task_percentiles[:, j])
+
+        # Row orders of every sort key, models missing a score last
+        sort_values = {
+            "average_score": average,
+            "name": np.array([name.lower() for name in names], dtype=object),
+            "params": params,
+            "likes": likes.astype(np.float64),
+            "submission_date": np.array(dates, dtype=object),
+            **{key: normalized[:, j] for j, (key, _, _) in enumerate(evaluations)},
+        }
+        for key, values in sort_values.items():
+            ascending = np.argsort(values, kind="stable")
+            # NaN sorts last in both directions
+            descending = ascending[::-1] if values.dtype == object else np.argsort(-values, kind="stable")
+            columns[_order_column(key, False)] = _from_numpy(ascending.astype(np.int32))
+            columns[_order_column(key, True)] = _from_numpy(descending.astype(np.int32))
+
+        # Names sorted for prefix search, with or without the organization
+        for index, keys in (
+            ("full", [name.lower() for name in names]),
+            ("model", [name.split("/", 1)[-1].lower() for name in names])
+        ):
+            keys = np.array(keys, dtype=object)
+            order = np.argsort(keys, kind="stable")
+            columns[f"prefix.{index}.order"] = _from_numpy(order.astype(np.int32))
+            columns[f"prefix.{index}.names"] = pa.array(keys[order].tolist(), pa.string())
+
+        table = cls(pa.table(columns), evaluations)
+        # Lets diffs find changed rows without projecting the others
+        fingerprints = [_fingerprint(record) for record in table.iter_records(range(size))]
+        table.columns = table.columns.append_column("fingerprint", pa.array(fingerprints, pa.int64()))
+        return table
+
+    def _required_columns(self) -> List[str]:
+        evaluation_keys = [key for key, _, _ in self.evaluations]
+        return (
+            self.RECORD_COLUMNS
+            + [f"{key}.{field}" for key in evaluation_keys for field in self.EVALUATION_COLUMNS]
+            + [_order_column(key, descending) for key in self.sort_keys for descending in (False, True)]
+            + [f"prefix.{index}.{field}" for index in ("full", "model") for field in ("order", "names")]
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def sort_keys(self) -> List[str]:
+        return ["average_score", "name", "params", "likes", "submission_date"] + [key for key, _, _ in self.evaluations]
+
+    def sorted_index(self, key: str, descending: bool = True) -> np.ndarray:
+        """Row indices ordered by key, models missing a score last"""
+        if key not in self.sort_keys:
+            raise ValueError(f"Unknown sort key '{key}', expected one of: {', '.join(self.sort_keys)}")
+        return _values(self.columns.column(_order_column(key, descending)))
+
+    def _category_mask(self, name: str, values: List[str]) -> np.ndarray:
+        """Rows whose category is one of values, compared by dictionary code"""
+        array = _array(self.columns.column(name))
+        wanted = set(values)
+        codes = [code for code, value in enumerate(array.dictionary.to_pylist()) if value in wanted]
+        return np.isin(_numpy(array.indices), codes)
+
+    def _prefix_mask(self, prefix: str) -> np.ndarray:
+        """Rows whose full name or model name (without org) starts with prefix, case-insensitively"""
+        prefix = prefix.lower()
+        mask = np.zeros(self.size, dtype=bool)
+        for index in ("full", "model"):
+            order = _values(self.columns.column(f"prefix.{index}.order"))
+            sorted_names = _SortedStrings(_array(self.columns.column(f"prefix.{index}.names")))
+            start = bisect.bisect_left(sorted_names, prefix)
+            end = bisect.bisect_left(sorted_names, prefix + "\uffff")
+            mask[order[start:end]] = True
+        return mask
+
+    def query(
+        self,
+        sort: str = "average_score",
+        descending: bool = True,
+        model_types: Optional[List[str]] = None,
+        precisions: Optional[List[str]] = None,
+        architectures: Optional[List[str]] = None,
+        min_params: Optional[float] = None,
+        max_params: Optional[float] = None,
+        name_prefix: Optional[str] = None
+    ) -> np.ndarray:
+        """Row indices matching all filters, in sort order"""
+        order = self.sorted_index(sort, descending)
+        mask = np.ones(self.size, dtype=bool)
+        if model_types:
+            mask &= self._category_mask("type", model_types)
+        if precisions:
+            mask &= self._category_mask("precision", precisions)
+        if architectures:
+            mask &= self._category_mask("architecture", architectures)
+        if min_params is not None:
+            mask &= self.params >= min_params
+        if max_params is not None:
+            mask &= self.params <= max_params
+        if name_prefix:
+            mask &= self._prefix_mask(name_prefix)
+        return order[mask[order]]
+
+    def type_counts(self) -> Dict[str, int]:
+        array = _array(self.columns.column("type"))
+        counts = np.bincount(_numpy(array.indices), minlength=len(array.dictionary))
+        return {value: int(count) for value, count in zip(array.dictionary.to_pylist(), counts) if count}
+
+    def normalized_results(self) -> List[Dict[str, float]]:
+        """Normalized score of each task a model has, per row"""
+        benchmarks = [benchmark for _, _, benchmark in self.evaluations]
+        scores = [self.normalized[key].tolist() for key, _, _ in self.evaluations]
+        return [
+            {benchmark: values[i] for benchmark, values in zip(benchmarks, scores) if values[i] == values[i]}
+            for i in range(self.size)
+        ]
+
+    def ids(self) -> List[str]:
+        return self.columns.column("id").to_pylist()
+
+    def fingerprints(self) -> np.ndarray:
+        """Hash of the source fields of each row, see source_record"""
+        return _values(self.columns.column("fingerprint"))
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Formatted row i, in the structure expected by the frontend"""
+        return self.to_records([i])[0]
+
+    def to_records(self, indices: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Formatted rows, for all models or the given row indices"""
+        return list(self.iter_records(range(self.size) if indices is None else indices))
+
+    def iter_records(self, indices: Iterable[int], batch_size: int = RECORD_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Formatted rows of the given row indices, projected from the columns a batch at a time"""
+        indices = np.ascontiguousarray(indices if isinstance(indices, np.ndarray) else list(indices), dtype=np.int64)
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start:start + batch_size]
+            yield from self._project(self._record_columns.take(_from_numpy(batch)).to_pydict())
+
+    def _project(self, columns: Dict[str, List[Any]]) -> Iterator[Dict[str, Any]]:
+        """Formatted rows from projected columns, missing scores as 0 and their ranks as None"""
+        evaluation_columns = [
+            (key, name, *(columns[f"{key}.{field}"] for field in self.EVALUATION_COLUMNS))
+            for key, name, _ in self.evaluations
+        ]
+        for i in range(len(columns["id"])):
+            evaluations = {}
+            for key, name, values, normalized_scores, ranks, percentiles in evaluation_columns:
+                # NaN is the only value not equal to itself
+                value, normalized_score, rank, percentile = values[i], normalized_scores[i], ranks[i], percentiles[i]
+                evaluations[key] = {
+                    "name": name,
+                    "value": 0 if value != value else value,
+                    "normalized_score": 0 if normalized_score != normalized_score else normalized_score,
+                    "rank": None if rank != rank else int(rank),
+                    "percentile": None if percentile != percentile else percentile,
+                }
+
+            yield {
+                "id": columns["id"][i],
+                "model": {
+                    "name": columns["name"][i],
+                    "sha": "", # FIXME revision
+                    "precision": columns["precision"][i],
+                    "type": columns["type"][i],
+                    "weight_type": columns["weight_type"][i],
+                    "architecture": columns["architecture"][i],
+                    "average_score": columns["average_score"][i],
+                    "rank": columns["rank"][i],
+                    "has_chat_template": False, # FIXME
+                },
+                "evaluations": evaluations,
+                "features": {},
+                "metadata": {
+                    "submission_date": columns["submission_date"][i],
+                    "hub_license": columns["license"][i],
+                    "hub_hearts": columns["likes"][i],
+                    "params_billions": columns["params"][i],
+                }
+            }
@@ -1,22 +1,23 @@
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 import json
 import os
 from pathlib import Path
 import logging
-import aiohttp
 import asyncio
 import time
-from huggingface_hub import HfApi, CommitOperationAdd
-from huggingface_hub.utils import build_hf_headers
-from datasets import disable_progress_bar
 import sys
 import contextlib
+import functools
 from concurrent.futures import ThreadPoolExecutor
 import tempfile
+from dataclasses import dataclass
 
 from app.config import (
-    HF_TOKEN
+    HF_TOKEN,
+    DOWNLOAD_CONCURRENCY,
+    DOWNLOAD_MAX_CONCURRENCY,
+    DOWNLOAD_RETRIES,
 )
 from app.config.hf_config import (
     HF_ORGANIZATION,
@@ -27,9 +28,16 @@ from app.utils.model_validation import ModelValidator
 from app.services.votes import VoteService
 from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
+from app.core.singleflight import single_flight
+from app.core.executors import run_hub_io, run_cpu
+from app.core.downloader import AdaptiveDownloader, DownloadError
+from app.core.http_pool import get_http_session
+from app.core.snapshot_store import read_snapshot, write_snapshot
+from app.core.leader import leader_election, AwaitingLeader
+from app.core.hub_scheduler import background_hub_calls
 
-# Disable datasets progress bars globally
-disable_progress_bar()
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +111,129 @@ class ProgressTracker:
         logger.info("="*50)
         sys.stdout.flush()
 
+@functools.lru_cache(maxsize=None)
+def request_schema() -> "pa.Schema":
+    """Arrow schema of the persisted request files, built on first use"""
+    import pyarrow as pa
+    return pa.schema([
+        ("path", pa.string()),
+        ("blob_id", pa.string()),
+        ("status", pa.string()),
+        ("name", pa.string()),
+        ("submitter", pa.string()),
+        ("revision", pa.string()),
+        ("submission_time", pa.string()),
+        ("precision", pa.string()),
+        ("model_type", pa.string()),
+        ("weight_type", pa.string()),
+        # JSON text, so ints and floats come back as they were read and payloads stay byte-identical
+        ("params", pa.string()),
+        ("license", pa.string()),
+        ("likes", pa.int64()),
+        ("job_id", pa.int64()),
+    ])
+
+# Request statuses shown in the queue, and the bucket each one goes to
+STATUS_BUCKETS = {
+    "PENDING": "pending",
+    "RUNNING": "evaluating",
+    "FINISHED": "finished",
+}
+
+@dataclass
+class RequestFile:
+    """A request file of the queue repo at a given blob, and the request read from it"""
+    # None for a file written by this process, not synced yet
+    blob_id: Optional[str]
+    # None when the request is not in a shown status
+    model: Optional[Dict[str, Any]] = None
+    # Model id and status of the request whatever its status, None when the file is not a valid request
+    model_id: Optional[str] = None
+    status: Optional[Dict[str, Any]] = None
+
+def request_files_to_arrow(request_files: Dict[str, RequestFile]) -> "pa.Table":
+    """One row per request file, requests not shown only keeping their path, blob and status"""
+    import pyarrow as pa
+    rows = []
+    for path, request_file in request_files.items():
+        row = {"path": path, "blob_id": request_file.blob_id}
+        if request_file.model is not None:
+            row.update(request_file.model, params=json.dumps(request_file.model["params"]))
+        if request_file.status is not None:
+            row.update(
+                name=request_file.model_id,
+                status=request_file.status["status"],
+                submission_time=request_file.status["submitted_time"],
+                job_id=request_file.status["job_id"],
+            )
+        rows.append(row)
+    return pa.Table.from_pylist(rows, schema=request_schema())
+
+def request_files_from_arrow(table: "pa.Table") -> Dict[str, RequestFile]:
+    """Request files from the table written by request_files_to_arrow"""
+    request_files = {}
+    for row in table.to_pylist():
+        path, blob_id, job_id = row.pop("path"), row.pop("blob_id"), row.pop("job_id")
+        if row["status"] is None:
+            request_files[path] = RequestFile(blob_id)
+            continue
+        status = {"status": row["status"], "submitted_time": row["submission_time"], "job_id": job_id}
+        model = None
+        if row["status"] in STATUS_BUCKETS:
+            row["params"] = json.loads(row["params"])
+            model = row
+        request_files[path] = RequestFile(blob_id, model, row["name"], status)
+    return request_files
+
+def bucket_requests(request_files: Dict[str, RequestFile]) -> Dict[str, List[Dict[str, Any]]]:
+    """Status buckets served by get_models, with wait times as of now"""
+    models = {"finished": [], "evaluating": [], "pending": []}
+    current_time = datetime.now(timezone.utc)
+    for path in sorted(request_files):
+        model = request_files[path].model
+        if model is None:
+            continue
+        model = dict(model)
+        status = model.pop("status")
+        submit_time = datetime.fromisoformat(model["submission_time"].replace("Z", "+00:00"))
+        if submit_time.tzinfo is None:
+            submit_time = submit_time.replace(tzinfo=timezone.utc)
+        model["wait_time"] = f"{(current_time - submit_time).total_seconds():.1f}s"
+        models[STATUS_BUCKETS[status]].append(model)
+    return models
+
+def build_status_index(request_files: Dict[str, RequestFile]) -> Dict[str, Dict[str, Any]]:
+    """Status of each model, from its most recently submitted request"""
+    index = {}
+    for path in sorted(request_files):
+        request_file = request_files[path]
+        if request_file.status is None:
+            continue
+        current = index.get(request_file.model_id)
+        if current is None or request_file.status["submitted_time"] >= current["submitted_time"]:
+            index[request_file.model_id] = request_file.status
+    return index
+
+class RequestIndex:
+    """Hash index of request entries for O(1) joins with evaluation results"""
+
+    def __init__(self, models: Dict[str, List[Dict[str, Any]]]):
+        self.by_revision: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.by_precision: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # Keep the first match in status order, as the former linear scan did
+        for status_models in models.values():
+            for model in status_models:
+                self.by_revision.setdefault((model["name"], model["precision"], model["revision"]), model)
+                self.by_precision.setdefault((model["name"], model["precision"]), model)
+
+    def lookup(self, name: str, precision: str, revision: str = None) -> Optional[Dict[str, Any]]:
+        """Find the request of a model, falling back to any revision with the same precision"""
+        if revision:
+            request = self.by_revision.get((name, precision, revision))
+            if request is not None:
+                return request
+        return self.by_precision.get((name, precision))
+
 class ModelService(HuggingFaceService):
     _instance: Optional['ModelService'] = None
     _initialized = False
@@ -123,153 +254,142 @@ class ModelService(HuggingFaceService):
             logger.info(LogFormatter.info(f"Using eval requests path: {self.eval_requests_path}"))
             
             self.eval_requests_path.parent.mkdir(parents=True, exist_ok=True)
+            from huggingface_hub import HfApi
             self.hf_api = HfApi(token=HF_TOKEN)
             self.cached_models = None
             self.last_cache_update = 0
+            self.cache_generation = 0
+            self._request_index: Optional[RequestIndex] = None
+            self._request_index_generation = -1
+            self._revalidation_task: Optional[asyncio.Task] = None
+            self._persisted_updated_at: Optional[float] = None
+            # Request files of the queue repo by path, as of the last synced commit
+            self._request_files: Dict[str, RequestFile] = {}
+            self._synced_sha: Optional[str] = None
+            # Model id -> status, kept in step with the request files
+            self._status_index: Dict[str, Dict[str, Any]] = {}
             self.cache_ttl = cache_config.cache_ttl.total_seconds()
             self._init_done = True
             logger.info(LogFormatter.success("Initialization complete"))
 
-    async def _download_and_process_file(self, file: str, session: aiohttp.ClientSession, progress: ProgressTracker) -> Optional[Dict]:
-        """Download and process a file asynchronously"""
+    async def _download_request_file(
+        self,
+        file: str,
+        blob_id: str,
+        revision: str,
+        downloader: AdaptiveDownloader,
+        progress: ProgressTracker
+    ) -> Optional[RequestFile]:
+        """Download and process a request file at a revision, None if it could not be downloaded"""
+        from huggingface_hub import hf_hub_url
+        from huggingface_hub.utils import build_hf_headers
         try:
-            # Build file URL
-            url = f"https://huggingface.co/datasets/{QUEUE_REPO}/resolve/main/{file}"
+            # Pin the revision so all files come from the same commit
+            url = hf_hub_url(QUEUE_REPO, file, repo_type="dataset", revision=revision)
             headers = build_hf_headers(token=self.token)
             
-            # Download file
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(LogFormatter.error(f"Failed to download {file}", f"HTTP {response.status}"))
-                    progress.update()
-                    return None
-                
-                try:
-                    # First read content as text
-                    text_content = await response.text()
-                    # Then parse JSON
-                    content = json.loads(text_content)
-                except json.JSONDecodeError as e:
-                    logger.error(LogFormatter.error(f"Failed to decode JSON from {file}", e))
-                    progress.update()
-                    return None
-                
-            # Get status and determine target status
-            status = content.get("status", "PENDING").upper()
-            target_status = None
-            status_map = {
-                "PENDING": ["PENDING"],
-                "EVALUATING": ["RUNNING"],
-                "FINISHED": ["FINISHED"]
-            }
-            
-            for target, source_statuses in status_map.items():
-                if status in source_statuses:
-                    target_status = target
-                    break
-                    
-            if not target_status:
-                progress.update()
+            # Download file, retrying transient failures
+            try:
+                text_content = await downloader.get_text(url, headers=headers)
+            except DownloadError as e:
+                logger.error(LogFormatter.error(f"Failed to download {file}", e))
                 return None
-                
-            # Calculate wait time
+
             try:
-                submit_time = datetime.fromisoformat(content["submitted_time"].replace("Z", "+00:00"))
-                if submit_time.tzinfo is None:
-                    submit_time = submit_time.replace(tzinfo=timezone.utc)
-                current_time = datetime.now(timezone.utc)
-                wait_time = current_time - submit_time
-                
-                model_info = {
+                content = json.loads(text_content)
+            except json.JSONDecodeError as e:
+                logger.error(LogFormatter.error(f"Failed to decode JSON from {file}", e))
+                return RequestFile(blob_id)
+
+            status = content.get("status", "PENDING").upper()
+            try:
+                # Validate the submission time, wait times are computed when bucketing
+                datetime.fromisoformat(content["submitted_time"].replace("Z", "+00:00"))
+                request_file = RequestFile(blob_id, model_id=content["model"], status={
+                    "status": status,
+                    "submitted_time": content["submitted_time"],
+                    "job_id": content.get("job_id", -1),
+                })
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.error(LogFormatter.error(f"Failed to process {file}", e))
+                return RequestFile(blob_id)
+
+            # Only requests in a shown status are kept in full
+            if status not in STATUS_BUCKETS:
+                return request_file
+
+            try:
+                request_file.model = {
+                    "status": status,
                     "name": content["model"],
                     "submitter": content.get("sender", "Unknown"),
                     "revision": content["revision"],
-                    "wait_time": f"{wait_time.total_seconds():.1f}s",
                     "submission_time": content["submitted_time"],
-                    "status": target_status,
                     "precision": content.get("precision", "Unknown"),
                     "model_type": content["model_type"],
                     "weight_type": content["weight_type"],
+                    "params": content.get("params", 0),
+                    "license": content.get("license", "?"),
+                    "likes": content.get("likes", 0),
                 }
-                
-                progress.update()
-                return model_info
-                    
-            except (ValueError, TypeError) as e:
+            except (KeyError, ValueError, TypeError) as e:
                 logger.error(LogFormatter.error(f"Failed to process {file}", e))
-                progress.update()
-                return None
+            return request_file
                 
         except Exception as e:
             logger.error(LogFormatter.error(f"Failed to load {file}", e))
-            progress.update()
             return None
+        finally:
+            progress.update()
 
     async def _refresh_models_cache(self):
-        """Refresh the models cache"""
+        """Refresh the models cache, coalescing concurrent callers into a single refresh
+
+        In shared mode, workers other than the leader reload the request list
+        the leader persisted instead of listing the hub themselves, raising
+        AwaitingLeader until there is one.
+        """
+        if not leader_election.is_leader():
+            models = await self._load_persisted_models()
+            if models is None:
+                raise AwaitingLeader("Request list")
+            return models
+        return await single_flight.do("models.refresh", self._do_refresh_models_cache)
+
+    async def _load_persisted_models(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Load the persisted request list into the cache, None if there is none"""
+        persisted = await run_cpu(read_snapshot, cache_config.requests_snapshot_file)
+        if persisted is None:
+            return None
+        table, metadata = persisted
+        if self.cached_models is None or metadata["updated_at"] != self._persisted_updated_at:
+            self._request_files = await run_cpu(request_files_from_arrow, table)
+            self._status_index = build_status_index(self._request_files)
+            # Pick up incremental syncs from the persisted commit
+            self._synced_sha = metadata.get("sha")
+            self.cached_models = bucket_requests(self._request_files)
+            self.cache_generation += 1
+            self._persisted_updated_at = metadata["updated_at"]
+        # Treated as fresh so readers are not blocked until the next refresh
+        self.last_cache_update = time.time()
+        return self.cached_models
+
+    async def _do_refresh_models_cache(self):
+        """Refresh the models cache, only fetching request files changed since the last synced commit"""
         try:
             logger.info(LogFormatter.section("CACHE REFRESH"))
             self._log_repo_operation("read", f"{HF_ORGANIZATION}/requests", "Refreshing models cache")
             
-            # Initialize models dictionary
-            models = {
-                "finished": [],
-                "evaluating": [],
-                "pending": []
-            }
-            
             try:
                 logger.info(LogFormatter.subsection("DATASET LOADING"))
-                logger.info(LogFormatter.info("Loading dataset files..."))
-                
-                # List files in repository
-                with suppress_output():
-                    files = self.hf_api.list_repo_files(
-                        repo_id=QUEUE_REPO,
-                        repo_type="dataset",
-                        token=self.token
-                    )
-                
-                # Filter JSON files
-                json_files = [f for f in files if f.endswith('.json')]
-                total_files = len(json_files)
-                
-                # Log repository stats
-                stats = {
-                    "Total_Files": len(files),
-                    "JSON_Files": total_files,
-                }
-                for line in LogFormatter.stats(stats, "Repository Statistics"):
-                    logger.info(line)
                 
-                if not json_files:
-                    raise Exception("No JSON files found in repository")
-                
-                # Initialize progress tracker
-                progress = ProgressTracker(total_files, "PROCESSING FILES")
-                
-                try:
-                    # Create aiohttp session to reuse connections
-                    async with aiohttp.ClientSession() as session:
-                        # Process files in chunks
-                        chunk_size = 50
-                        
-                        for i in range(0, len(json_files), chunk_size):
-                            chunk = json_files[i:i + chunk_size]
-                            chunk_tasks = [
-                                self._download_and_process_file(file, session, progress)
-                                for file in chunk
-                            ]
-                            results = await asyncio.gather(*chunk_tasks)
-                            
-                            # Process results
-                            for result in results:
-                                if result:
-                                    status = result.pop("status")
-                                    models[status.lower()].append(result)
-                
-                finally:
-                    progress.close()
+                repo_info = await run_hub_io(self.hf_api.repo_info, QUEUE_REPO, repo_type="dataset", token=self.token)
+                if repo_info.sha == self._synced_sha and self._request_files:
+                    logger.info(LogFormatter.info(f"Requests repo unchanged at {repo_info.sha[:7]}"))
+                else:
+                    await self._sync_request_files(repo_info.sha)
+
+                models = bucket_requests(self._request_files)
                 
                 # Final summary with fancy formatting
                 logger.info(LogFormatter.section("CACHE SUMMARY"))
@@ -289,7 +409,19 @@ class ModelService(HuggingFaceService):
             # Update cache
             self.cached_models = models
             self.last_cache_update = time.time()
+            self.cache_generation += 1
             logger.info(LogFormatter.success("Cache updated successfully"))
+
+            if leader_election.is_leader():
+                try:
+                    await run_cpu(
+                        write_snapshot,
+                        cache_config.requests_snapshot_file,
+                        request_files_to_arrow(self._request_files),
+                        {"updated_at": self.last_cache_update, "sha": self._synced_sha}
+                    )
+                except Exception as e:
+                    logger.warning(LogFormatter.warning(f"Failed to persist models cache: {e}"))
             
             return models
             
@@ -297,12 +429,129 @@ class ModelService(HuggingFaceService):
             logger.error(LogFormatter.error("Cache refresh failed", e))
             raise
 
+    async def _sync_request_files(self, sha: str):
+        """Fetch the request files added or modified since the last synced commit, and drop deleted ones
+
+        Files are compared by git blob id, listed in one paginated call. A file
+        that fails to download keeps its previous state and the commit is not
+        marked as synced, so it is fetched again on the next refresh.
+        """
+        from huggingface_hub.hf_api import RepoFile
+
+        def list_blobs():
+            return {
+                entry.path: entry.blob_id
+                for entry in self.hf_api.list_repo_tree(
+                    QUEUE_REPO, repo_type="dataset", revision=sha, recursive=True, token=self.token
+                )
+                if isinstance(entry, RepoFile) and entry.path.endswith(".json")
+            }
+        blobs = await run_hub_io(list_blobs)
+        if not blobs:
+            raise Exception("No JSON files found in repository")
+
+        changed = [
+            path for path, blob_id in blobs.items()
+            if path not in self._request_files or self._request_files[path].blob_id != blob_id
+        ]
+        deleted = [path for path in self._request_files if path not in blobs]
+
+        # Log repository stats
+        stats = {
+            "Commit": f"{(self._synced_sha or 'none')[:7]} -> {sha[:7]}",
+            "JSON_Files": len(blobs),
+            "Changed": len(changed),
+            "Deleted": len(deleted),
+        }
+        for line in LogFormatter.stats(stats, "Repository Statistics"):
+            logger.info(line)
+
+        request_files = dict(self._request_files)
+        for path in deleted:
+            del request_files[path]
+
+        failed = 0
+        if changed:
+            progress = ProgressTracker(len(changed), "PROCESSING FILES")
+            try:
+                # All downloads start at once, the downloader keeps a tuned number in flight
+                # on the shared session, reusing its kept-alive connections
+                downloader = AdaptiveDownloader(
+                    await get_http_session(), DOWNLOAD_CONCURRENCY, DOWNLOAD_MAX_CONCURRENCY, DOWNLOAD_RETRIES
+                )
+                results = await asyncio.gather(*[
+                    self._download_request_file(path, blobs[path], sha, downloader, progress)
+                    for path in changed
+                ])
+                for path, request_file in zip(changed, results):
+                    if request_file is not None:
+                        request_files[path] = request_file
+                    else:
+                        failed += 1
+            finally:
+                progress.close()
+            for line in LogFormatter.stats(downloader.stats(), "Downloads"):
+                logger.info(line)
+
+        # Keep submissions made during the sync when the synced commit predates them
+        for path, request_file in self._request_files.items():
+            if request_file.blob_id is None:
+                synced = request_files.get(path)
+                if synced is None or synced.status is None or synced.status["submitted_time"] < request_file.status["submitted_time"]:
+                    request_files[path] = request_file
+
+        # Swap the state in one step so a failed sync leaves the previous one intact
+        self._request_files = request_files
+        self._status_index = build_status_index(request_files)
+        if failed:
+            logger.warning(LogFormatter.warning(f"{failed} request files failed to download, retrying them on the next refresh"))
+        else:
+            self._synced_sha = sha
+
+    async def restore_cache(self) -> bool:
+        """Serve the requests persisted by the previous run, refreshing them in the background"""
+        if self.cached_models is not None:
+            return False
+        try:
+            start = time.perf_counter()
+            models = await self._load_persisted_models()
+            if models is None:
+                logger.info(LogFormatter.info("No persisted models cache"))
+                return False
+        except Exception as e:
+            logger.warning(LogFormatter.warning(f"Failed to restore models cache: {e}"))
+            return False
+
+        self._initialized = True
+        age = time.time() - self._persisted_updated_at
+        logger.info(LogFormatter.success(
+            f"Restored {sum(len(m) for m in models.values()):,} requests ({age:.0f}s old) "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+        ))
+
+        self._revalidation_task = asyncio.create_task(self._revalidate_cache())
+        return True
+
+    async def _revalidate_cache(self):
+        """Refresh a restored cache from the hub, keeping it on failure"""
+        try:
+            with background_hub_calls():
+                await self._refresh_models_cache()
+        except Exception as e:
+            logger.error(LogFormatter.error("Models cache revalidation failed, serving restored data", e))
+
     async def initialize(self):
         """Initialize the model service"""
         if self._initialized:
             logger.info(LogFormatter.info("Service already initialized, using cached data"))
             return
-        
+        await single_flight.do("models.initialize", self._do_initialize)
+
+    async def _do_initialize(self):
+        """Initialize the model service once"""
+        if self._initialized:
+            return
+
         try:
             logger.info(LogFormatter.section("MODEL SERVICE INITIALIZATION"))
             
@@ -334,6 +583,8 @@ class ModelService(HuggingFaceService):
             self._initialized = True
             logger.info(LogFormatter.success("Model service initialization complete"))
             
+        except AwaitingLeader:
+            raise
         except Exception as e:
             logger.error(LogFormatter.error("Initialization failed", e))
             raise
@@ -358,6 +609,15 @@ class ModelService(HuggingFaceService):
             logger.info(LogFormatter.info(f"Using cached data ({cache_age:.1f}s old)"))
             return self.cached_models
 
+    async def get_request_index(self) -> RequestIndex:
+        """Get the request index, rebuilt once per cache generation"""
+        models = await self.get_models()
+        if self._request_index is None or self._request_index_generation != self.cache_generation:
+            self._request_index = RequestIndex(models)
+            self._request_index_generation = self.cache_generation
+            logger.info(LogFormatter.info(f"Request index built for cache generation {self.cache_generation}"))
+        return self._request_index
+
     async def submit_model(
         self, 
         model_data: Dict[str, Any],
@@ -389,7 +649,8 @@ class ModelService(HuggingFaceService):
             logger.info(LogFormatter.subsection("MODEL VALIDATION"))
             
             # Get the model info to check if it exists
-            model_info = self.hf_api.model_info(
+            model_info = await run_hub_io(
+                self.hf_api.model_info,
                 model_data["model_id"],
                 revision=model_data["revision"],
                 token=self.token
@@ -528,7 +789,8 @@ class ModelService(HuggingFaceService):
                 temp_path = temp_file.name
             
             # Upload file directly
-            self.hf_api.upload_file(
+            await run_hub_io(
+                self.hf_api.upload_file,
                 path_or_fileobj=temp_path,
                 path_in_repo=relative_path,
                 repo_id=f"{HF_ORGANIZATION}/requests",
@@ -541,6 +803,14 @@ class ModelService(HuggingFaceService):
             os.unlink(temp_path)
             
             logger.info(LogFormatter.success("Upload successful"))
+
+            # Serve the new status right away, the file itself is fetched on the next sync
+            self._request_files[relative_path] = RequestFile(None, model_id=eval_entry["model"], status={
+                "status": eval_entry["status"],
+                "submitted_time": eval_entry["submitted_time"],
+                "job_id": eval_entry["job_id"],
+            })
+            self._status_index[eval_entry["model"]] = self._request_files[relative_path].status
             
         except Exception as e:
             logger.error(LogFormatter.error("Upload failed", e))
@@ -566,25 +836,17 @@ class ModelService(HuggingFaceService):
         }
 
     async def get_model_status(self, model_id: str) -> Dict[str, Any]:
-        """Get evaluation status of a model"""
+        """Get evaluation status of a model, from its most recent request"""
         logger.info(LogFormatter.info(f"Checking status for model: {model_id}"))
-        eval_path = self.eval_requests_path
-        
-        for user_folder in eval_path.iterdir():
-            if user_folder.is_dir():
-                for file in user_folder.glob("*.json"):
-                    with open(file, "r") as f:
-                        data = json.load(f)
-                        if data["model"] == model_id:
-                            status = {
-                                "status": data["status"],
-                                "submitted_time": data["submitted_time"],
-                                "job_id": data.get("job_id", -1)
-                            }
-                            logger.info(LogFormatter.success("Status found"))
-                            for line in LogFormatter.tree(status, "Model Status"):
-                                logger.info(line)
-                            return status
-        
-        logger.warning(LogFormatter.warning(f"No status found for model: {model_id}"))
-        return {"status": "not_found"} 
\ No newline at end of file
+        # Keeps the index as fresh as the request list, without reading any file
+        await self.get_models()
+
+        status = self._status_index.get(model_id)
+        if status is None:
+            logger.warning(LogFormatter.warning(f"No status found for model: {model_id}"))
+            return {"status": "not_found"}
+
+        logger.info(LogFormatter.success("Status found"))
+        for line in LogFormatter.tree(status, "Model Status"):
+            logger.info(line)
+        return dict(status)
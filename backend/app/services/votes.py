@@ -4,15 +4,16 @@ import json
 import logging
 import asyncio
 from pathlib import Path
-import aiohttp
-from huggingface_hub import HfApi
-import datasets
 
 from app.services.hf_service import HuggingFaceService
 from app.config import HF_TOKEN
 from app.config.hf_config import HF_ORGANIZATION
 from app.core.cache import cache_config
 from app.core.formatting import LogFormatter
+from app.core.singleflight import single_flight
+from app.core.executors import run_hub_io
+from app.core.http_pool import get_http_session
+from app.core.hub_scheduler import background_hub_calls, hub_scheduler, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +42,16 @@ class VoteService(HuggingFaceService):
             self._max_retries = 3
             self._retry_delay = 1  # seconds
             self._upload_batch_size = 10
+            self._reconcile_task: Optional[asyncio.Task] = None
+            from huggingface_hub import HfApi
             self.hf_api = HfApi(token=HF_TOKEN)
             self._init_done = True
 
     async def initialize(self):
+        """Initialize the vote service, coalescing concurrent callers"""
+        await single_flight.do("votes.initialize", self._do_initialize)
+
+    async def _do_initialize(self):
         """Initialize the vote service"""
         if self._initialized:
             await self._check_for_new_votes()
@@ -63,22 +70,12 @@ class VoteService(HuggingFaceService):
                 local_vote_count = await self._count_local_votes()
                 logger.info(LogFormatter.info(f"Found {local_vote_count:,} local votes"))
             
-            # Check remote votes count
-            remote_vote_count = await self._count_remote_votes()
-            logger.info(LogFormatter.info(f"Found {remote_vote_count:,} remote votes"))
-            
-            if remote_vote_count > local_vote_count:
-                logger.info(LogFormatter.info(f"Fetching {remote_vote_count - local_vote_count:,} new votes"))
-                await self._sync_with_hub()
-            elif remote_vote_count < local_vote_count:
-                logger.warning(LogFormatter.warning(f"Local votes ({local_vote_count:,}) > Remote votes ({remote_vote_count:,})"))
+            if local_vote_count > 0:
+                # Serve local votes right away and reconcile with the hub in the background
                 await self._load_existing_votes()
+                self._reconcile_task = asyncio.create_task(self._reconcile_in_background(local_vote_count))
             else:
-                logger.info(LogFormatter.success("Local and remote votes are in sync"))
-                if local_vote_count > 0:
-                    await self._load_existing_votes()
-                else:
-                    logger.info(LogFormatter.info("No votes found"))
+                await self._reconcile_with_hub(local_vote_count)
             
             self._initialized = True
             self._last_sync = datetime.now(timezone.utc)
@@ -96,6 +93,29 @@ class VoteService(HuggingFaceService):
             logger.error(LogFormatter.error("Initialization failed", e))
             raise
 
+    async def _reconcile_with_hub(self, local_vote_count: int):
+        """Compare local and remote vote counts and fetch missing votes"""
+        remote_vote_count = await self._count_remote_votes()
+        logger.info(LogFormatter.info(f"Found {remote_vote_count:,} remote votes"))
+
+        if remote_vote_count > local_vote_count:
+            logger.info(LogFormatter.info(f"Fetching {remote_vote_count - local_vote_count:,} new votes"))
+            await self._sync_with_hub()
+        elif remote_vote_count < local_vote_count:
+            logger.warning(LogFormatter.warning(f"Local votes ({local_vote_count:,}) > Remote votes ({remote_vote_count:,})"))
+        elif local_vote_count > 0:
+            logger.info(LogFormatter.success("Local and remote votes are in sync"))
+        else:
+            logger.info(LogFormatter.info("No votes found"))
+
+    async def _reconcile_in_background(self, local_vote_count: int):
+        """Reconcile with the hub, keeping local votes on failure"""
+        try:
+            with background_hub_calls():
+                await self._reconcile_with_hub(local_vote_count)
+        except Exception as e:
+            logger.error(LogFormatter.error("Vote reconciliation failed, serving local votes", e))
+
     async def _count_local_votes(self) -> int:
         """Count votes in local file"""
         if not self.votes_file.exists():
@@ -117,13 +137,19 @@ class VoteService(HuggingFaceService):
         headers = {"Authorization": f"Bearer {HF_TOKEN}"} if HF_TOKEN else {}
         
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await get_http_session()
+            async with hub_scheduler.slot():
                 async with session.get(url, headers=headers) as response:
+                    if response.status == 429:
+                        hub_scheduler.throttled(parse_retry_after(response.headers.get("Retry-After")))
+                        logger.error("Failed to get remote votes: rate limited by the hub")
+                        return 0
                     if response.status == 200:
                         count = 0
                         async for line in response.content:
                             if line.strip():  # Skip empty lines
                                 count += 1
+                        hub_scheduler.succeeded()
                         return count
                     else:
                         logger.error(f"Failed to get remote votes: HTTP {response.status}")
@@ -140,7 +166,9 @@ class VoteService(HuggingFaceService):
             logger.info(LogFormatter.info("Syncing with HuggingFace hub..."))
             
             # Load votes from HF dataset
-            dataset = datasets.load_dataset(
+            import datasets
+            dataset = await run_hub_io(
+                datasets.load_dataset,
                 f"{HF_ORGANIZATION}/votes", 
                 split="train",
                 cache_dir=cache_config.get_cache_path("datasets")
@@ -182,7 +210,8 @@ class VoteService(HuggingFaceService):
         try:
             self._log_repo_operation("check", f"{HF_ORGANIZATION}/votes", "Checking for new votes")
             # Load only dataset metadata
-            dataset_info = datasets.load_dataset(f"{HF_ORGANIZATION}/votes", split="train")
+            import datasets
+            dataset_info = await run_hub_io(datasets.load_dataset, f"{HF_ORGANIZATION}/votes", split="train")
             remote_vote_count = len(dataset_info)
             
             if remote_vote_count > self._total_votes:
@@ -324,7 +353,7 @@ class VoteService(HuggingFaceService):
         logger.info(f"Getting revision for model: {model_id}")
         for attempt in range(self._max_retries):
             try:
-                model_info = await asyncio.to_thread(self.hf_api.model_info, model_id)
+                model_info = await run_hub_io(self.hf_api.model_info, model_id)
                 logger.info(f"Successfully got revision {model_info.sha} for model {model_id}")
                 return model_info.sha
             except Exception as e:
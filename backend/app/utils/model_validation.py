@@ -2,30 +2,29 @@ import json
 import logging
 import asyncio
 from typing import Tuple, Optional, Dict, Any
-from datasets import load_dataset
-from huggingface_hub import HfApi, ModelCard, hf_hub_download
-from huggingface_hub import hf_api
-from transformers import AutoConfig, AutoTokenizer
 from app.config.base import HF_TOKEN
 from app.config.hf_config import OFFICIAL_PROVIDERS_REPO
 from app.core.formatting import LogFormatter
+from app.core.executors import run_hub_io
 
 logger = logging.getLogger(__name__)
 
 class ModelValidator:
     def __init__(self):
         self.token = HF_TOKEN
+        from huggingface_hub import HfApi
         self.api = HfApi(token=self.token)
         self.headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
         
     async def check_model_card(self, model_id: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """Check if model has a valid model card"""
+        from huggingface_hub import ModelCard
         try:
             logger.info(LogFormatter.info(f"Checking model card for {model_id}"))
             
             # Get model card content using ModelCard.load
             try:
-                model_card = await asyncio.to_thread(
+                model_card = await run_hub_io(
                     ModelCard.load,
                     model_id
                 )
@@ -57,9 +56,10 @@ class ModelValidator:
             
     async def get_safetensors_metadata(self, model_id: str, is_adapter: bool = False, revision: str = "main")  -> Optional[Dict]:
         """Get metadata from a safetensors file"""
+        from huggingface_hub import hf_api
         try:
             if is_adapter:
-                metadata = await asyncio.to_thread(
+                metadata = await run_hub_io(
                     hf_api.parse_safetensors_file_metadata,
                     model_id,
                     "adapter_model.safetensors",
@@ -67,7 +67,7 @@ class ModelValidator:
                     revision=revision,
                 )
             else:
-                metadata = await asyncio.to_thread(
+                metadata = await run_hub_io(
                     hf_api.get_safetensors_metadata,
                     repo_id=model_id,
                     token=self.token,
@@ -134,11 +134,12 @@ class ModelValidator:
         revision: str
     ) -> Tuple[bool, Optional[str]]:
         """Check if model has a valid chat template"""
+        from huggingface_hub import hf_hub_download
         try:
             logger.info(LogFormatter.info(f"Checking chat template for {model_id}"))
             
             try:
-                config_file = await asyncio.to_thread(
+                config_file = await run_hub_io(
                     hf_hub_download,
                     repo_id=model_id,
                     filename="tokenizer_config.json",
@@ -175,8 +176,11 @@ class ModelValidator:
         trust_remote_code: bool = False
     ) -> Tuple[bool, Optional[str], Optional[Any]]:
         """Check if model exists and is properly configured on the Hub"""
+        # transformers takes seconds to import, only load it for submissions
+        from transformers import AutoConfig, AutoTokenizer
+
         try:
-            config = await asyncio.to_thread(
+            config = await run_hub_io(
                 AutoConfig.from_pretrained,
                 model_name,
                 revision=revision,
@@ -187,7 +191,7 @@ class ModelValidator:
             
             if test_tokenizer:
                 try:
-                    await asyncio.to_thread(
+                    await run_hub_io(
                         AutoTokenizer.from_pretrained,
                         model_name,
                         revision=revision,
@@ -234,7 +238,8 @@ class ModelValidator:
                 return True, None
                 
             # Load official providers dataset
-            dataset = load_dataset(OFFICIAL_PROVIDERS_REPO)
+            from datasets import load_dataset
+            dataset = await run_hub_io(load_dataset, OFFICIAL_PROVIDERS_REPO)
             official_providers = dataset["train"][0]["CURATED_SET"]
             
             # Check if model org is in official providers
@@ -0,0 +1,87 @@
+import re
+import sys
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Get the backend directory path
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Budget for `import app.asgi`: fastapi and pydantic are most of what remains,
+# hub clients, Arrow, numpy and aiohttp being loaded on first use (~3.1s before)
+IMPORT_BUDGET_MS = 800
+
+# Libraries that must only be imported by the code paths needing them
+LAZY_MODULES = [
+    "transformers", "datasets", "pandas", "torch",
+    "numpy", "pyarrow", "aiohttp", "huggingface_hub.hf_api", "huggingface_hub.file_download",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+def measure(module: str) -> List[Tuple[str, int, int]]:
+    """Import module in a fresh interpreter, returning (name, self_us, cumulative_us) per module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return imports
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the import time of the API against its budget")
+    parser.add_argument("--module", default="app.asgi", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS, help="Maximum cumulative import time")
+    parser.add_argument("--runs", type=int, default=3, help="Imports to run, the fastest one is kept")
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level packages to report")
+    args = parser.parse_args()
+
+    # The fastest run is the least disturbed by the machine, keep it
+    runs = [measure(args.module) for _ in range(args.runs)]
+    imports = min(runs, key=lambda run: dict((name, cumulative) for name, _, cumulative in run).get(args.module, 0))
+    cumulative_by_module: Dict[str, int] = {name: cumulative for name, _, cumulative in imports}
+    total_ms = cumulative_by_module.get(args.module, 0) / 1000
+
+    # Time spent per top-level package, wherever it was first imported from
+    packages: Dict[str, int] = {}
+    for name, self_us, _ in imports:
+        package = name.split(".", 1)[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    logger.info(f"import {args.module}: {total_ms:.0f}ms (budget {args.budget_ms:.0f}ms, best of {args.runs})")
+    logger.info("Slowest packages:")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        logger.info(f"  {package:<30} {self_us / 1000:8.1f}ms")
+
+    failed = False
+    if total_ms > args.budget_ms:
+        logger.error(f"Import time {total_ms:.0f}ms exceeds the {args.budget_ms:.0f}ms budget")
+        failed = True
+    eager = [module for module in LAZY_MODULES if module in cumulative_by_module]
+    if eager:
+        logger.error(f"Imported eagerly, should be lazy: {', '.join(eager)}")
+        failed = True
+    if not failed:
+        logger.info("Import time within budget")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
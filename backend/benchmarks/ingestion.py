@@ -0,0 +1,196 @@
+import os
+import gc
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import tracemalloc
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Keep the hub lookup cache and snapshots of the benchmark away from the real cache
+os.environ.setdefault("HF_HOME", tempfile.mkdtemp(prefix="leaderboard-bench-"))
+# Hub calls are stubbed, so the hub rate budget would only measure the limiter
+os.environ.setdefault("HUB_RATE_LIMIT", "0")
+
+from app.config import HUB_LOOKUP_TTL
+from app.core.hub_cache import HubLookupCache
+from app.core.manifest import FileManifest
+from app.core.snapshot_store import VersionedSnapshotStore
+from app.services import leaderboard as leaderboard_module
+from app.services.leaderboard import EvalResult, LeaderboardService
+from benchmarks.synthetic_results import StubModelService, generate_results_tree, stub_is_model_on_hub
+
+# Configure logging, keeping the services quiet
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(message)s'
+)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+STAGES = ["init_from_json_file", "ingestion", "formatting", "following"]
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of the process since the last reset"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    # Not resettable: the peak over the process lifetime (kB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _reset_peak_rss():
+    """Reset the peak RSS to the current RSS where the kernel allows it (Linux)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+def measure(stage: str, size: int, run: Callable[[], Any], repeat: int, trace: bool) -> Dict[str, Any]:
+    """Wall time over `repeat` runs, peak RSS, and allocations of one traced run"""
+    gc.collect()
+    _reset_peak_rss()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000)
+    peak_rss = _peak_rss_mb()
+
+    allocated = None
+    if trace:
+        # Tracing slows allocations down a lot, so it gets its own run
+        gc.collect()
+        tracemalloc.start()
+        run()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocated = traced_peak / (1024 * 1024)
+
+    return {
+        "size": size,
+        "stage": stage,
+        "best_ms": min(times),
+        "median_ms": statistics.median(times),
+        "per_run_us": min(times) * 1000 / size,
+        "peak_rss_mb": peak_rss,
+        "traced_peak_mb": allocated,
+    }
+
+def run_size(size: int, data_dir: Path, repeat: int, trace: bool, metadata_kb: int) -> List[Dict[str, Any]]:
+    """Generate a results tree of `size` runs and measure every stage on it"""
+    results_dir = data_dir / f"results-{size}"
+    requests_file = results_dir / "requests.json"
+    if requests_file.exists():
+        with open(requests_file) as f:
+            requests = json.load(f)
+    else:
+        logger.info(f"Generating {size:,} runs in {results_dir}")
+        requests = generate_results_tree(results_dir, size, metadata_kb=metadata_kb)
+        with open(requests_file, "w") as f:
+            json.dump(requests, f)
+
+    service = LeaderboardService()
+    service.model_service = StubModelService(requests)
+    filepaths = service._list_result_files(str(results_dir))
+
+    def parse():
+        return [EvalResult.init_from_json_file(path, check_hub=False) for path in filepaths]
+
+    eval_results: List[EvalResult] = []
+
+    def ingest():
+        # Start cold: no parsed files, merged results or hub lookups from a previous run
+        service.result_manifest = FileManifest()
+        service._eval_results = {}
+        service.hub_lookup_cache = HubLookupCache(data_dir / f"hub-lookups-{size}.json", HUB_LOOKUP_TTL)
+        eval_results[:] = asyncio.run(service.get_raw_eval_results(str(results_dir), str(data_dir)))
+
+    def format_():
+        return service._compile_snapshot(1, eval_results, time.time())
+
+    def follow():
+        # What a follower worker does: map the published snapshot and serve a page from it
+        snapshot = service._load_published_snapshot()
+        snapshot.query(limit=50)
+        return snapshot
+
+    measurements = []
+    for stage, run in zip(STAGES, [parse, ingest, format_, follow]):
+        if stage == "following":
+            service.snapshot_store = VersionedSnapshotStore(data_dir / f"snapshots-{size}", "leaderboard")
+            service._publish_snapshot(format_())
+        measurements.append(measure(stage, size, run, repeat, trace))
+        _log_measurement(measurements[-1])
+    return measurements
+
+def _log_measurement(m: Dict[str, Any]):
+    traced = f"{m['traced_peak_mb']:9.1f}" if m["traced_peak_mb"] is not None else f"{'-':>9}"
+    logger.info(
+        f"{m['size']:>7,}  {m['stage']:<20} {m['best_ms']:10.1f} {m['median_ms']:10.1f} "
+        f"{m['per_run_us']:9.1f} {m['peak_rss_mb']:9.1f} {traced}"
+    )
+
+def compare(measurements: List[Dict[str, Any]], baseline_file: Path, tolerance: float) -> bool:
+    """Whether every stage stays within tolerance of the recorded baseline wall time"""
+    with open(baseline_file) as f:
+        baseline = {(m["size"], m["stage"]): m for m in json.load(f)}
+
+    ok = True
+    for m in measurements:
+        reference = baseline.get((m["size"], m["stage"]))
+        if reference is None:
+            continue
+        ratio = m["best_ms"] / reference["best_ms"] if reference["best_ms"] else 1.0
+        if ratio > 1 + tolerance:
+            logger.error(
+                f"Regression: {m['stage']} on {m['size']:,} runs took {m['best_ms']:.1f}ms, "
+                f"{(ratio - 1) * 100:.0f}% over the baseline {reference['best_ms']:.1f}ms"
+            )
+            ok = False
+    return ok
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark leaderboard ingestion and formatting on synthetic results")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma separated numbers of runs")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage, the best and median are reported")
+    parser.add_argument("--no-trace", action="store_true", help="Skip the tracemalloc run of each stage")
+    parser.add_argument("--metadata-kb", type=int, default=16, help="Size of the unused metadata sections per file")
+    parser.add_argument("--data-dir", type=Path, help="Where generated trees are kept and reused, a temporary directory by default")
+    parser.add_argument("--output", type=Path, help="Write the measurements as JSON, e.g. to record a baseline")
+    parser.add_argument("--baseline", type=Path, help="Measurements to compare against, exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown over the baseline")
+    args = parser.parse_args()
+
+    leaderboard_module.is_model_on_hub = stub_is_model_on_hub
+    data_dir = args.data_dir or Path(tempfile.mkdtemp(prefix="leaderboard-results-"))
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"{'runs':>7}  {'stage':<20} {'best ms':>10} {'median ms':>10} {'us/run':>9} {'peak RSS':>9} {'traced MB':>9}")
+    measurements = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        measurements.extend(run_size(size, data_dir, args.repeat, not args.no_trace, args.metadata_kb))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(measurements, f, indent=2)
+        logger.info(f"Measurements written to {args.output}")
+
+    if args.baseline and not compare(measurements, args.baseline, args.tolerance):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+import json
+import random
+import argparse
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from app.services.models import RequestIndex
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN = "clearML-sprint1.5"
+ORGANIZATIONS = 50
+MODEL_TYPES = ["pretrained", "fine-tuned", "instruction-tuned", "RL-tuned", "merged"]
+PRECISIONS = ["bfloat16", "float16"]
+
+def _task_results(rnd: random.Random, missing_rate: float) -> Dict[str, Dict[str, Any]]:
+    """Scores of one run in the lighteval `results` layout, some tasks missing like split runs"""
+    results = {
+        "community|gpqa-fr|0": {"new_acc": rnd.random(), "new_acc_stderr": rnd.random() / 50},
+        "community|ifeval-fr|0": {
+            "prompt_level_strict_acc": rnd.random(),
+            "prompt_level_strict_acc_stderr": rnd.random() / 50,
+            "inst_level_strict_acc": rnd.random(),
+            "inst_level_strict_acc_stderr": rnd.random() / 50,
+        },
+        "community|bac-fr|0": {"bac-fr-qem": rnd.random(), "bac-fr-qem_stderr": rnd.random() / 50},
+    }
+    for task in list(results):
+        if rnd.random() < missing_rate:
+            del results[task]
+    results["all"] = {"new_acc": rnd.random()}
+    return results
+
+def _metadata(rnd: random.Random, metadata_kb: int) -> Dict[str, Any]:
+    """Sections lighteval writes next to the results, which ingestion never reads"""
+    prompt = "Question : " + "x" * 200
+    config_tasks = {}
+    size = 0
+    i = 0
+    while size < metadata_kb * 1024:
+        task = {
+            "name": f"task-{i}",
+            "prompt_function": "prompt_fn",
+            "hf_repo": "fr-gouv-coordination-ia/benchmarks",
+            "hf_subset": "default",
+            "metric": [{"metric_name": "acc", "higher_is_better": True, "category": "8", "use_case": "1"}],
+            "hf_avail_splits": ["train", "test"],
+            "evaluation_splits": ["test"],
+            "few_shots_split": None,
+            "generation_size": 2048,
+            "stop_sequence": ["\n\n"],
+            "original_num_docs": rnd.randint(100, 2000),
+            "effective_num_docs": rnd.randint(100, 2000),
+            "example_prompt": prompt,
+        }
+        config_tasks[f"community|task-{i}|0"] = task
+        size += len(json.dumps(task))
+        i += 1
+    return {
+        "config_tasks": config_tasks,
+        "versions": {name: 0 for name in config_tasks},
+        "summary_tasks": {
+            name: {"hashes": {"hash_examples": f"{rnd.getrandbits(64):016x}", "hash_full_prompts": f"{rnd.getrandbits(64):016x}"}}
+            for name in config_tasks
+        },
+        "summary_general": {"hashes": {"hash_examples": f"{rnd.getrandbits(64):016x}"}, "truncated": 0, "padded": 0},
+    }
+
+def generate_results_tree(
+    root: Path,
+    runs: int,
+    runs_per_model: int = 2,
+    metadata_kb: int = 16,
+    missing_rate: float = 0.1,
+    seed: int = 0
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Write `runs` result files in the results repo layout and return matching requests
+
+    Files are laid out as {org}/{model}/{campaign}/results_{date}.json, with
+    `runs_per_model` dated runs per model. The returned requests are bucketed by
+    status like ModelService.get_models, so they can back a RequestIndex.
+    """
+    rnd = random.Random(seed)
+    root = Path(root)
+    requests: Dict[str, List[Dict[str, Any]]] = {"finished": [], "evaluating": [], "pending": []}
+    # Heavy metadata is identical across runs of a campaign, render it once
+    metadata = _metadata(rnd, metadata_kb)
+    start = datetime(2025, 1, 1)
+
+    num_models = (runs + runs_per_model - 1) // runs_per_model
+    written = 0
+    for i in range(num_models):
+        org = f"org-{i % ORGANIZATIONS}"
+        name = f"{org}/model-{i}"
+        precision = PRECISIONS[i % len(PRECISIONS)]
+        sha = f"{rnd.getrandbits(160):040x}"
+        folder = root / org / f"model-{i}" / CAMPAIGN
+        folder.mkdir(parents=True, exist_ok=True)
+
+        for run in range(min(runs_per_model, runs - written)):
+            date = start + timedelta(days=run, seconds=i)
+            data = {
+                "config_general": {
+                    "lighteval_sha": "?",
+                    "model_name": name,
+                    "model_sha": sha,
+                    "model_dtype": f"torch.{precision}",
+                    "model_size": f"{rnd.randint(1, 140)}GB",
+                    "start_time": date.timestamp(),
+                },
+                "results": _task_results(rnd, missing_rate),
+                **metadata,
+            }
+            with open(folder / f"results_{date.strftime('%Y-%m-%dT%H-%M-%S')}.000000.json", "w") as f:
+                json.dump(data, f, indent=2)
+            written += 1
+
+        requests["finished"].append({
+            "name": name,
+            "precision": precision,
+            "revision": sha,
+            "model_type": rnd.choice(MODEL_TYPES),
+            "weight_type": "Original",
+            "license": "apache-2.0",
+            "likes": rnd.randint(0, 5000),
+            "params": round(rnd.uniform(0.5, 140), 2),
+            "submission_time": start.isoformat() + "Z",
+        })
+
+    return requests
+
+def stub_is_model_on_hub(model_name: str, revision: str, token: str = None, trust_remote_code=False, test_tokenizer=False):
+    """Offline stand-in for is_model_on_hub, every model being a llama on the hub"""
+    return True, None, SimpleNamespace(architectures=["LlamaForCausalLM"])
+
+class StubModelService:
+    """Serves fixed requests, e.g. those of generate_results_tree, instead of the requests dataset"""
+
+    def __init__(self, requests: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        # Imported here so generating a tree does not load the app and its configuration
+        from app.services.models import RequestIndex
+        self.request_index = RequestIndex(requests or {"finished": [], "evaluating": [], "pending": []})
+
+    async def initialize(self):
+        pass
+
+    async def get_request_index(self) -> "RequestIndex":
+        return self.request_index
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    parser = argparse.ArgumentParser(description="Generate a synthetic results tree in the lighteval layout")
+    parser.add_argument("root", type=Path, help="Directory to write result files into")
+    parser.add_argument("--runs", type=int, default=1000, help="Number of result files")
+    parser.add_argument("--runs-per-model", type=int, default=2, help="Dated runs per model")
+    parser.add_argument("--metadata-kb", type=int, default=16, help="Size of the unused metadata sections per file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    requests = generate_results_tree(args.root, args.runs, args.runs_per_model, args.metadata_kb, seed=args.seed)
+    with open(args.root / "requests.json", "w") as f:
+        json.dump(requests, f)
+    logger.info(f"Wrote {args.runs:,} runs for {len(requests['finished']):,} models to {args.root}")
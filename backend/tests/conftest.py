@@ -0,0 +1,77 @@
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+# Set before the app is imported: keep caches away from the real HF_HOME, and tests off the network
+os.environ["HF_HOME"] = tempfile.mkdtemp(prefix="leaderboard-tests-")
+os.environ["HF_HUB_OFFLINE"] = "1"
+os.environ.setdefault("HUB_RATE_LIMIT", "0")
+
+import pytest
+from benchmarks.synthetic_results import StubModelService, stub_is_model_on_hub
+
+CAMPAIGN = "clearML-sprint1.5"
+
+def write_result(
+    root: Path,
+    model: str,
+    date: str,
+    results: Dict[str, Dict[str, Any]],
+    precision: str = "bfloat16",
+    sha: str = "abc123"
+) -> Path:
+    """Write a lighteval result file of `model` dated `date` (YYYY-MM-DDTHH-MM-SS)"""
+    folder = Path(root) / model / CAMPAIGN
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"results_{date}.000000.json"
+    data = {
+        "config_general": {"model_name": model, "model_sha": sha, "model_dtype": f"torch.{precision}"},
+        "results": results,
+        "config_tasks": {},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+def gpqa(score: float) -> Dict[str, Dict[str, Any]]:
+    return {"community|gpqa-fr|0": {"new_acc": score}}
+
+def ifeval(score: float) -> Dict[str, Dict[str, Any]]:
+    return {"community|ifeval-fr|0": {"prompt_level_strict_acc": score, "inst_level_strict_acc": score}}
+
+def bac(score: float) -> Dict[str, Dict[str, Any]]:
+    return {"community|bac-fr|0": {"bac-fr-qem": score}}
+
+def make_eval_results(count: int):
+    """EvalResults of `count` models with distinct scores"""
+    from app.services.leaderboard import EvalResult, Precision, EVALUATIONS
+    results = []
+    for i in range(count):
+        scores = {benchmark: (i * 7 + j * 13) % 100 for j, (_, _, benchmark) in enumerate(EVALUATIONS)}
+        results.append(EvalResult(
+            eval_name=f"org_model-{i}_bfloat16",
+            full_model=f"org/model-{i}",
+            org="org",
+            model=f"model-{i}",
+            revision="abc",
+            results=scores,
+            precision=Precision.bfloat16,
+        ))
+    return results
+
+@pytest.fixture
+def leaderboard_service(tmp_path, monkeypatch):
+    """A fresh LeaderboardService reading local result files, with no hub access"""
+    from app.core.hub_cache import HubLookupCache
+    from app.services import leaderboard as leaderboard_module
+    from app.services.leaderboard import LeaderboardService
+
+    monkeypatch.setattr(leaderboard_module, "is_model_on_hub", stub_is_model_on_hub)
+    monkeypatch.setattr(LeaderboardService, "_instance", None)
+    service = LeaderboardService()
+    service.model_service = StubModelService()
+    service.hub_lookup_cache = HubLookupCache(tmp_path / "hub_lookups.json", 86400)
+    yield service
+    monkeypatch.setattr(LeaderboardService, "_instance", None)
@@ -0,0 +1,104 @@
+import time
+import asyncio
+import aiohttp
+import pytest
+from app.core import downloader as downloader_module
+from app.core.downloader import AdaptiveDownloader, DownloadError
+from app.core.hub_scheduler import HubScheduler
+
+class FakeResponse:
+    def __init__(self, session, status, headers=None):
+        self.session = session
+        self.status = status
+        self.headers = headers or {}
+
+    async def text(self):
+        return "ok"
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        await asyncio.sleep(self.session.latency)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.session.in_flight -= 1
+        return False
+
+class FakeSession:
+    """Answers GETs with the given statuses in turn, then 200s"""
+
+    def __init__(self, statuses=(), latency=0.0):
+        self.statuses = list(statuses)
+        self.latency = latency
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, headers=None):
+        self.requests += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status == "reset":
+            raise aiohttp.ClientConnectionError("connection reset")
+        if isinstance(status, tuple):
+            status, retry_after = status
+            return FakeResponse(self, status, {"Retry-After": retry_after})
+        return FakeResponse(self, status)
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    scheduler = HubScheduler(64, 0, 0)
+    monkeypatch.setattr(downloader_module, "hub_scheduler", scheduler)
+    monkeypatch.setattr(downloader_module, "BACKOFF_BASE", 0.001)
+    return scheduler
+
+def test_throttling_halves_the_limit_and_honours_retry_after(scheduler):
+    session = FakeSession([(429, "0.2")])
+    downloader = AdaptiveDownloader(session, 8, 16, 3)
+
+    start = time.monotonic()
+    text = asyncio.run(downloader.get_text("https://example.com/file.json"))
+
+    assert text == "ok"
+    assert time.monotonic() - start >= 0.19
+    assert downloader.limit == 4
+    assert downloader.stats()["throttled"] == 1 and downloader.stats()["retries"] == 1
+    assert scheduler.stats()["throttled"] == 1
+
+def test_unavailable_server_halves_the_limit(scheduler):
+    downloader = AdaptiveDownloader(FakeSession([503]), 8, 16, 3)
+
+    asyncio.run(downloader.get_text("https://example.com/file.json"))
+
+    assert downloader.limit == 4
+    assert downloader.stats()["throttled"] == 1
+
+def test_transient_failures_are_retried_until_exhausted(scheduler):
+    session = FakeSession([500, "reset", 502, 504])
+    downloader = AdaptiveDownloader(session, 4, 4, 3)
+
+    with pytest.raises(DownloadError, match="after 4 attempts"):
+        asyncio.run(downloader.get_text("https://example.com/file.json"))
+
+    assert session.requests == 4
+    assert downloader.stats() == {"requests": 4, "retries": 3, "throttled": 0, "failed": 1, "concurrency": 4}
+
+def test_client_errors_are_not_retried(scheduler):
+    session = FakeSession([404])
+    downloader = AdaptiveDownloader(session, 4, 4, 3)
+
+    with pytest.raises(DownloadError, match="HTTP 404"):
+        asyncio.run(downloader.get_text("https://example.com/file.json"))
+
+    assert session.requests == 1
+
+def test_limit_grows_while_latency_holds_and_bounds_requests_in_flight(scheduler):
+    session = FakeSession(latency=0.01)
+    downloader = AdaptiveDownloader(session, 2, 6, 0)
+
+    async def run():
+        return await asyncio.gather(*(downloader.get_text(f"https://example.com/{i}.json") for i in range(60)))
+
+    assert asyncio.run(run()) == ["ok"] * 60
+    assert downloader.limit > 2
+    assert 2 < session.max_in_flight <= 6
@@ -0,0 +1,29 @@
+import time
+import asyncio
+import threading
+from app.core.executors import run_cpu, run_hub_io
+
+def blocking_call():
+    time.sleep(0.1)
+    return threading.current_thread().name
+
+def test_blocking_work_runs_on_its_executor_while_the_loop_keeps_serving():
+    async def run():
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        threads = await asyncio.gather(run_cpu(blocking_call), run_hub_io(blocking_call))
+        ticker.cancel()
+        return threads, ticks
+
+    (cpu_thread, hub_thread), ticks = asyncio.run(run())
+
+    assert cpu_thread.startswith("cpu") and hub_thread.startswith("hub-io")
+    # Both calls slept 100ms, the loop was never blocked for that long
+    assert len(ticks) > 5
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.08
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from app.core import http_pool
+from app.core.http_pool import get_http_session, close_http_pools
+
+def test_session_is_shared_within_a_loop():
+    async def run():
+        first, second = await get_http_session(), await get_http_session()
+        await close_http_pools()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second and first.closed
+
+def test_session_of_a_finished_loop_is_closed_by_the_next_loop():
+    first = asyncio.run(get_http_session())
+
+    async def run():
+        session = await get_http_session()
+        await close_http_pools()
+        return session
+
+    second = asyncio.run(run())
+
+    assert second is not first
+    assert first.closed
+    assert http_pool._sessions == {}
+
+def test_sessions_of_running_loops_are_kept_and_closed_on_their_loop():
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        other = asyncio.run_coroutine_threadsafe(get_http_session(), other_loop).result()
+
+        async def run():
+            session = await get_http_session()
+            kept = not other.closed
+            await close_http_pools()
+            return session, kept
+
+        session, kept = asyncio.run(run())
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+    assert session is not other
+    assert kept and other.closed and session.closed
+
+def test_closing_restores_the_default_hub_backend(monkeypatch):
+    from huggingface_hub import constants, get_session
+
+    monkeypatch.setattr(constants, "HF_HUB_OFFLINE", False)
+
+    async def run():
+        await http_pool.open_http_pools()
+        adapter = http_pool._hub_adapter
+        pooled = get_session().get_adapter("https://huggingface.co") is adapter
+        await close_http_pools()
+        return adapter, pooled
+
+    adapter, pooled = asyncio.run(run())
+
+    assert adapter is not None and pooled
+    assert http_pool._hub_adapter is None
+    assert get_session().get_adapter("https://huggingface.co") is not adapter
+    # Reopening after a shutdown, e.g. in a new lifespan, creates a fresh pool
+    asyncio.run(http_pool.open_http_pools())
+    assert http_pool._hub_adapter not in (None, adapter)
+    asyncio.run(close_http_pools())
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+from app.core.hub_cache import HubLookupCache
+from tests.conftest import make_eval_results
+
+def test_lookups_round_trip_through_the_file(tmp_path):
+    cache = HubLookupCache(tmp_path / "hub_lookups.json", 3600)
+    cache.set("org/model", "abc", True, "LlamaForCausalLM")
+    cache.save()
+
+    reloaded = HubLookupCache(tmp_path / "hub_lookups.json", 3600)
+
+    assert reloaded.get("org/model", "abc")["architecture"] == "LlamaForCausalLM"
+    assert reloaded.get("org/model", "def") is None
+
+def test_failed_save_keeps_the_cache_dirty(tmp_path):
+    (tmp_path / "blocker").write_text("")
+    cache = HubLookupCache(tmp_path / "blocker" / "hub_lookups.json", 3600)
+    cache.set("org/model", "abc", True, "LlamaForCausalLM")
+
+    cache.save()
+
+    assert cache._dirty
+
+def test_cache_file_is_read_and_written_off_the_event_loop(leaderboard_service, monkeypatch):
+    threads = []
+    cache = leaderboard_service.hub_lookup_cache
+    for name in ("load", "save"):
+        method = getattr(cache, name)
+        def record(method=method, name=name):
+            threads.append((name, threading.current_thread().name))
+            method()
+        monkeypatch.setattr(cache, name, record)
+
+    asyncio.run(leaderboard_service._resolve_hub_info(make_eval_results(3)))
+
+    assert [name for name, _ in threads] == ["load", "save"]
+    assert all(thread.startswith("cpu") for _, thread in threads)
+    assert cache.path.exists()
+
+def test_lookups_are_used_even_when_the_cache_keeps_nothing(leaderboard_service):
+    leaderboard_service.hub_lookup_cache = HubLookupCache(leaderboard_service.hub_lookup_cache.path, 0)
+    eval_results = make_eval_results(2)
+
+    asyncio.run(leaderboard_service._resolve_hub_info(eval_results))
+
+    assert all(eval_result.still_on_hub for eval_result in eval_results)
+    assert {eval_result.architecture for eval_result in eval_results} == {"LlamaForCausalLM"}
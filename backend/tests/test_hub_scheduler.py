@@ -0,0 +1,180 @@
+import time
+import asyncio
+from types import SimpleNamespace
+from app.core import executors
+from app.core import hub_scheduler as hub_scheduler_module
+from app.core.hub_scheduler import HubScheduler, interactive_hub_calls, parse_retry_after
+from app.services import votes as votes_module
+from app.services.votes import VoteService
+
+def test_background_calls_leave_the_reserve_to_interactive_ones():
+    async def run():
+        scheduler = HubScheduler(4, 1, 0)
+        order = []
+
+        async def call(name, duration=0.02):
+            async with scheduler.slot():
+                order.append(name)
+                await asyncio.sleep(duration)
+
+        background = [asyncio.create_task(call(f"background-{i}")) for i in range(20)]
+        await asyncio.sleep(0.005)
+        in_flight = scheduler.stats()["in_flight"]
+        with interactive_hub_calls():
+            interactive = asyncio.create_task(call("interactive", 0))
+        await asyncio.gather(*background, interactive)
+        return in_flight, order.index("interactive"), scheduler.stats()
+
+    in_flight, position, stats = asyncio.run(run())
+
+    assert in_flight == 3
+    # Admitted at once through the reserved slot, ahead of the queued background calls
+    assert position == 3
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+    assert stats["interactive"] == 1 and stats["background"] == 20
+
+def test_rate_limit_spreads_admissions():
+    async def run():
+        scheduler = HubScheduler(100, 0, 50)
+
+        async def call():
+            async with scheduler.slot():
+                pass
+
+        start = time.perf_counter()
+        await asyncio.gather(*[call() for _ in range(75)])
+        return time.perf_counter() - start
+
+    # A burst of 50, then 25 more at 50/s
+    assert 0.4 < asyncio.run(run()) < 2
+
+def test_throttle_pauses_every_caller_and_backs_off():
+    async def run():
+        scheduler = HubScheduler(8, 1, 0)
+
+        async def call():
+            async with scheduler.slot():
+                pass
+
+        scheduler.throttled(0.2)
+        start = time.perf_counter()
+        await asyncio.gather(*[call() for _ in range(5)])
+        paused = time.perf_counter() - start
+        scheduler.throttled()
+        backoff = scheduler._backoff
+        scheduler.succeeded()
+        return paused, backoff, scheduler._backoff
+
+    paused, backoff, reset = asyncio.run(run())
+
+    # The loop timer may fire a clock tick early
+    assert paused >= 0.19
+    assert backoff == 2 * hub_scheduler_module.THROTTLE_BACKOFF
+    assert reset == 0
+
+def test_cancelled_waiter_gives_its_slot_back():
+    async def run():
+        scheduler = HubScheduler(1, 0, 0)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot():
+                await release.wait()
+
+        async def call():
+            async with scheduler.slot():
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        release.set()
+        await holder
+        await asyncio.wait_for(call(), 1)
+        return scheduler.stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+    assert parse_retry_after("100000") == hub_scheduler_module.RETRY_AFTER_MAX
+
+def test_run_hub_io_reports_429s(monkeypatch):
+    scheduler = HubScheduler(4, 1, 0)
+    monkeypatch.setattr(executors, "hub_scheduler", scheduler)
+
+    class RateLimited(Exception):
+        response = SimpleNamespace(status_code=429, headers={"Retry-After": "7"})
+
+    def call():
+        raise RateLimited()
+
+    async def run():
+        try:
+            await executors.run_hub_io(call)
+        except RateLimited:
+            pass
+
+    asyncio.run(run())
+
+    assert scheduler.stats()["throttled"] == 1
+    assert scheduler._paused_until - time.monotonic() > 6
+
+class FakeResponse:
+    def __init__(self, status, lines=(), headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content = self._lines(lines)
+
+    async def _lines(self, lines):
+        for line in lines:
+            yield line
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeSession:
+    def __init__(self, scheduler, response):
+        self.scheduler = scheduler
+        self.response = response
+        self.in_flight = []
+
+    def get(self, url, headers=None):
+        self.in_flight.append(self.scheduler.stats()["in_flight"])
+        return self.response
+
+def count_remote_votes(monkeypatch, response):
+    scheduler = HubScheduler(4, 1, 0)
+    session = FakeSession(scheduler, response)
+
+    async def get_http_session():
+        return session
+
+    monkeypatch.setattr(votes_module, "hub_scheduler", scheduler)
+    monkeypatch.setattr(votes_module, "get_http_session", get_http_session)
+    count = asyncio.run(VoteService()._count_remote_votes())
+    return count, scheduler, session
+
+def test_remote_vote_count_goes_through_the_scheduler(monkeypatch):
+    count, scheduler, session = count_remote_votes(monkeypatch, FakeResponse(200, [b'{"a": 1}\n', b"\n", b'{"b": 2}\n']))
+
+    assert count == 2
+    assert session.in_flight == [1]
+    assert scheduler.stats()["background"] == 1 and scheduler.stats()["in_flight"] == 0
+
+def test_remote_vote_count_reports_429s(monkeypatch):
+    count, scheduler, _ = count_remote_votes(monkeypatch, FakeResponse(429, headers={"Retry-After": "5"}))
+
+    assert count == 0
+    assert scheduler.stats()["throttled"] == 1
+    assert scheduler._paused_until - time.monotonic() > 4
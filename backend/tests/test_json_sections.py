@@ -0,0 +1,39 @@
+import json
+from app.core.json_sections import extract_sections, load_json_sections
+
+KEYS = ("config_general", "results")
+
+def expected(text):
+    data = json.loads(text)
+    return {key: data[key] for key in KEYS if key in data}
+
+def test_matches_json_load_on_an_indented_document():
+    text = json.dumps({
+        "config_general": {"model_name": "org/model", "note": 'a } and a " in a string'},
+        "results": {"task": {"acc": 0.5}},
+        "config_tasks": {"task": {"results": [1, 2, {"x": "]"}]}},
+    }, indent=2)
+
+    assert extract_sections(text, KEYS) == expected(text)
+
+def test_nested_key_at_the_top_level_indentation_is_not_a_section():
+    # Hand-written layout: the nested "results" sits at the same indentation as the top-level keys
+    text = '{\n  "config_general": {"model_name": "org/model"},\n  "results": {"task": 1},\n  "summary": {\n  "results": "nested"\n  }\n}'
+
+    assert extract_sections(text, KEYS) == expected(text) == {
+        "config_general": {"model_name": "org/model"}, "results": {"task": 1}
+    }
+
+def test_repeated_top_level_key_keeps_its_last_value():
+    text = '{\n  "results": 1,\n  "config_general": {},\n  "results": 2\n}'
+
+    assert extract_sections(text, KEYS) == expected(text)
+
+def test_unexpected_layouts_fall_back(tmp_path):
+    compact = json.dumps({"config_general": {}, "results": {"task": 1}})
+    assert extract_sections(compact, KEYS) is None
+    assert extract_sections('{\n  "results": {}\n}', KEYS) is None
+
+    path = tmp_path / "results.json"
+    path.write_text(compact)
+    assert load_json_sections(str(path), KEYS) == expected(compact)
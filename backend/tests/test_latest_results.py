@@ -0,0 +1,55 @@
+import asyncio
+import dataclasses
+from benchmarks.synthetic_results import generate_results_tree
+from app.core.manifest import FileManifest
+from app.services import leaderboard as leaderboard_module
+from tests.conftest import write_result, gpqa, ifeval, bac
+
+def ingest(service, root, latest_only, monkeypatch):
+    """Ingest a results tree from scratch, keyed by eval name"""
+    monkeypatch.setattr(leaderboard_module, "RESULTS_LATEST_ONLY", latest_only)
+    service.result_manifest = FileManifest()
+    service._eval_results = {}
+    eval_results = asyncio.run(service.get_raw_eval_results(str(root), str(root)))
+    return {eval_result.eval_name: dataclasses.asdict(eval_result) for eval_result in eval_results}
+
+def test_latest_only_matches_full_ingestion_on_split_runs(leaderboard_service, tmp_path, monkeypatch):
+    # Newest run hidden (no bac-fr): its tasks must not prune the older runs the merge keeps
+    write_result(tmp_path, "org/split", "2025-01-01T00-00-00", {**gpqa(0.3), **ifeval(0.3), **bac(0.3)})
+    write_result(tmp_path, "org/split", "2025-01-02T00-00-00", bac(0.5))
+    write_result(tmp_path, "org/split", "2025-01-03T00-00-00", {**gpqa(0.9), **ifeval(0.9)})
+    # Newest run shown but partial, completed by an older one
+    write_result(tmp_path, "org/partial", "2025-01-01T00-00-00", {**gpqa(0.4), **ifeval(0.4), **bac(0.4)})
+    write_result(tmp_path, "org/partial", "2025-01-02T00-00-00", bac(0.6))
+    # Every run hidden
+    write_result(tmp_path, "org/hidden", "2025-01-01T00-00-00", gpqa(0.4))
+    write_result(tmp_path, "org/hidden", "2025-01-02T00-00-00", ifeval(0.4))
+
+    full = ingest(leaderboard_service, tmp_path, False, monkeypatch)
+    latest = ingest(leaderboard_service, tmp_path, True, monkeypatch)
+
+    assert latest == full
+    assert full["org_split_bfloat16"]["results"] == {
+        "community|gpqa-fr|0": 30.0, "community|ifeval-fr|0": 30.0, "community|bac-fr|0": 50.0
+    }
+    assert "org_hidden_bfloat16" not in full
+
+def test_latest_only_skips_covered_runs(leaderboard_service, tmp_path):
+    write_result(tmp_path, "org/model", "2025-01-01T00-00-00", gpqa(0.1))
+    write_result(tmp_path, "org/model", "2025-01-02T00-00-00", {**gpqa(0.2), **ifeval(0.2), **bac(0.2)})
+    write_result(tmp_path, "org/model", "2025-01-03T00-00-00", {**gpqa(0.3), **ifeval(0.3), **bac(0.3)})
+    filepaths = leaderboard_service._list_result_files(str(tmp_path))
+
+    selected, parsed = asyncio.run(leaderboard_service._select_latest_results(filepaths))
+
+    assert selected == filepaths[-1:]
+    assert list(parsed) == filepaths[-1:]
+
+def test_latest_only_matches_full_ingestion_on_synthetic_tree(leaderboard_service, tmp_path, monkeypatch):
+    requests = generate_results_tree(tmp_path, 300, runs_per_model=3, metadata_kb=1, missing_rate=0.3)
+    leaderboard_service.model_service.request_index = type(leaderboard_service.model_service.request_index)(requests)
+
+    full = ingest(leaderboard_service, tmp_path, False, monkeypatch)
+    latest = ingest(leaderboard_service, tmp_path, True, monkeypatch)
+
+    assert latest == full
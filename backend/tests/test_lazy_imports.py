@@ -0,0 +1,15 @@
+import sys
+import subprocess
+from benchmarks.import_time import BACKEND_DIR, LAZY_MODULES
+
+def test_importing_the_app_loads_no_heavy_library():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.asgi; print('\\n'.join(sys.modules))"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    loaded = set(result.stdout.split())
+    assert [module for module in LAZY_MODULES if module in loaded] == []
@@ -0,0 +1,175 @@
+import json
+import time
+import pytest
+from fastapi.testclient import TestClient
+from app.asgi import app
+from app.core.payloads import brotli
+from app.services.leaderboard import ModelType, Precision
+from tests.conftest import make_eval_results
+
+MODEL_TYPES = [ModelType.PT, ModelType.FT, ModelType.CHAT]
+
+def install_snapshot(service, count: int, version: int = 1):
+    """Serve a snapshot of `count` models with varied metadata"""
+    eval_results = make_eval_results(count)
+    for i, eval_result in enumerate(eval_results):
+        eval_result.model_type = MODEL_TYPES[i % len(MODEL_TYPES)]
+        eval_result.precision = Precision.float16 if i % 2 else Precision.bfloat16
+        eval_result.num_params = i
+        eval_result.likes = count - i
+    # Last model has no score on one task
+    eval_results[-1].results = {k: v for k, v in eval_results[-1].results.items() if k != "community|gpqa-fr|0"}
+    service._snapshot = service._compile_snapshot(version, eval_results, time.time())
+    return service._snapshot
+
+@pytest.fixture
+def client(leaderboard_service):
+    # Without a context manager the startup hooks, and so any hub access, never run
+    return TestClient(app)
+
+def test_full_leaderboard_is_served_with_an_etag_and_version(leaderboard_service, client):
+    snapshot = install_snapshot(leaderboard_service, 20, version=7)
+
+    response = client.get("/api/leaderboard/formatted")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == snapshot.formatted_payload.etag
+    assert response.headers["X-Leaderboard-Version"] == "7"
+    assert response.headers["X-Total-Count"] == "20"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json() == json.loads(json.dumps(list(snapshot.records())))
+
+def test_matching_etag_gets_a_304(leaderboard_service, client):
+    snapshot = install_snapshot(leaderboard_service, 20)
+    etag = snapshot.raw_payload.etag
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get("/api/leaderboard", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["X-Leaderboard-Version"] == "1"
+
+    assert client.get("/api/leaderboard", headers={"If-None-Match": '"other"'}).status_code == 200
+
+def test_new_snapshot_invalidates_the_etag(leaderboard_service, client):
+    etag = install_snapshot(leaderboard_service, 20).formatted_payload.etag
+    install_snapshot(leaderboard_service, 21, version=2)
+
+    response = client.get("/api/leaderboard/formatted", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.headers["X-Leaderboard-Version"] == "2"
+    assert len(response.json()) == 21
+
+@pytest.mark.parametrize("accept_encoding,encoding", [
+    ("gzip, deflate, br", "br" if brotli is not None else "gzip"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("identity", None),
+])
+def test_best_accepted_encoding_is_served(leaderboard_service, client, accept_encoding, encoding):
+    snapshot = install_snapshot(leaderboard_service, 20)
+
+    response = client.get("/api/leaderboard/formatted", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("Content-Encoding") == encoding
+    assert response.headers["Vary"] == "Accept-Encoding"
+    # Decoded by the client into the exact pre-rendered body
+    assert response.content == bytes(snapshot.formatted_payload.body)
+
+def names(response):
+    return [row["model"]["name"] for row in response.json()]
+
+def test_rows_are_sorted_by_any_key(leaderboard_service, client):
+    snapshot = install_snapshot(leaderboard_service, 20)
+    by_average = sorted(snapshot.records(), key=lambda row: -row["model"]["average_score"])
+
+    assert names(client.get("/api/leaderboard/formatted?sort=average_score&limit=20")) == [row["model"]["name"] for row in by_average]
+    assert names(client.get("/api/leaderboard/formatted?sort=params&order=asc")) == [f"org/model-{i}" for i in range(20)]
+    assert names(client.get("/api/leaderboard/formatted?sort=likes&order=asc")) == [f"org/model-{i}" for i in reversed(range(20))]
+    assert names(client.get("/api/leaderboard/formatted?sort=name&order=asc")) == sorted(f"org/model-{i}" for i in range(20))
+    # A model missing the task comes last in both directions
+    for order in ("asc", "desc"):
+        gpqa = client.get(f"/api/leaderboard/formatted?sort=gpqa_fr&order={order}").json()
+        scores = [row["evaluations"]["gpqa_fr"]["normalized_score"] for row in gpqa[:-1]]
+        assert scores == sorted(scores, reverse=order == "desc")
+        assert gpqa[-1]["model"]["name"] == "org/model-19"
+
+def test_filters_combine(leaderboard_service, client):
+    install_snapshot(leaderboard_service, 20)
+
+    response = client.get("/api/leaderboard/formatted?model_type=pretrained&precision=bfloat16&sort=params&order=asc")
+    assert names(response) == ["org/model-0", "org/model-6", "org/model-12", "org/model-18"]
+    assert response.headers["X-Total-Count"] == "4"
+
+    response = client.get("/api/leaderboard/formatted?model_type=pretrained&model_type=chatmodels&min_params=5&max_params=10&sort=params&order=asc")
+    assert names(response) == ["org/model-5", "org/model-6", "org/model-8", "org/model-9"]
+
+    response = client.get("/api/leaderboard/formatted?architecture=LlamaForCausalLM")
+    assert response.headers["X-Total-Count"] == "0" and response.json() == []
+
+def test_search_matches_name_prefixes_with_or_without_the_organization(leaderboard_service, client):
+    install_snapshot(leaderboard_service, 20)
+    expected = sorted(["org/model-1"] + [f"org/model-{i}" for i in range(10, 20)])
+
+    for search in ("model-1", "org/model-1", "ORG/Model-1"):
+        response = client.get(f"/api/leaderboard/formatted?search={search}&sort=name&order=asc")
+        assert names(response) == expected
+        assert response.headers["X-Total-Count"] == "11"
+    assert client.get("/api/leaderboard/formatted?search=odel").json() == []
+
+def test_pages_report_the_total_count(leaderboard_service, client):
+    install_snapshot(leaderboard_service, 20)
+
+    response = client.get("/api/leaderboard/formatted?sort=params&order=asc&offset=5&limit=5")
+    assert names(response) == [f"org/model-{i}" for i in range(5, 10)]
+    assert response.headers["X-Total-Count"] == "20"
+    assert response.headers["X-Leaderboard-Version"] == "1"
+
+    response = client.get("/api/leaderboard/formatted?precision=float16&sort=params&order=asc&offset=8&limit=5")
+    assert names(response) == ["org/model-17", "org/model-19"]
+    assert response.headers["X-Total-Count"] == "10"
+
+def test_invalid_queries_are_rejected(leaderboard_service, client):
+    install_snapshot(leaderboard_service, 5)
+
+    response = client.get("/api/leaderboard/formatted?sort=speed")
+    assert response.status_code == 400
+    assert "Unknown sort key 'speed'" in response.json()["detail"]
+    assert client.get("/api/leaderboard/formatted?order=sideways").status_code == 422
+    assert client.get("/api/leaderboard/formatted?limit=0").status_code == 422
+
+def ndjson_rows(response):
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    assert response.content.endswith(b"\n")
+    return [json.loads(line) for line in response.content.splitlines()]
+
+def test_streamed_rows_match_the_json_payload(leaderboard_service, client):
+    # Spans several streamed batches
+    snapshot = install_snapshot(leaderboard_service, 250, version=3)
+
+    response = client.get("/api/leaderboard/formatted?stream=1")
+
+    assert ndjson_rows(response) == json.loads(bytes(snapshot.formatted_payload.body))
+    assert response.headers["X-Total-Count"] == "250"
+    assert response.headers["X-Leaderboard-Version"] == "3"
+
+def test_accept_header_streams_like_the_query_parameter(leaderboard_service, client):
+    snapshot = install_snapshot(leaderboard_service, 150)
+
+    response = client.get("/api/leaderboard", headers={"Accept": "application/x-ndjson"})
+
+    assert ndjson_rows(response) == json.loads(bytes(snapshot.raw_payload.body))
+    assert response.headers["X-Leaderboard-Version"] == "1"
+
+def test_streamed_pages_match_the_json_pages(leaderboard_service, client):
+    install_snapshot(leaderboard_service, 250)
+    query = "model_type=pretrained&sort=name&order=asc&offset=10&limit=50"
+
+    page = client.get(f"/api/leaderboard/formatted?{query}")
+    streamed = client.get(f"/api/leaderboard/formatted?{query}", headers={"Accept": "application/x-ndjson"})
+
+    assert ndjson_rows(streamed) == page.json()
+    assert streamed.headers["X-Total-Count"] == page.headers["X-Total-Count"] == "84"
@@ -0,0 +1,75 @@
+import json
+from app.services.leaderboard import EVALUATIONS
+from app.services.leaderboard_table import LeaderboardTable
+from app.services.leaderboard_changes import ChangeHistory, diff_tables, source_record
+from tests.conftest import make_eval_results
+
+def table(eval_results):
+    return LeaderboardTable.from_results(eval_results, EVALUATIONS)
+
+def formatted(table):
+    return table.to_records(table.sorted_index("average_score"))
+
+def test_one_added_model_yields_a_one_row_delta():
+    results = make_eval_results(131)
+    old, new = table(results[:130]), table(results)
+    old_rows, new_rows = formatted(old), formatted(new)
+    # Every existing row moves in rank or percentile
+    assert sum(1 for a, b in zip(sorted(old_rows, key=lambda r: r["id"]), sorted(new_rows, key=lambda r: r["id"])) if a != b) > 100
+
+    diff = diff_tables(1, 2, old, new)
+
+    assert list(diff.added) == ["org/model-130_Precision.bfloat16"]
+    assert diff.added["org/model-130_Precision.bfloat16"] == source_record(new.record(130))
+    assert diff.updated == {} and diff.removed == []
+    assert len(json.dumps(diff.to_dict())) < len(json.dumps(new_rows)) / 50
+
+def test_delta_rows_carry_source_fields_only():
+    record = formatted(table(make_eval_results(3)))[0]
+
+    source = source_record(record)
+
+    assert "rank" not in source["model"]
+    for evaluation in source["evaluations"].values():
+        assert "rank" not in evaluation and "percentile" not in evaluation
+        assert "normalized_score" in evaluation
+    # The snapshot's rows are left untouched
+    assert "rank" in record["model"]
+
+def test_score_change_is_an_update():
+    results = make_eval_results(5)
+    old = table(results)
+    results[2].results = {**results[2].results, EVALUATIONS[0][2]: 99.0}
+
+    diff = diff_tables(1, 2, old, table(results))
+
+    assert list(diff.updated) == ["org/model-2_Precision.bfloat16"]
+    assert diff.updated["org/model-2_Precision.bfloat16"]["evaluations"][EVALUATIONS[0][0]]["value"] == 99.0
+    assert diff.added == {} and diff.removed == []
+
+def test_history_folds_consecutive_diffs():
+    history = ChangeHistory(10)
+    v1, v2, v3 = table(make_eval_results(3)), table(make_eval_results(4)), table(make_eval_results(2))
+    history.append(diff_tables(1, 2, v1, v2))
+    history.append(diff_tables(2, 3, v2, v3))
+
+    net = history.since(1, 3)
+
+    assert net.added == {} and net.updated == {}
+    assert net.removed == ["org/model-2_Precision.bfloat16"]
+    assert history.since(0, 3) is None
+    assert not history.since(3, 3)
+
+def test_versions_inside_a_jumped_diff_are_reset():
+    history = ChangeHistory(10)
+    v1, v3, v7 = table(make_eval_results(3)), table(make_eval_results(4)), table(make_eval_results(5))
+    history.append(diff_tables(1, 3, v1, v3))
+    # A follower polling the leader skipped versions 4 to 6
+    history.append(diff_tables(3, 7, v3, v7))
+
+    assert list(history.since(3, 7).added) == ["org/model-4_Precision.bfloat16"]
+    assert len(history.since(1, 7).added) == 2
+    for version in (2, 4, 5, 6, 8):
+        assert history.since(version, 7) is None
+    # History not reaching the current version covers nothing
+    assert history.since(3, 8) is None
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from app.core.snapshot_store import VersionedSnapshotStore
+from app.services import leaderboard as leaderboard_module
+from tests.conftest import make_eval_results
+
+@pytest.fixture
+def leader(leaderboard_service, tmp_path, monkeypatch):
+    monkeypatch.setattr(leaderboard_module, "leader_election", SimpleNamespace(is_leader=lambda: True))
+    leaderboard_service.snapshot_store = VersionedSnapshotStore(tmp_path / "snapshots", "leaderboard")
+
+    async def no_download():
+        pass
+
+    monkeypatch.setattr(leaderboard_service, "_download_results", no_download)
+    return leaderboard_service
+
+def serve_results(service, monkeypatch, results, release=None):
+    """Make refreshes ingest results, or raise them, once release is set"""
+    async def get_raw_eval_results(results_path, requests_path):
+        if release is not None:
+            await release.wait()
+        if isinstance(results, Exception):
+            raise results
+        return results
+
+    monkeypatch.setattr(service, "get_raw_eval_results", get_raw_eval_results)
+
+def test_readers_see_the_previous_snapshot_until_the_new_one_is_swapped_in(leader, monkeypatch):
+    serve_results(leader, monkeypatch, make_eval_results(3))
+    asyncio.run(leader._refresh_raw_data())
+    first = leader.snapshot
+
+    async def run():
+        release = asyncio.Event()
+        serve_results(leader, monkeypatch, make_eval_results(4), release)
+        refresh = asyncio.create_task(leader._refresh_raw_data())
+        await asyncio.sleep(0.01)
+        during = await leader.get_snapshot()
+        release.set()
+        await refresh
+        return during
+
+    assert asyncio.run(run()) is first
+    assert leader.snapshot.version == first.version + 1 and len(leader.snapshot) == 4
+
+    # Nothing changed: the current snapshot and its version are kept
+    second = leader.snapshot
+    asyncio.run(leader._refresh_raw_data())
+    assert leader.snapshot is second
+
+def test_failed_refresh_keeps_serving_the_previous_snapshot(leader, monkeypatch):
+    serve_results(leader, monkeypatch, make_eval_results(3))
+    asyncio.run(leader._refresh_raw_data())
+    first = leader.snapshot
+
+    serve_results(leader, monkeypatch, RuntimeError("hub down"))
+    with pytest.raises(HTTPException):
+        asyncio.run(leader._refresh_raw_data())
+
+    assert leader.snapshot is first
+    assert asyncio.run(leader.get_snapshot()) is first
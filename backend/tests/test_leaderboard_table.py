@@ -0,0 +1,55 @@
+import asyncio
+import json
+import time
+import numpy as np
+import pytest
+from app.services.leaderboard import EVALUATIONS
+from app.services.leaderboard_table import LeaderboardTable, rank_descending, rank_percentiles
+from tests.conftest import write_result, gpqa, ifeval, bac, make_eval_results
+
+GPQA, IFEVAL, BAC = "community|gpqa-fr|0", "community|ifeval-fr|0", "community|bac-fr|0"
+
+def test_scores_are_normalized_from_the_random_baseline(leaderboard_service, tmp_path):
+    write_result(tmp_path, "org/above", "2025-01-01T00-00-00", {**gpqa(0.4), **ifeval(0.6), **bac(0.7)})
+    write_result(tmp_path, "org/below", "2025-01-01T00-00-00", {**gpqa(0.1), **ifeval(0.6), **bac(0.7)})
+    data = asyncio.run(leaderboard_service.get_raw_eval_results(str(tmp_path), str(tmp_path)))
+
+    snapshot = leaderboard_service._compile_snapshot(1, data, time.time())
+
+    normalized = {eval_result.full_model: eval_result.normalized_results for eval_result in snapshot.eval_results()}
+    assert normalized["org/above"][GPQA] == pytest.approx(20.0)
+    assert normalized["org/below"][GPQA] == 0.0
+    # Benchmarks without a baseline keep their raw score exactly
+    assert normalized["org/above"][IFEVAL] == 60.0 and normalized["org/above"][BAC] == 70.0
+    # The raw payload still carries them
+    raw = json.loads(bytes(snapshot.raw_payload.body))
+    assert {row["full_model"]: row["normalized_results"] for row in raw} == normalized
+    rows = {row["model"]["name"]: row for row in snapshot.records()}
+    assert rows["org/above"]["evaluations"]["gpqa_fr"]["normalized_score"] == pytest.approx(20.0)
+    assert rows["org/above"]["evaluations"]["gpqa_fr"]["rank"] == 1
+
+def test_ties_share_the_best_rank_and_missing_scores_are_unranked():
+    ranks = rank_descending(np.array([[90.0, 1.0], [80.0, np.nan], [90.0, 2.0], [np.nan, np.nan], [70.0, 3.0]]))
+
+    assert ranks[:, 0].tolist()[:3] == [1, 3, 1] and ranks[4, 0] == 4 and np.isnan(ranks[3, 0])
+    assert ranks[[0, 2, 4], 1].tolist() == [3, 2, 1]
+    # Share of the other ranked models beaten or tied with
+    percentiles = rank_percentiles(ranks)
+    assert percentiles[[0, 1, 4], 0].tolist() == pytest.approx([100.0, 100 / 3, 0.0])
+    assert np.isnan(percentiles[3, 0])
+
+def test_models_missing_a_score_sort_last_in_both_directions():
+    eval_results = make_eval_results(6)
+    key, _, benchmark = EVALUATIONS[0]
+    eval_results[2].results = {k: v for k, v in eval_results[2].results.items() if k != benchmark}
+    table = LeaderboardTable.from_results(eval_results, EVALUATIONS)
+
+    for descending in (True, False):
+        order = table.sorted_index(key, descending).tolist()
+        assert order[-1] == 2
+        scores = [eval_results[i].results[benchmark] for i in order[:-1]]
+        assert scores == sorted(scores, reverse=descending)
+    record = table.record(2)["evaluations"][key]
+    assert (record["value"], record["rank"], record["percentile"]) == (0, None, None)
+    with pytest.raises(ValueError, match="Unknown sort key"):
+        table.sorted_index("speed")
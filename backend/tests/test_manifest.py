@@ -0,0 +1,68 @@
+import os
+import asyncio
+from app.core.manifest import FileManifest
+from tests.conftest import write_result, gpqa, ifeval, bac
+
+def scan_and_record(manifest, paths):
+    changes = manifest.scan(paths)
+    for path in changes.added + changes.changed:
+        manifest.record(path, path)
+    for path in changes.removed:
+        manifest.remove(path)
+    return changes
+
+def test_only_changed_files_are_reported(tmp_path):
+    paths = [str(tmp_path / f"{name}.json") for name in ("a", "b", "c")]
+    for path in paths:
+        with open(path, "w") as f:
+            f.write("{}")
+    manifest = FileManifest()
+
+    assert scan_and_record(manifest, paths).added == paths
+    assert not scan_and_record(manifest, paths)
+
+    # Rewritten with the same content: only its stat changed
+    with open(paths[0], "w") as f:
+        f.write("{}")
+    os.utime(paths[0], (0, 0))
+    # New content, same size
+    with open(paths[1], "w") as f:
+        f.write("[]")
+    os.utime(paths[1], (0, 0))
+    changes = scan_and_record(manifest, paths[:2])
+
+    assert changes.added == [] and changes.changed == [paths[1]] and changes.removed == [paths[2]]
+    assert manifest.cached(paths[0]) == paths[0]
+    assert len(manifest) == 2
+
+def test_refresh_only_parses_changed_result_files(leaderboard_service, tmp_path, monkeypatch):
+    write_result(tmp_path, "org/a", "2025-01-01T00-00-00", {**gpqa(0.4), **ifeval(0.4), **bac(0.4)})
+    changed = write_result(tmp_path, "org/b", "2025-01-01T00-00-00", {**gpqa(0.5), **ifeval(0.5), **bac(0.5)})
+    parsed = []
+    parse = leaderboard_service._parse_result_files
+
+    async def record(filepaths):
+        parsed.append(sorted(os.path.relpath(path, tmp_path) for path in filepaths))
+        return await parse(filepaths)
+
+    monkeypatch.setattr(leaderboard_service, "_parse_result_files", record)
+
+    def refresh():
+        results = asyncio.run(leaderboard_service.get_raw_eval_results(str(tmp_path), str(tmp_path)))
+        return {eval_result.full_model: eval_result.results["community|gpqa-fr|0"] for eval_result in results}
+
+    assert refresh() == {"org/a": 40.0, "org/b": 50.0}
+    assert refresh() == {"org/a": 40.0, "org/b": 50.0}
+
+    write_result(tmp_path, "org/b", "2025-01-01T00-00-00", {**gpqa(0.7), **ifeval(0.5), **bac(0.5)})
+    os.utime(changed, (1, 1))
+    added = write_result(tmp_path, "org/c", "2025-01-01T00-00-00", {**gpqa(0.6), **ifeval(0.6), **bac(0.6)})
+    assert refresh() == {"org/a": 40.0, "org/b": 70.0, "org/c": 60.0}
+
+    os.remove(added)
+    assert refresh() == {"org/a": 40.0, "org/b": 70.0}
+
+    assert [len(paths) for paths in parsed] == [2, 0, 2, 0]
+    assert [os.path.dirname(path) for path in parsed[2]] == [
+        os.path.join("org", "b", "clearML-sprint1.5"), os.path.join("org", "c", "clearML-sprint1.5")
+    ]
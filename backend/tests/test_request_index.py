@@ -0,0 +1,60 @@
+import asyncio
+from app.services.leaderboard import ModelType, WeightType
+from app.services.models import ModelService, RequestIndex
+from tests.conftest import make_eval_results
+
+def request(name, revision, precision="bfloat16", model_type="pretrained", likes=0):
+    return {
+        "name": name,
+        "revision": revision,
+        "precision": precision,
+        "model_type": model_type,
+        "weight_type": "Adapter",
+        "license": "mit",
+        "likes": likes,
+        "params": 7.0,
+        "submission_time": "2025-01-01T00:00:00Z",
+    }
+
+def test_lookup_prefers_the_exact_revision_then_falls_back_to_the_precision():
+    index = RequestIndex({
+        "finished": [request("org/model", "abc", likes=1), request("org/model", "def", likes=2)],
+        "evaluating": [request("org/model", "abc", likes=3)],
+        "pending": [request("org/model", "abc", "float16", likes=4)],
+    })
+
+    assert index.lookup("org/model", "bfloat16", "def")["likes"] == 2
+    # The first match in status order wins, as with the former linear scan
+    assert index.lookup("org/model", "bfloat16", "abc")["likes"] == 1
+    assert index.lookup("org/model", "bfloat16", "unknown")["likes"] == 1
+    assert index.lookup("org/model", "bfloat16")["likes"] == 1
+    assert index.lookup("org/model", "float16", "def")["likes"] == 4
+    assert index.lookup("org/model", "float32") is None
+    assert index.lookup("org/other", "bfloat16", "abc") is None
+
+def test_results_are_joined_to_their_request():
+    eval_result, missing = make_eval_results(2)
+    index = RequestIndex({"finished": [request("org/model-0", "other-revision", model_type="fine-tuned", likes=5)]})
+
+    eval_result.update_with_request_file(index)
+    missing.update_with_request_file(index)
+
+    assert eval_result.model_type == ModelType.FT and eval_result.weight_type == WeightType.Adapter
+    assert (eval_result.likes, eval_result.num_params, eval_result.license) == (5, 7.0, "mit")
+    assert eval_result.date == "2025-01-01T00:00:00Z"
+    assert missing.model_type == ModelType.Unknown and missing.likes == 0
+
+def test_index_is_rebuilt_once_per_cache_generation(monkeypatch):
+    monkeypatch.setattr(ModelService, "_instance", None)
+    service = ModelService()
+    models = {"finished": [request("org/model", "abc")], "evaluating": [], "pending": []}
+
+    async def get_models():
+        return models
+
+    monkeypatch.setattr(service, "get_models", get_models)
+
+    first = asyncio.run(service.get_request_index())
+    assert asyncio.run(service.get_request_index()) is first
+    service.cache_generation += 1
+    assert asyncio.run(service.get_request_index()) is not first
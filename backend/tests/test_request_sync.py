@@ -0,0 +1,160 @@
+import json
+import asyncio
+import hashlib
+from types import SimpleNamespace
+import pytest
+from huggingface_hub.hf_api import RepoFile
+from app.core.cache import cache_config
+from app.services import models as models_module
+from app.services.models import ModelService
+
+LEADER = SimpleNamespace(is_leader=lambda: True)
+
+def request(model, status="PENDING", submitted_time="2025-01-01T00:00:00Z"):
+    return json.dumps({
+        "model": model,
+        "revision": "main",
+        "status": status,
+        "submitted_time": submitted_time,
+        "model_type": "pretrained",
+        "weight_type": "Original",
+        "precision": "bfloat16",
+        "params": 7.0,
+    })
+
+class FakeResponse:
+    def __init__(self, status, text=""):
+        self.status = status
+        self.headers = {}
+        self._text = text
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeQueueRepo:
+    """Serves request files at the current commit, through both the hub API and the HTTP session"""
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.sha = "a" * 40
+        self.broken = set()
+        self.fetched = []
+
+    def commit(self, sha):
+        self.sha = sha * 40
+
+    def repo_info(self, repo_id, repo_type=None, token=None):
+        return SimpleNamespace(sha=self.sha)
+
+    def list_repo_tree(self, repo_id, repo_type=None, revision=None, recursive=False, token=None):
+        for path, content in self.files.items():
+            yield RepoFile(path=path, size=len(content), oid=hashlib.sha1(content.encode()).hexdigest())
+        yield SimpleNamespace(path="README.md")
+
+    def get(self, url, headers=None):
+        path = url.split(f"/resolve/{self.sha}/", 1)[1]
+        self.fetched.append(path)
+        if path in self.broken:
+            return FakeResponse(404)
+        return FakeResponse(200, self.files[path])
+
+@pytest.fixture
+def model_service(tmp_path, monkeypatch):
+    """A fresh ModelService syncing from a fake queue repo"""
+    repo = FakeQueueRepo({f"org/model-{i}_eval_request.json": request(f"org/model-{i}") for i in range(5)})
+
+    async def get_http_session():
+        return repo
+
+    monkeypatch.setattr(models_module, "leader_election", LEADER)
+    monkeypatch.setattr(models_module, "get_http_session", get_http_session)
+    monkeypatch.setattr(cache_config, "requests_snapshot_file", tmp_path / "requests_snapshot.arrow")
+    monkeypatch.setattr(ModelService, "_instance", None)
+    service = ModelService()
+    service.hf_api = repo
+    yield service, repo
+    monkeypatch.setattr(ModelService, "_instance", None)
+
+def refresh(service):
+    return asyncio.run(service._do_refresh_models_cache())
+
+def test_only_changed_request_files_are_fetched(model_service):
+    service, repo = model_service
+    models = refresh(service)
+    assert len(repo.fetched) == 5
+    assert len(models["pending"]) == 5
+
+    # Same commit: nothing is listed nor fetched
+    repo.fetched.clear()
+    refresh(service)
+    assert repo.fetched == []
+
+    # New commit: one request finished, one was deleted, one was added
+    repo.files["org/model-1_eval_request.json"] = request("org/model-1", "FINISHED")
+    del repo.files["org/model-2_eval_request.json"]
+    repo.files["org/new_eval_request.json"] = request("org/new")
+    repo.commit("b")
+    repo.fetched.clear()
+    models = refresh(service)
+
+    assert sorted(repo.fetched) == ["org/model-1_eval_request.json", "org/new_eval_request.json"]
+    assert [model["name"] for model in models["finished"]] == ["org/model-1"]
+    assert sorted(model["name"] for model in models["pending"]) == ["org/model-0", "org/model-3", "org/model-4", "org/new"]
+    assert "org/model-2_eval_request.json" not in service._request_files
+    assert service._synced_sha == "b" * 40
+
+def test_failed_download_is_retried_on_the_next_refresh(model_service):
+    service, repo = model_service
+    refresh(service)
+
+    repo.files["org/model-3_eval_request.json"] = request("org/model-3", "RUNNING")
+    repo.broken.add("org/model-3_eval_request.json")
+    repo.commit("b")
+    models = refresh(service)
+
+    # The file keeps its previous state and the commit is not marked as synced
+    assert models["evaluating"] == []
+    assert service._synced_sha == "a" * 40
+
+    repo.broken.clear()
+    repo.fetched.clear()
+    models = refresh(service)
+
+    assert repo.fetched == ["org/model-3_eval_request.json"]
+    assert [model["name"] for model in models["evaluating"]] == ["org/model-3"]
+    assert service._synced_sha == "b" * 40
+
+def test_status_index_follows_the_latest_request(model_service, monkeypatch):
+    service, repo = model_service
+    repo.files["org/model-0_eval_request_retry.json"] = request("org/model-0", "FAILED", "2025-02-01T00:00:00Z")
+    repo.files["org/model-1_eval_request_old.json"] = request("org/model-1", "FAILED", "2024-12-01T00:00:00Z")
+    refresh(service)
+    monkeypatch.setattr(service, "_initialized", True)
+
+    # Failed requests are not listed, but still give the status of their model
+    assert asyncio.run(service.get_model_status("org/model-0"))["status"] == "FAILED"
+    assert asyncio.run(service.get_model_status("org/model-1"))["status"] == "PENDING"
+    assert asyncio.run(service.get_model_status("org/unknown")) == {"status": "not_found"}
+
+def test_restart_resumes_from_the_persisted_commit(model_service, monkeypatch):
+    service, repo = model_service
+    refresh(service)
+
+    monkeypatch.setattr(ModelService, "_instance", None)
+    restarted = ModelService()
+    restarted.hf_api = repo
+    asyncio.run(restarted._load_persisted_models())
+    repo.files["org/model-4_eval_request.json"] = request("org/model-4", "FINISHED")
+    repo.commit("b")
+    repo.fetched.clear()
+    models = refresh(restarted)
+
+    assert repo.fetched == ["org/model-4_eval_request.json"]
+    assert [model["name"] for model in models["finished"]] == ["org/model-4"]
+    assert len(models["pending"]) == 4
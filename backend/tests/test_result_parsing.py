@@ -0,0 +1,24 @@
+import asyncio
+from benchmarks.synthetic_results import generate_results_tree
+from app.core import executors
+from app.services import leaderboard as leaderboard_module
+from app.services.leaderboard import LeaderboardService, _parse_result_files
+
+def test_process_pool_parsing_matches_serial_parsing(leaderboard_service, tmp_path, monkeypatch):
+    generate_results_tree(tmp_path, 60, runs_per_model=3, metadata_kb=1)
+    paths = LeaderboardService._list_result_files(str(tmp_path))
+    monkeypatch.setattr(leaderboard_module, "INGESTION_WORKERS", 2)
+    monkeypatch.setattr(executors, "INGESTION_WORKERS", 2)
+    monkeypatch.setattr(executors, "_parse_executor", None)
+
+    try:
+        pooled = asyncio.run(leaderboard_service._parse_result_files(paths))
+        pool = executors._parse_executor
+    finally:
+        if executors._parse_executor is not None:
+            executors._parse_executor.shutdown()
+
+    assert pool is not None
+    # Same results, in the order of the given paths
+    assert pooled == _parse_result_files(paths)
+    assert len(pooled) == 60
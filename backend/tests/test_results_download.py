@@ -0,0 +1,49 @@
+import asyncio
+import huggingface_hub
+from app.services import leaderboard as leaderboard_module
+from tests.conftest import CAMPAIGN
+
+def test_latest_only_download_fetches_exact_paths(leaderboard_service, monkeypatch):
+    repo_files = [
+        f"org/model/{CAMPAIGN}/results_2025-01-01T00-00-00.000000.json",
+        f"org/model/{CAMPAIGN}/results_2025-02-01T00-00-00.000000.json",
+        f"org/model[v2]/{CAMPAIGN}/results_2025-01-01T00-00-00.000000.json",
+        f"org/model[v2]/{CAMPAIGN}/results_2024-01-01T00-00-00.000000.json",
+        "org/model/other-campaign/results_2025-03-01T00-00-00.000000.json",
+        "README.md",
+    ]
+    fetched = []
+
+    def hf_hub_download(repo_id, filename, **kwargs):
+        fetched.append(filename)
+
+    def snapshot_download(**kwargs):
+        raise AssertionError("latest-only downloads must not go through allow_patterns")
+
+    monkeypatch.setattr(leaderboard_module, "RESULTS_DOWNLOAD_LATEST_ONLY", True)
+    monkeypatch.setattr(huggingface_hub, "list_repo_files", lambda *args, **kwargs: repo_files)
+    monkeypatch.setattr(huggingface_hub, "hf_hub_download", hf_hub_download)
+    monkeypatch.setattr(huggingface_hub, "snapshot_download", snapshot_download)
+
+    asyncio.run(leaderboard_service._download_results())
+
+    assert sorted(fetched) == [
+        f"org/model/{CAMPAIGN}/results_2025-02-01T00-00-00.000000.json",
+        f"org/model[v2]/{CAMPAIGN}/results_2025-01-01T00-00-00.000000.json",
+    ]
+
+def test_full_download_only_fetches_the_campaign_result_files(leaderboard_service, monkeypatch):
+    calls = []
+
+    def snapshot_download(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(leaderboard_module, "RESULTS_DOWNLOAD_LATEST_ONLY", False)
+    monkeypatch.setattr(leaderboard_module, "RESULTS_CAMPAIGNS", [CAMPAIGN, "other-campaign"])
+    monkeypatch.setattr(huggingface_hub, "snapshot_download", snapshot_download)
+
+    asyncio.run(leaderboard_service._download_results())
+
+    assert len(calls) == 1
+    assert calls[0]["allow_patterns"] == [f"*/{CAMPAIGN}/*.json", "*/other-campaign/*.json"]
+    assert calls[0]["repo_type"] == "dataset"
@@ -0,0 +1,129 @@
+import time
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.core import warmup as warmup_module
+from app.core.cache import cache_config
+from app.core.leader import AwaitingLeader
+from app.core.snapshot_store import VersionedSnapshotStore
+from app.core.warmup import Warmup
+from app.services import leaderboard as leaderboard_module
+from app.services import models as models_module
+from app.services.models import ModelService
+from tests.conftest import make_eval_results
+
+FOLLOWER = SimpleNamespace(is_leader=lambda: False)
+
+async def never_build():
+    raise AssertionError("a follower must not build from the hub")
+
+def test_follower_waits_for_the_leader_snapshot(leaderboard_service, tmp_path, monkeypatch):
+    monkeypatch.setattr(leaderboard_module, "leader_election", FOLLOWER)
+    monkeypatch.setattr(leaderboard_service, "_refresh_raw_data", never_build)
+    leaderboard_service.snapshot_store = VersionedSnapshotStore(tmp_path / "snapshots", "leaderboard")
+
+    with pytest.raises(AwaitingLeader) as error:
+        asyncio.run(leaderboard_service.get_snapshot())
+    assert error.value.status_code == 503
+    assert "Retry-After" in error.value.headers
+
+    # The leader publishes: the follower serves its version and payloads
+    published = leaderboard_service._compile_snapshot(3, make_eval_results(5), time.time())
+    leaderboard_service._publish_snapshot(published)
+    snapshot = asyncio.run(leaderboard_service.get_snapshot())
+
+    assert snapshot.version == 3
+    assert snapshot.formatted_payload.etag == published.formatted_payload.etag
+
+def test_follower_waits_for_the_leader_request_list(tmp_path, monkeypatch):
+    monkeypatch.setattr(models_module, "leader_election", FOLLOWER)
+    monkeypatch.setattr(cache_config, "requests_snapshot_file", tmp_path / "requests_snapshot.arrow")
+    service = ModelService()
+    monkeypatch.setattr(service, "_do_refresh_models_cache", never_build)
+    monkeypatch.setattr(service, "cached_models", None)
+
+    with pytest.raises(AwaitingLeader):
+        asyncio.run(service._refresh_models_cache())
+
+def test_warmup_polls_while_awaiting_the_leader(monkeypatch):
+    monkeypatch.setattr(warmup_module, "SHARED_SNAPSHOT_POLL_INTERVAL", 0.01)
+    attempts = []
+
+    async def step():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise AwaitingLeader("Leaderboard snapshot")
+
+    async def run():
+        warmup = Warmup()
+        seen = set()
+        await warmup.run({"leaderboard": step}, deadline=0)
+        while not warmup.ready:
+            seen.add(warmup.status()["services"]["leaderboard"]["status"])
+            await asyncio.sleep(0.005)
+        return seen
+
+    seen = asyncio.run(run())
+
+    assert "waiting" in seen
+    assert len(attempts) == 3
+    # Polled at the follower interval, not backed off
+    assert attempts[-1] - attempts[0] < 0.5
+
+def test_versions_continue_from_the_published_snapshot(leaderboard_service, tmp_path, monkeypatch):
+    monkeypatch.setattr(leaderboard_module, "leader_election", SimpleNamespace(is_leader=lambda: True))
+    leaderboard_service.snapshot_store = VersionedSnapshotStore(tmp_path / "snapshots", "leaderboard")
+    leaderboard_service._publish_snapshot(leaderboard_service._compile_snapshot(5, make_eval_results(3), time.time()))
+
+    async def no_download():
+        pass
+
+    async def results(results_path, requests_path):
+        return make_eval_results(4)
+
+    # A new leader that could not restore the published snapshot
+    monkeypatch.setattr(leaderboard_service, "_download_results", no_download)
+    monkeypatch.setattr(leaderboard_service, "get_raw_eval_results", results)
+    asyncio.run(leaderboard_service._build_snapshot())
+
+    assert leaderboard_service.snapshot.version == 6
+    assert leaderboard_service.snapshot_store.current()["version"] == 6
+
+def test_followers_serve_the_mapped_columns_without_rebuilding(leaderboard_service, tmp_path, monkeypatch):
+    import pyarrow as pa
+
+    leaderboard_service.snapshot_store = VersionedSnapshotStore(tmp_path / "snapshots", "leaderboard")
+
+    def eval_results(count):
+        eval_results = make_eval_results(count)
+        for i, eval_result in enumerate(eval_results):
+            eval_result.model_type = leaderboard_module.ModelType.PT if i % 2 else leaderboard_module.ModelType.FT
+        return eval_results
+
+    first = leaderboard_service._compile_snapshot(1, eval_results(40), time.time())
+    second = leaderboard_service._compile_snapshot(2, eval_results(41), time.time())
+    leaderboard_service._publish_snapshot(first)
+
+    def rebuild(table):
+        raise AssertionError("a follower must not rebuild EvalResults")
+
+    monkeypatch.setattr(leaderboard_module, "eval_results_from_arrow", rebuild)
+    monkeypatch.setattr(leaderboard_service, "_build_table", rebuild)
+    allocated = pa.total_allocated_bytes()
+    mapped_first = leaderboard_service._load_published_snapshot()
+    leaderboard_service._publish_snapshot(second)
+    mapped_second = leaderboard_service._load_published_snapshot(newer_than=1)
+
+    # Columns stay in the mapped files, numpy arrays are read-only views on them
+    assert pa.total_allocated_bytes() == allocated
+    assert not mapped_second.table.average.flags.writeable
+    assert mapped_second.formatted_payload.body.obj.parent is not None
+    assert bytes(mapped_second.formatted_payload.body) == bytes(second.formatted_payload.body)
+    filters = {"sort": "params", "descending": False, "model_types": ["pretrained"], "name_prefix": "model-1"}
+    total, page = mapped_second.query(offset=1, limit=5, **filters)
+    assert (total, page) == second.query(offset=1, limit=5, **filters)
+    assert total == 6 and [row["model"]["name"] for row in page] == [f"org/model-{i}" for i in (11, 13, 15, 17, 19)]
+    assert list(mapped_second.records()) == list(second.records())
+    mapped_diff = leaderboard_module.diff_tables(1, 2, mapped_first.table, mapped_second.table)
+    assert mapped_diff == leaderboard_module.diff_tables(1, 2, first.table, second.table)
+    assert list(mapped_diff.added) == ["org/model-40_Precision.bfloat16"]
@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from app.core.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    async def run():
+        flight = SingleFlight()
+        executions = []
+
+        async def refresh(value):
+            executions.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(*(flight.do("refresh", refresh, i) for i in range(10)))
+        other = await flight.do("other", refresh, "other")
+        # Once done, the next call runs again
+        again = await flight.do("refresh", refresh, "again")
+        return results, other, again, executions, flight
+
+    results, other, again, executions, flight = asyncio.run(run())
+
+    assert results == [0] * 10
+    assert (other, again) == ("other", "again")
+    assert executions == [0, "other", "again"]
+    assert flight.stats()["refresh"] == {"calls": 11, "executions": 2, "coalesced": 9}
+    assert not flight.in_flight("refresh")
+
+def test_errors_reach_every_waiter_and_are_not_cached():
+    async def run():
+        flight = SingleFlight()
+        attempts = []
+
+        async def refresh():
+            attempts.append(None)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise RuntimeError("hub down")
+            return "ok"
+
+        results = await asyncio.gather(*(flight.do("refresh", refresh) for _ in range(5)), return_exceptions=True)
+        return results, await flight.do("refresh", refresh)
+
+    results, retried = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retried == "ok"
+
+def test_cancelled_waiter_leaves_the_shared_work_running():
+    async def run():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("refresh", refresh))
+        second = asyncio.create_task(flight.do("refresh", refresh))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pytest
+from app.core.snapshot_store import VersionedSnapshotStore, atomic_file, read_snapshot, write_snapshot
+
+def test_concurrent_writers_never_tear_the_file(tmp_path):
+    path = tmp_path / "snapshot.arrow"
+    tables = [pa.table({"writer": [writer] * 50_000}) for writer in range(8)]
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda table: write_snapshot(path, table, {}), tables))
+
+    table, _ = read_snapshot(path)
+    assert len(set(table.column("writer").to_pylist())) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["snapshot.arrow"]
+
+def test_failed_write_leaves_no_temporary_file(tmp_path):
+    path = tmp_path / "snapshot.arrow"
+
+    write_snapshot(path, pa.table({"a": [1]}), {})
+
+    with pytest.raises(RuntimeError):
+        with atomic_file(path, "wb") as f:
+            f.write(b"partial")
+            raise RuntimeError()
+
+    assert [p.name for p in tmp_path.iterdir()] == ["snapshot.arrow"]
+    assert read_snapshot(path)[0].column("a").to_pylist() == [1]
+
+def test_publish_points_to_complete_versions_and_prunes_old_ones(tmp_path):
+    store = VersionedSnapshotStore(tmp_path, "leaderboard", keep=2)
+    for version in range(1, 5):
+        store.publish(version, {"results": pa.table({"version": [version]})}, {"created_at": 0})
+
+    pointer, parts = store.load()
+
+    assert pointer["version"] == 4
+    assert parts["results"].column("version").to_pylist() == [4]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "leaderboard-00000003.results.arrow",
+        "leaderboard-00000004.results.arrow",
+        "leaderboard.current.json",
+    ]
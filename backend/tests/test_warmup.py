@@ -0,0 +1,44 @@
+import asyncio
+from app.core.warmup import Warmup
+
+def test_start_returns_before_steps_complete():
+    async def run():
+        warmup = Warmup()
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        async def fast():
+            pass
+
+        report = warmup.start({"slow": slow, "fast": fast}, deadline=10)
+        started = warmup.status()
+        await asyncio.sleep(0.01)
+        progress = warmup.status()
+        release.set()
+        ready = await report
+        await warmup.stop()
+        return started, progress, ready
+
+    started, progress, ready = asyncio.run(run())
+
+    assert not started["ready"]
+    assert {step["status"] for step in started["services"].values()} == {"pending"}
+    assert progress["services"]["fast"]["status"] == "ready"
+    assert progress["services"]["slow"]["status"] == "pending"
+    assert ready
+
+def test_stop_cancels_steps_still_running():
+    async def run():
+        warmup = Warmup()
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        report = warmup.start({"hang": hang}, deadline=10)
+        await asyncio.sleep(0)
+        await warmup.stop()
+        return report
+
+    assert asyncio.run(run()).cancelled()